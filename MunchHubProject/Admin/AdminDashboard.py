@@ -1,7 +1,9 @@
 from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
 from PyQt6.QtCore import *
+from Tools.Theme import apply_theme
 from Admin.AdminController import AdminController
+from Tools.DataLoader import DataLoader
 from datetime import datetime
 import sys
 import os
@@ -416,6 +418,9 @@ class AdminDashboard(QMainWindow):
         self.stats_container.setLayout(self.stats_layout)
         layout.addWidget(self.stats_container)
 
+        # Owned by the container so a late result is dropped after leaving the page
+        self.stats_loader = DataLoader(self.stats_container)
+
         layout.addStretch()
 
         # Load initial data
@@ -443,9 +448,12 @@ class AdminDashboard(QMainWindow):
         month = self.month_combo.currentData() if self.month_combo.isVisible() else None
         day = int(self.day_combo.currentText()) if self.day_combo.isVisible() else None
 
-        # Get filtered stats
-        stats_data = self.controller.get_dashboard_stats(filter_type, year, month, day)
+        # Get filtered stats in the background
+        self.stats_loader.load(self.controller.get_dashboard_stats, self.display_dashboard_stats, None,
+                               filter_type, year, month, day)
 
+    def display_dashboard_stats(self, stats_data):
+        """Rebuild the stat cards from loaded stats"""
         # Clear existing stats
         while self.stats_layout.count():
             child = self.stats_layout.takeAt(0)
@@ -611,26 +619,7 @@ class AdminDashboard(QMainWindow):
     def handle_logout(self):
         """Handle logout and return to login window"""
         # Apply message box styling for visibility
-        QApplication.instance().setStyleSheet("""
-            QMessageBox {
-                background-color: white;
-            }
-            QMessageBox QLabel {
-                color: black;
-                font-size: 11px;
-            }
-            QMessageBox QPushButton {
-                color: black;
-                background-color: #e0e0e0;
-                border: 1px solid #ccc;
-                padding: 5px 15px;
-                border-radius: 4px;
-                min-width: 60px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-        """)
+        apply_theme()
 
         reply = QMessageBox.question(
             self,
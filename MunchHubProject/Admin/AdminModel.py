@@ -1,3 +1,7 @@
+from datetime import datetime
+from Database.SearchIndexes import search_condition
+
+
 class AdminModel:
     """Model for Admin Dashboard - handles database operations"""
 
@@ -8,10 +12,11 @@ class AdminModel:
     def get_total_users(self):
         """Get total number of users"""
         try:
-            cursor = self.db.connection.cursor()
-            cursor.execute("SELECT COUNT(*) FROM Users")
-            result = cursor.fetchone()
-            cursor.close()
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT COUNT(*) FROM Users")
+                result = cursor.fetchone()
+                cursor.close()
             return result[0] if result else 0
         except Exception as e:
             print(f"Error getting total users: {e}")
@@ -20,10 +25,11 @@ class AdminModel:
     def get_total_orders(self):
         """Get total number of orders"""
         try:
-            cursor = self.db.connection.cursor()
-            cursor.execute("SELECT COUNT(*) FROM Orders")
-            result = cursor.fetchone()
-            cursor.close()
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT COUNT(*) FROM Orders")
+                result = cursor.fetchone()
+                cursor.close()
             return result[0] if result else 0
         except Exception as e:
             print(f"Error getting total orders: {e}")
@@ -32,10 +38,11 @@ class AdminModel:
     def get_total_revenue(self):
         """Get total revenue"""
         try:
-            cursor = self.db.connection.cursor()
-            cursor.execute("SELECT SUM(TotalFee) FROM Orders WHERE OrderStatus = 'Delivered'")
-            result = cursor.fetchone()
-            cursor.close()
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT SUM(TotalFee) FROM Orders WHERE OrderStatus = 'Delivered'")
+                result = cursor.fetchone()
+                cursor.close()
             return f"{result[0]:.2f}" if result and result[0] else "0.00"
         except Exception as e:
             print(f"Error getting total revenue: {e}")
@@ -44,10 +51,11 @@ class AdminModel:
     def get_total_menu_items(self):
         """Get total menu items"""
         try:
-            cursor = self.db.connection.cursor()
-            cursor.execute("SELECT COUNT(*) FROM MenuItems")
-            result = cursor.fetchone()
-            cursor.close()
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT COUNT(*) FROM MenuItems")
+                result = cursor.fetchone()
+                cursor.close()
             return result[0] if result else 0
         except Exception as e:
             print(f"Error getting total menu items: {e}")
@@ -55,88 +63,56 @@ class AdminModel:
 
     def get_monthly_sales_data(self):
         """Get sales data grouped by month"""
+        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                  'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
-            # Get current year sales
-            query = """
-                SELECT 
-                    MONTH(CURRENT_DATE) as month,
-                    COALESCE(SUM(TotalFee), 0) as total
-                FROM Orders
-                WHERE OrderStatus = 'Delivered'
-                AND YEAR(CURRENT_DATE) = YEAR(CURRENT_DATE)
-                GROUP BY MONTH(CURRENT_DATE)
-                ORDER BY month
-            """
-            cursor.execute(query)
-            results = cursor.fetchall()
-            cursor.close()
+            # Get current year sales from the daily rollup
+            results = self.db.sales_rollup.get_monthly(datetime.now().year)
 
             # Create data for all 12 months
-            months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
             sales_data = {month: 0 for month in months}
 
             for row in results:
                 month_name = months[row['month'] - 1]
-                sales_data[month_name] = float(row['total'])
+                sales_data[month_name] = float(row['total_fee'])
 
             return sales_data
         except Exception as e:
             print(f"Error getting monthly sales: {e}")
-            return {month: 0 for month in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                                           'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']}
+            return {month: 0 for month in months}
 
     # Activity Logs
     def get_activity_logs(self, limit=100):
-        """Get activity logs"""
+        """Get the newest staff activity log entries"""
+        return self.db.activity_log.recent(limit)
+
+    def filter_activity_logs(self, search_text, start_date=None, end_date=None):
+        """Filter staff activity logs by search text and date range (first page)"""
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
-            # You'll need to create an activity_logs table
-            # For now, we'll simulate with user/staff activities
-            query = """
-                SELECT 
-                    u.Username as user,
-                    'Login' as action,
-                    NOW() as timestamp,
-                    CASE 
-                        WHEN s.StaffID IS NOT NULL THEN 'Staff'
-                        WHEN c.CustomerID IS NOT NULL THEN 'Customer'
-                        ELSE 'User'
-                    END as user_type
-                FROM Users u
-                LEFT JOIN Staffs s ON u.UserID = s.UserID
-                LEFT JOIN Customers c ON u.UserID = c.UserID
-                ORDER BY u.UserID DESC
-                LIMIT %s
-            """
-            cursor.execute(query, (limit,))
-            results = cursor.fetchall()
-            cursor.close()
-            return results
-        except Exception as e:
-            print(f"Error getting activity logs: {e}")
+            return self.get_staff_activity_page(filters={
+                'search': search_text,
+                'start_date': start_date,
+                'end_date': end_date
+            })
+        except Exception:
             return []
 
-    def filter_activity_logs(self, search_text, start_date=None, end_date=None):
-        """Filter activity logs"""
-        # Implement filtering logic
-        return self.get_activity_logs()
+    def get_staff_activity_page(self, after_row=None, limit=100, filters=None):
+        """
+        One page of staff activity logs, newest first.
+        Keyset paging on (ActivityDate, LogID): pass the last row of the previous page.
+
+        Args:
+            filters: Optional dict with 'search' (staff / customer name or order ID
+                prefixes), 'status', 'staff_id', 'start_date' and 'end_date' (end exclusive)
+        """
+        return self.db.activity_log.page(after_row, limit, filters)
 
     # Menu Items
     def get_all_menu_items(self):
-        """Get all menu items"""
+        """Get all menu items (from the shared menu catalog)"""
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
-            cursor.execute("""
-                SELECT m.MenuID, m.ItemName, c.CategoryName, m.Price, m.isAvailable, m.CategoryID
-                FROM menuitems m
-                JOIN categories c ON m.CategoryID = c.CategoryID
-                ORDER BY m.MenuID
-            """)
-            results = cursor.fetchall()
-            cursor.close()
-            return results
+            return list(self.db.menu_catalog.snapshot().items)
         except Exception as e:
             print(f"Error getting menu items: {e}")
             return []
@@ -144,14 +120,15 @@ class AdminModel:
     def get_menu_item(self, menu_id):
         """Get single menu item"""
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
-            cursor.execute("""
-                SELECT MenuID, ItemName, CategoryID, Price, isAvailable
-                FROM menuitems
-                WHERE MenuID = %s
-            """, (menu_id,))
-            result = cursor.fetchone()
-            cursor.close()
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                cursor.execute("""
+                    SELECT MenuID, ItemName, CategoryID, Price, isAvailable
+                    FROM menuitems
+                    WHERE MenuID = %s
+                """, (menu_id,))
+                result = cursor.fetchone()
+                cursor.close()
             return result
         except Exception as e:
             print(f"Error getting menu item: {e}")
@@ -160,19 +137,21 @@ class AdminModel:
     def add_menu_item(self, menu_id, category_id, item_name, price, is_available):
         """Add new menu item"""
         try:
-            cursor = self.db.connection.cursor()
-            cursor.execute("SELECT MenuID FROM menuitems WHERE MenuID = %s", (menu_id,))
-            if cursor.fetchone():
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT MenuID FROM menuitems WHERE MenuID = %s", (menu_id,))
+                if cursor.fetchone():
+                    cursor.close()
+                    return False, f"Menu ID '{menu_id}' already exists"
+
+                query = """
+                    INSERT INTO menuitems (MenuID, CategoryID, ItemName, Price, isAvailable)
+                    VALUES (%s, %s, %s, %s, %s)
+                """
+                cursor.execute(query, (menu_id, category_id, item_name, float(price), is_available))
+                conn.commit()
+                self.db.menu_catalog.invalidate()
                 cursor.close()
-                return False, f"Menu ID '{menu_id}' already exists"
-
-            query = """
-                INSERT INTO menuitems (MenuID, CategoryID, ItemName, Price, isAvailable)
-                VALUES (%s, %s, %s, %s, %s)
-            """
-            cursor.execute(query, (menu_id, category_id, item_name, float(price), is_available))
-            self.db.connection.commit()
-            cursor.close()
             return True, "Menu item added successfully"
         except Exception as e:
             print(f"Error adding menu item: {e}")
@@ -181,15 +160,22 @@ class AdminModel:
     def update_menu_item(self, menu_id, category_id, item_name, price, is_available):
         """Update menu item"""
         try:
-            cursor = self.db.connection.cursor()
-            query = """
-                UPDATE menuitems
-                SET ItemName = %s, CategoryID = %s, Price = %s, isAvailable = %s
-                WHERE MenuID = %s
-            """
-            cursor.execute(query, (item_name, category_id, float(price), is_available, menu_id))
-            self.db.connection.commit()
-            cursor.close()
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT ItemName FROM menuitems WHERE MenuID = %s FOR UPDATE", (menu_id,))
+                old = cursor.fetchone()
+                query = """
+                    UPDATE menuitems
+                    SET ItemName = %s, CategoryID = %s, Price = %s, isAvailable = %s
+                    WHERE MenuID = %s
+                """
+                cursor.execute(query, (item_name, category_id, float(price), is_available, menu_id))
+                # Order summaries keep a copy of the item name
+                if old and old[0] != item_name:
+                    self.db.order_summary.refresh_for_menu_item(cursor, menu_id)
+                conn.commit()
+                self.db.menu_catalog.invalidate()
+                cursor.close()
             return True, "Menu item updated successfully"
         except Exception as e:
             print(f"Error updating menu item: {e}")
@@ -198,10 +184,12 @@ class AdminModel:
     def delete_menu_item(self, menu_id):
         """Delete menu item"""
         try:
-            cursor = self.db.connection.cursor()
-            cursor.execute("DELETE FROM menuitems WHERE MenuID = %s", (menu_id,))
-            self.db.connection.commit()
-            cursor.close()
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("DELETE FROM menuitems WHERE MenuID = %s", (menu_id,))
+                conn.commit()
+                self.db.menu_catalog.invalidate()
+                cursor.close()
             return True, "Menu item deleted successfully"
         except Exception as e:
             print(f"Error deleting menu item: {e}")
@@ -209,17 +197,9 @@ class AdminModel:
 
     # Categories
     def get_all_categories(self):
-        """Get all categories"""
+        """Get all categories (from the shared menu catalog)"""
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
-            cursor.execute("""
-                SELECT CategoryID, CategoryName, Description
-                FROM categories
-                ORDER BY CategoryID
-            """)
-            results = cursor.fetchall()
-            cursor.close()
-            return results
+            return list(self.db.menu_catalog.snapshot().categories)
         except Exception as e:
             print(f"Error getting categories: {e}")
             return []
@@ -227,14 +207,15 @@ class AdminModel:
     def get_category(self, category_id):
         """Get single category"""
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
-            cursor.execute("""
-                SELECT CategoryID, CategoryName, Description
-                FROM categories
-                WHERE CategoryID = %s
-            """, (category_id,))
-            result = cursor.fetchone()
-            cursor.close()
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                cursor.execute("""
+                    SELECT CategoryID, CategoryName, Description
+                    FROM categories
+                    WHERE CategoryID = %s
+                """, (category_id,))
+                result = cursor.fetchone()
+                cursor.close()
             return result
         except Exception as e:
             print(f"Error getting category: {e}")
@@ -243,19 +224,21 @@ class AdminModel:
     def add_category(self, category_id, category_name, description):
         """Add new category"""
         try:
-            cursor = self.db.connection.cursor()
-            cursor.execute("SELECT CategoryID FROM categories WHERE CategoryID = %s", (category_id,))
-            if cursor.fetchone():
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT CategoryID FROM categories WHERE CategoryID = %s", (category_id,))
+                if cursor.fetchone():
+                    cursor.close()
+                    return False, f"Category ID '{category_id}' already exists"
+
+                query = """
+                    INSERT INTO categories (CategoryID, CategoryName, Description)
+                    VALUES (%s, %s, %s)
+                """
+                cursor.execute(query, (category_id, category_name, description))
+                conn.commit()
+                self.db.menu_catalog.invalidate()
                 cursor.close()
-                return False, f"Category ID '{category_id}' already exists"
-
-            query = """
-                INSERT INTO categories (CategoryID, CategoryName, Description)
-                VALUES (%s, %s, %s)
-            """
-            cursor.execute(query, (category_id, category_name, description))
-            self.db.connection.commit()
-            cursor.close()
             return True, "Category added successfully"
         except Exception as e:
             print(f"Error adding category: {e}")
@@ -264,15 +247,17 @@ class AdminModel:
     def update_category(self, category_id, category_name, description):
         """Update category"""
         try:
-            cursor = self.db.connection.cursor()
-            query = """
-                UPDATE categories
-                SET CategoryName = %s, Description = %s
-                WHERE CategoryID = %s
-            """
-            cursor.execute(query, (category_name, description, category_id))
-            self.db.connection.commit()
-            cursor.close()
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor()
+                query = """
+                    UPDATE categories
+                    SET CategoryName = %s, Description = %s
+                    WHERE CategoryID = %s
+                """
+                cursor.execute(query, (category_name, description, category_id))
+                conn.commit()
+                self.db.menu_catalog.invalidate()
+                cursor.close()
             return True, "Category updated successfully"
         except Exception as e:
             print(f"Error updating category: {e}")
@@ -281,10 +266,12 @@ class AdminModel:
     def delete_category(self, category_id):
         """Delete category"""
         try:
-            cursor = self.db.connection.cursor()
-            cursor.execute("DELETE FROM categories WHERE CategoryID = %s", (category_id,))
-            self.db.connection.commit()
-            cursor.close()
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("DELETE FROM categories WHERE CategoryID = %s", (category_id,))
+                conn.commit()
+                self.db.menu_catalog.invalidate()
+                cursor.close()
             return True, "Category deleted successfully"
         except Exception as e:
             print(f"Error deleting category: {e}")
@@ -294,31 +281,135 @@ class AdminModel:
     def get_all_orders(self):
         """Get all orders"""
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
-            query = """
-                SELECT o.OrderID, u.UFirstName, u.ULastName, o.TotalFee, 
-                       o.DeliveryFee, o.OrderStatus, NOW() as OrderDate
-                FROM Orders o
-                JOIN Customers c ON o.CustomerID = c.CustomerID
-                JOIN Users u ON c.UserID = u.UserID
-                ORDER BY o.OrderID DESC
-            """
-            cursor.execute(query)
-            results = cursor.fetchall()
-            cursor.close()
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                query = """
+                    SELECT o.OrderID, u.UFirstName, u.ULastName, o.TotalFee, 
+                           o.DeliveryFee, o.OrderStatus, NOW() as OrderDate
+                    FROM Orders o
+                    JOIN Customers c ON o.CustomerID = c.CustomerID
+                    JOIN Users u ON c.UserID = u.UserID
+                    ORDER BY o.OrderID DESC
+                """
+                cursor.execute(query)
+                results = cursor.fetchall()
+                cursor.close()
             return results
         except Exception as e:
             print(f"Error getting orders: {e}")
             return []
 
+    def get_order_status_counts(self):
+        """Number of orders in each status, most common first"""
+        try:
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                cursor.execute("""
+                    SELECT OrderStatus, COUNT(*) as Count
+                    FROM Orders
+                    GROUP BY OrderStatus
+                    ORDER BY Count DESC
+                """)
+                results = cursor.fetchall()
+                cursor.close()
+            return {row['OrderStatus']: row['Count'] for row in results}
+        except Exception as e:
+            print(f"Error getting order status counts: {e}")
+            return {}
+
+    def get_recent_orders(self, limit=12):
+        """Newest orders with customer names"""
+        try:
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                cursor.execute("""
+                    SELECT o.OrderID, u.UFirstName, u.ULastName, o.TotalFee,
+                           o.DeliveryFee, o.OrderStatus, o.OrderDate
+                    FROM Orders o
+                    JOIN Customers c ON o.CustomerID = c.CustomerID
+                    JOIN Users u ON c.UserID = u.UserID
+                    ORDER BY o.OrderID DESC
+                    LIMIT %s
+                """, (limit,))
+                results = cursor.fetchall()
+                cursor.close()
+            return results
+        except Exception as e:
+            print(f"Error getting recent orders: {e}")
+            return []
+
+    def get_orders_page(self, after_row=None, limit=200, filters=None):
+        """
+        One page of orders, newest OrderID first.
+        Keyset paging: pass the last row of the previous page as `after_row`.
+
+        Args:
+            filters: Optional dict with 'search' (order ID / customer name
+                prefixes), 'status', 'start_date' and 'end_date' (end exclusive)
+        """
+        filters = filters or {}
+        try:
+            self.db.search_indexes.ensure_ready()
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                conditions = []
+                params = []
+                if after_row:
+                    conditions.append("o.OrderID < %s")
+                    params.append(after_row['OrderID'])
+                if filters.get('status'):
+                    conditions.append("o.OrderStatus = %s")
+                    params.append(filters['status'])
+                if filters.get('start_date'):
+                    conditions.append("o.OrderDate >= %s")
+                    params.append(filters['start_date'])
+                if filters.get('end_date'):
+                    conditions.append("o.OrderDate < %s")
+                    params.append(filters['end_date'])
+                search, search_params = search_condition(
+                    filters.get('search'), ['o.OrderID', 'u.UFirstName', 'u.ULastName']
+                )
+                if search:
+                    conditions.append(search)
+                    params.extend(search_params)
+
+                where = "WHERE " + " AND ".join(conditions) if conditions else ""
+                query = f"""
+                    SELECT o.OrderID, u.UFirstName, u.ULastName, o.TotalFee,
+                           o.DeliveryFee, o.OrderStatus, o.OrderDate
+                    FROM Orders o
+                    JOIN Customers c ON o.CustomerID = c.CustomerID
+                    JOIN Users u ON c.UserID = u.UserID
+                    {where}
+                    ORDER BY o.OrderID DESC
+                    LIMIT %s
+                """
+                params.append(limit)
+                cursor.execute(query, params)
+                results = cursor.fetchall()
+                cursor.close()
+            return results
+        except Exception as e:
+            # Raised, not []: the paged table would take an empty page for the last one
+            print(f"Error getting orders page: {e}")
+            raise
+
     def update_order_status(self, order_id, new_status):
         """Update order status"""
         try:
-            cursor = self.db.connection.cursor()
-            cursor.execute("UPDATE Orders SET OrderStatus = %s WHERE OrderID = %s",
-                           (new_status, order_id))
-            self.db.connection.commit()
-            cursor.close()
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor()
+                old_status = self.db.sales_rollup.lock_order(cursor, order_id)
+                cursor.execute("UPDATE Orders SET OrderStatus = %s WHERE OrderID = %s",
+                               (new_status, order_id))
+                # Keep the daily sales rollup, order summary and order change feed in step with the status change
+                self.db.sales_rollup.refresh_for_order(cursor, order_id, old_status)
+                self.db.order_summary.refresh_for_order(cursor, order_id)
+                self.db.order_feed.record(cursor, order_id)
+
+                conn.commit()
+                cursor.close()
+            self.db.notify_orders_changed()
             return True, f"Order status updated to '{new_status}'"
         except Exception as e:
             print(f"Error updating order status: {e}")
@@ -327,17 +418,18 @@ class AdminModel:
     def get_order_details(self, order_id):
         """Get order details"""
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
-            query = """
-                SELECT o.*, u.UFirstName, u.ULastName, u.PhoneNum
-                FROM Orders o
-                JOIN Customers c ON o.CustomerID = c.CustomerID
-                JOIN Users u ON c.UserID = u.UserID
-                WHERE o.OrderID = %s
-            """
-            cursor.execute(query, (order_id,))
-            result = cursor.fetchone()
-            cursor.close()
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                query = """
+                    SELECT o.*, u.UFirstName, u.ULastName, u.PhoneNum
+                    FROM Orders o
+                    JOIN Customers c ON o.CustomerID = c.CustomerID
+                    JOIN Users u ON c.UserID = u.UserID
+                    WHERE o.OrderID = %s
+                """
+                cursor.execute(query, (order_id,))
+                result = cursor.fetchone()
+                cursor.close()
             return result
         except Exception as e:
             print(f"Error getting order details: {e}")
@@ -347,17 +439,18 @@ class AdminModel:
     def get_all_staff(self):
         """Get all staff members"""
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
-            query = """
-                SELECT s.StaffID, u.UFirstName, u.UMiddleName, u.ULastName, 
-                       u.Username, u.PhoneNum
-                FROM Staffs s
-                JOIN Users u ON s.UserID = u.UserID
-                ORDER BY s.StaffID
-            """
-            cursor.execute(query)
-            results = cursor.fetchall()
-            cursor.close()
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                query = """
+                    SELECT s.StaffID, u.UFirstName, u.UMiddleName, u.ULastName, 
+                           u.Username, u.PhoneNum
+                    FROM Staffs s
+                    JOIN Users u ON s.UserID = u.UserID
+                    ORDER BY s.StaffID
+                """
+                cursor.execute(query)
+                results = cursor.fetchall()
+                cursor.close()
             return results
         except Exception as e:
             print(f"Error getting staff: {e}")
@@ -366,10 +459,11 @@ class AdminModel:
     def delete_staff(self, staff_id):
         """Delete staff member"""
         try:
-            cursor = self.db.connection.cursor()
-            cursor.execute("DELETE FROM Staffs WHERE StaffID = %s", (staff_id,))
-            self.db.connection.commit()
-            cursor.close()
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("DELETE FROM Staffs WHERE StaffID = %s", (staff_id,))
+                conn.commit()
+                cursor.close()
             return True, "Staff member removed successfully"
         except Exception as e:
             print(f"Error deleting staff: {e}")
@@ -379,10 +473,11 @@ class AdminModel:
     def get_completed_orders(self):
         """Get completed orders count"""
         try:
-            cursor = self.db.connection.cursor()
-            cursor.execute("SELECT COUNT(*) FROM Orders WHERE OrderStatus = 'Delivered'")
-            result = cursor.fetchone()
-            cursor.close()
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT COUNT(*) FROM Orders WHERE OrderStatus = 'Delivered'")
+                result = cursor.fetchone()
+                cursor.close()
             return result[0] if result else 0
         except Exception as e:
             print(f"Error getting completed orders: {e}")
@@ -391,10 +486,11 @@ class AdminModel:
     def get_avg_order_value(self):
         """Get average order value"""
         try:
-            cursor = self.db.connection.cursor()
-            cursor.execute("SELECT AVG(TotalFee) FROM Orders WHERE OrderStatus = 'Delivered'")
-            result = cursor.fetchone()
-            cursor.close()
+            with self.db.borrow_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT AVG(TotalFee) FROM Orders WHERE OrderStatus = 'Delivered'")
+                result = cursor.fetchone()
+                cursor.close()
             return f"{result[0]:.2f}" if result and result[0] else "0.00"
         except Exception as e:
             print(f"Error getting avg order value: {e}")
@@ -1,7 +1,9 @@
 from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
 from PyQt6.QtCore import *
-from Admin.AdminComponents import StyledTable, ActionButton, get_input_style
+from Tools.Theme import apply_theme
+from Admin.AdminComponents import StyledTableView, ActionButton, get_input_style
+from Tools.LazyTable import LazyTableModel, Column, CENTER
 
 
 class MenuManagementView(QWidget):
@@ -118,18 +120,25 @@ class MenuManagementView(QWidget):
 
     def create_menu_table(self):
         """Create menu items table"""
-        table = StyledTable()
-        table.setColumnCount(5)
-        table.setHorizontalHeaderLabels(["Menu ID", "Item Name", "Category", "Price", "Available"])
+        columns = [
+            Column("Menu ID", 'MenuID', size=11, color='#000000'),
+            Column("Item Name", 'ItemName', size=11, color='#000000'),
+            Column("Category", 'CategoryName', align=CENTER, size=11, color='#000000'),
+            Column("Price", text=lambda item: f"₱{float(item['Price'] or 0):.2f}", align=CENTER,
+                   size=11, color='#000000'),
+            Column("Available", text=lambda item: "Yes" if item['isAvailable'] else "No", align=CENTER,
+                   bold=True, size=11, color=lambda item: '#4CAF50' if item['isAvailable'] else '#f44336')
+        ]
+        self.menu_model = LazyTableModel(columns, key_field='MenuID', parent=self)
+        self.menu_model.load_failed.connect(
+            lambda message: self.show_message("Error", f"Error loading menu items: {message}", "critical")
+        )
+        self.menu_model.modelReset.connect(lambda: self.filter_menu_items(self.menu_search_input.text()))
 
-        # Enable single selection
-        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        table = StyledTableView(self.menu_model, empty_text="No menu items found")
 
         # Set equal column widths
-        header = table.horizontalHeader()
-        for i in range(5):
-            header.setSectionResizeMode(i, QHeaderView.ResizeMode.Stretch)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
 
         # Enable word wrap for better visibility
         table.setWordWrap(True)
@@ -138,66 +147,15 @@ class MenuManagementView(QWidget):
         return table
 
     def load_menu_items(self):
-        """Load menu items from database"""
-        try:
-            items = self.controller.get_all_menu_items()
-            self.menu_table.setRowCount(0)  # Clear table
-
-            for item in items:
-                row = self.menu_table.rowCount()
-                self.menu_table.insertRow(row)
-
-                # Menu ID
-                id_item = QTableWidgetItem(item['MenuID'])
-                id_item.setFont(QFont('Arial', 11))
-                id_item.setForeground(QColor('#000000'))
-                self.menu_table.setItem(row, 0, id_item)
-
-                # Item Name
-                name_item = QTableWidgetItem(item['ItemName'])
-                name_item.setFont(QFont('Arial', 11))
-                name_item.setForeground(QColor('#000000'))
-                self.menu_table.setItem(row, 1, name_item)
-
-                # Category
-                category_item = QTableWidgetItem(item['CategoryName'])
-                category_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                category_item.setFont(QFont('Arial', 11))
-                category_item.setForeground(QColor('#000000'))
-                self.menu_table.setItem(row, 2, category_item)
-
-                # Price
-                price = float(item['Price']) if item['Price'] is not None else 0.0
-                price_item = QTableWidgetItem(f"₱{price:.2f}")
-                price_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                price_item.setFont(QFont('Arial', 11))
-                price_item.setForeground(QColor('#000000'))
-                self.menu_table.setItem(row, 3, price_item)
-
-                # Available
-                available_item = QTableWidgetItem("Yes" if item['isAvailable'] else "No")
-                available_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                if item['isAvailable']:
-                    available_item.setForeground(QColor('#4CAF50'))
-                else:
-                    available_item.setForeground(QColor('#f44336'))
-                available_item.setFont(QFont('Arial', 11, QFont.Weight.Bold))
-                self.menu_table.setItem(row, 4, available_item)
-
-        except Exception as e:
-            self.show_message("Error", f"Error loading menu items: {e}", "critical")
-            import traceback
-            traceback.print_exc()
+        """Load menu items from database in the background"""
+        self.menu_model.load_all(self.controller.get_all_menu_items)
 
     def filter_menu_items(self, search_text):
         """Filter menu items by search text"""
-        for row in range(self.menu_table.rowCount()):
-            match = False
-            for col in range(3):  # Search in ID, Name, Category
-                item = self.menu_table.item(row, col)
-                if item and search_text.lower() in item.text().lower():
-                    match = True
-                    break
+        search_text = search_text.lower()
+        for row, item in enumerate(self.menu_model.rows()):
+            match = any(search_text in str(item.get(field) or '').lower()
+                        for field in ('MenuID', 'ItemName', 'CategoryName'))
             self.menu_table.setRowHidden(row, not match)
 
     def add_menu_item(self):
@@ -208,25 +166,25 @@ class MenuManagementView(QWidget):
 
     def edit_menu_item(self):
         """Edit selected menu item"""
-        selected_row = self.menu_table.currentRow()
-        if selected_row < 0:
+        item = self.menu_table.selected_row()
+        if not item:
             self.show_message("No Selection", "Please select a menu item to edit.", "warning")
             return
 
-        menu_id = self.menu_table.item(selected_row, 0).text()
+        menu_id = item['MenuID']
         dialog = MenuItemDialog(self.controller, menu_id=menu_id, parent=self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.load_menu_items()
 
     def delete_menu_item(self):
         """Delete selected menu item"""
-        selected_row = self.menu_table.currentRow()
-        if selected_row < 0:
+        item = self.menu_table.selected_row()
+        if not item:
             self.show_message("No Selection", "Please select a menu item to delete.", "warning")
             return
 
-        menu_id = self.menu_table.item(selected_row, 0).text()
-        item_name = self.menu_table.item(selected_row, 1).text()
+        menu_id = item['MenuID']
+        item_name = item['ItemName']
 
         # Apply message box styling
         self.apply_message_box_style()
@@ -288,18 +246,20 @@ class MenuManagementView(QWidget):
 
     def create_category_table(self):
         """Create categories table"""
-        table = StyledTable()
-        table.setColumnCount(3)
-        table.setHorizontalHeaderLabels(["Category ID", "Category Name", "Description"])
+        columns = [
+            Column("Category ID", 'CategoryID', size=11, color='#000000'),
+            Column("Category Name", 'CategoryName', size=11, color='#000000'),
+            Column("Description", 'Description', size=11, color='#000000')
+        ]
+        self.category_model = LazyTableModel(columns, key_field='CategoryID', parent=self)
+        self.category_model.load_failed.connect(
+            lambda message: self.show_message("Error", f"Error loading categories: {message}", "critical")
+        )
 
-        # Enable single selection
-        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        table = StyledTableView(self.category_model, empty_text="No categories found")
 
         # Set equal column widths
-        header = table.horizontalHeader()
-        for i in range(3):
-            header.setSectionResizeMode(i, QHeaderView.ResizeMode.Stretch)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
 
         # Enable word wrap for better visibility
         table.setWordWrap(True)
@@ -308,37 +268,8 @@ class MenuManagementView(QWidget):
         return table
 
     def load_categories(self):
-        """Load categories from database"""
-        try:
-            categories = self.controller.get_all_categories()
-            self.category_table.setRowCount(0)  # Clear table
-
-            for category in categories:
-                row = self.category_table.rowCount()
-                self.category_table.insertRow(row)
-
-                # Category ID
-                id_item = QTableWidgetItem(category['CategoryID'])
-                id_item.setFont(QFont('Arial', 11))
-                id_item.setForeground(QColor('#000000'))
-                self.category_table.setItem(row, 0, id_item)
-
-                # Category Name
-                name_item = QTableWidgetItem(category['CategoryName'])
-                name_item.setFont(QFont('Arial', 11))
-                name_item.setForeground(QColor('#000000'))
-                self.category_table.setItem(row, 1, name_item)
-
-                # Description
-                desc_item = QTableWidgetItem(category['Description'] or "")
-                desc_item.setFont(QFont('Arial', 11))
-                desc_item.setForeground(QColor('#000000'))
-                self.category_table.setItem(row, 2, desc_item)
-
-        except Exception as e:
-            self.show_message("Error", f"Error loading categories: {e}", "critical")
-            import traceback
-            traceback.print_exc()
+        """Load categories from database in the background"""
+        self.category_model.load_all(self.controller.get_all_categories)
 
     def add_category(self):
         """Show dialog to add new category"""
@@ -348,25 +279,25 @@ class MenuManagementView(QWidget):
 
     def edit_category(self):
         """Edit selected category"""
-        selected_row = self.category_table.currentRow()
-        if selected_row < 0:
+        category = self.category_table.selected_row()
+        if not category:
             self.show_message("No Selection", "Please select a category to edit.", "warning")
             return
 
-        category_id = self.category_table.item(selected_row, 0).text()
+        category_id = category['CategoryID']
         dialog = CategoryDialog(self.controller, category_id=category_id, parent=self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.load_categories()
 
     def delete_category(self):
         """Delete selected category"""
-        selected_row = self.category_table.currentRow()
-        if selected_row < 0:
+        category = self.category_table.selected_row()
+        if not category:
             self.show_message("No Selection", "Please select a category to delete.", "warning")
             return
 
-        category_id = self.category_table.item(selected_row, 0).text()
-        category_name = self.category_table.item(selected_row, 1).text()
+        category_id = category['CategoryID']
+        category_name = category['CategoryName']
 
         # Apply message box styling
         self.apply_message_box_style()
@@ -389,26 +320,7 @@ class MenuManagementView(QWidget):
 
     def apply_message_box_style(self):
         """Apply black text styling to message boxes"""
-        QApplication.instance().setStyleSheet("""
-            QMessageBox {
-                background-color: white;
-            }
-            QMessageBox QLabel {
-                color: black;
-                font-size: 11px;
-            }
-            QMessageBox QPushButton {
-                color: black;
-                background-color: #e0e0e0;
-                border: 1px solid #ccc;
-                padding: 5px 15px;
-                border-radius: 4px;
-                min-width: 60px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-        """)
+        apply_theme()
 
     def show_message(self, title, message, msg_type):
         """Show message box with proper styling"""
@@ -687,26 +599,7 @@ class MenuItemDialog(QDialog):
 
     def apply_message_box_style(self):
         """Apply black text styling to message boxes"""
-        QApplication.instance().setStyleSheet("""
-            QMessageBox {
-                background-color: white;
-            }
-            QMessageBox QLabel {
-                color: black;
-                font-size: 11px;
-            }
-            QMessageBox QPushButton {
-                color: black;
-                background-color: #e0e0e0;
-                border: 1px solid #ccc;
-                padding: 5px 15px;
-                border-radius: 4px;
-                min-width: 60px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-        """)
+        apply_theme()
 
 
 class CategoryDialog(QDialog):
@@ -890,23 +783,4 @@ class CategoryDialog(QDialog):
 
     def apply_message_box_style(self):
         """Apply black text styling to message boxes"""
-        QApplication.instance().setStyleSheet("""
-            QMessageBox {
-                background-color: white;
-            }
-            QMessageBox QLabel {
-                color: black;
-                font-size: 11px;
-            }
-            QMessageBox QPushButton {
-                color: black;
-                background-color: #e0e0e0;
-                border: 1px solid #ccc;
-                padding: 5px 15px;
-                border-radius: 4px;
-                min-width: 60px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-        """)
\ No newline at end of file
+        apply_theme()
\ No newline at end of file
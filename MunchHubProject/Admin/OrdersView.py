@@ -1,7 +1,9 @@
 from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
 from PyQt6.QtCore import *
-from Admin.AdminComponents import StyledTable, ActionButton
+from functools import partial
+from Admin.AdminComponents import StyledTableView, ActionButton
+from Tools.LazyTable import LazyTableModel, Column, ButtonDelegate, Button, CENTER
 
 
 class OrdersView(QWidget):
@@ -10,6 +12,13 @@ class OrdersView(QWidget):
     def __init__(self, controller, parent=None):
         super().__init__(parent)
         self.controller = controller
+
+        # Reload once typing pauses instead of querying on every keystroke
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(300)
+        self.filter_timer.timeout.connect(self.load_orders)
+
         self.initUI()
 
     def initUI(self):
@@ -55,6 +64,7 @@ class OrdersView(QWidget):
 
         # Search input
         search_input = QLineEdit()
+        self.search_input = search_input
         search_input.setPlaceholderText("Search by Order ID or Customer...")
         search_input.setMinimumHeight(40)
         search_input.setStyleSheet("""
@@ -85,10 +95,23 @@ class OrdersView(QWidget):
                 font-size: 13px;
             }
         """)
-        status_combo.currentTextChanged.connect(lambda: self.filter_orders(search_input.text()))
+        status_combo.currentIndexChanged.connect(self.load_orders)
         filter_layout.addWidget(status_combo)
         self.status_filter = status_combo
 
+        # Date filter
+        period_combo = QComboBox()
+        period_combo.setMinimumHeight(40)
+        period_combo.addItem("All Time", "all")
+        period_combo.addItem("Today", "today")
+        period_combo.addItem("Last 7 Days", "7days")
+        period_combo.addItem("Last 30 Days", "30days")
+        period_combo.addItem("This Year", "year")
+        period_combo.setStyleSheet(status_combo.styleSheet())
+        period_combo.currentIndexChanged.connect(self.load_orders)
+        filter_layout.addWidget(period_combo)
+        self.period_filter = period_combo
+
         layout.addLayout(filter_layout)
 
         # Orders table
@@ -98,158 +121,82 @@ class OrdersView(QWidget):
         # Load initial data
         self.load_orders()
 
+    STATUS_COLORS = {
+        'Pending': '#FF9800',
+        'Preparing': '#2196F3',
+        'Out for Delivery': '#9C27B0',
+        'Delivered': '#4CAF50',
+        'Cancelled': '#f44336'
+    }
+
     def create_orders_table(self):
         """Create orders table"""
-        table = StyledTable()
-        table.setColumnCount(7)
-        table.setHorizontalHeaderLabels([
-            "Order ID", "Customer", "Total", "Delivery Fee", "Status", "Date", "Actions"
-        ])
+        columns = [
+            Column("Order ID", 'OrderID'),
+            Column("Customer", text=lambda o: f"{o['UFirstName']} {o['ULastName']}"),
+            Column("Total", text=lambda o: f"₱{o['TotalFee']:.2f}", align=CENTER),
+            Column("Delivery Fee", text=lambda o: f"₱{o['DeliveryFee']:.2f}", align=CENTER),
+            Column("Status", 'OrderStatus', align=CENTER, bold=True, size=11,
+                   color=lambda o: self.STATUS_COLORS.get(o['OrderStatus'], '#757575')),
+            Column("Date", 'OrderDate', align=CENTER),
+            Column("Actions")
+        ]
+        self.orders_model = LazyTableModel(columns, key_field='OrderID', parent=self)
+        self.orders_model.load_failed.connect(
+            lambda message: QMessageBox.critical(self, "Error", f"Error loading orders: {message}")
+        )
+
+        table = StyledTableView(self.orders_model, empty_text="No orders found")
+
+        # View / update status buttons are painted by a delegate, not a widget per row
+        actions = ButtonDelegate([
+            Button('view', "View", '#2196F3', width=60),
+            Button('status', "Status", '#FF9800', width=60)
+        ], table)
+        actions.clicked.connect(self.on_action_clicked)
+        table.setItemDelegateForColumn(6, actions)
 
         header = table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(6, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        table.verticalHeader().setDefaultSectionSize(45)
 
         return table
 
     def load_orders(self):
-        """Load orders from database"""
-        try:
-            orders = self.controller.get_all_orders()
-            self.orders_table.setRowCount(len(orders))
-
-            for row, order in enumerate(orders):
-                # Order ID
-                id_item = QTableWidgetItem(order['OrderID'])
-                self.orders_table.setItem(row, 0, id_item)
-
-                # Customer
-                customer_name = f"{order['UFirstName']} {order['ULastName']}"
-                customer_item = QTableWidgetItem(customer_name)
-                self.orders_table.setItem(row, 1, customer_item)
-
-                # Total
-                total_item = QTableWidgetItem(f"₱{order['TotalFee']:.2f}")
-                total_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.orders_table.setItem(row, 2, total_item)
-
-                # Delivery Fee
-                delivery_item = QTableWidgetItem(f"₱{order['DeliveryFee']:.2f}")
-                delivery_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.orders_table.setItem(row, 3, delivery_item)
-
-                # Status
-                status_item = QTableWidgetItem(order['OrderStatus'])
-                status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-                # Color code by status
-                status_colors = {
-                    'Pending': '#FF9800',
-                    'Preparing': '#2196F3',
-                    'Out for Delivery': '#9C27B0',
-                    'Delivered': '#4CAF50',
-                    'Cancelled': '#f44336'
-                }
-                color = status_colors.get(order['OrderStatus'], '#757575')
-                status_item.setForeground(QColor(color))
-                status_item.setFont(QFont('Arial', 11, QFont.Weight.Bold))
-                self.orders_table.setItem(row, 4, status_item)
-
-                # Date
-                date_item = QTableWidgetItem(str(order['OrderDate']))
-                date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.orders_table.setItem(row, 5, date_item)
-
-                # Actions - Create widget with buttons
-                actions_widget = QWidget()
-                actions_layout = QHBoxLayout()
-                actions_layout.setContentsMargins(5, 5, 5, 5)
-                actions_layout.setSpacing(5)
-                actions_widget.setLayout(actions_layout)
-
-                view_btn = QPushButton("👁️")
-                view_btn.setToolTip("View Details")
-                view_btn.setMaximumWidth(35)
-                view_btn.setMinimumHeight(30)
-                view_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-                view_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #2196F3;
-                        color: white;
-                        border: none;
-                        border-radius: 4px;
-                        font-size: 12px;
-                    }
-                    QPushButton:hover {
-                        background-color: #1976D2;
-                    }
-                """)
-                view_btn.clicked.connect(lambda checked, oid=order['OrderID']: self.view_order(oid))
-                actions_layout.addWidget(view_btn)
-
-                status_btn = QPushButton("📝")
-                status_btn.setToolTip("Update Status")
-                status_btn.setMaximumWidth(35)
-                status_btn.setMinimumHeight(30)
-                status_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-                status_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #FF9800;
-                        color: white;
-                        border: none;
-                        border-radius: 4px;
-                        font-size: 12px;
-                    }
-                    QPushButton:hover {
-                        background-color: #F57C00;
-                    }
-                """)
-                status_btn.clicked.connect(lambda checked, oid=order['OrderID'], r=row: self.update_status(oid, r))
-                actions_layout.addWidget(status_btn)
-
-                self.orders_table.setCellWidget(row, 6, actions_widget)
-
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error loading orders: {e}")
+        """Load orders matching the current filters from database a page at a time"""
+        self.filter_timer.stop()
+        self.orders_model.load(partial(self.controller.get_orders_page, filters=self.current_filters()))
+
+    def current_filters(self):
+        """Filter values for the orders query"""
+        filters = {
+            'search': self.search_input.text().strip(),
+            'status': self.status_filter.currentData()
+        }
+        date_range = self.controller.get_period_range(self.period_filter.currentData())
+        if date_range:
+            filters['start_date'], filters['end_date'] = date_range
+        return filters
+
+    def on_action_clicked(self, name, order):
+        """Handle a click on one of the row buttons"""
+        if name == 'view':
+            self.view_order(order['OrderID'])
+        else:
+            self.update_status(order['OrderID'], order)
 
     def filter_orders(self, search_text):
-        """Filter orders by search text and status"""
-        status_filter = self.status_filter.currentData()
-
-        for row in range(self.orders_table.rowCount()):
-            match_search = False
-            match_status = True
-
-            # Check search text
-            for col in range(2):  # Search in Order ID and Customer
-                item = self.orders_table.item(row, col)
-                if item and search_text.lower() in item.text().lower():
-                    match_search = True
-                    break
-
-            # Check status filter
-            if status_filter:
-                status_item = self.orders_table.item(row, 4)
-                if status_item:
-                    match_status = (status_item.text() == status_filter)
-
-            # Show row only if both conditions match (or search is empty)
-            show_row = (match_search or not search_text) and match_status
-            self.orders_table.setRowHidden(row, not show_row)
+        """Search is run by the database once typing pauses"""
+        self.filter_timer.start()
 
     def view_order(self, order_id):
         """View order details"""
         dialog = OrderDetailsDialog(self.controller, order_id, parent=self)
         dialog.exec()
 
-    def update_status(self, order_id, row):
+    def update_status(self, order_id, order):
         """Update order status"""
-        current_status = self.orders_table.item(row, 4).text()
+        current_status = order['OrderStatus']
 
         dialog = StatusUpdateDialog(current_status, parent=self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
@@ -0,0 +1,76 @@
+"""
+ReportsChart.py - Qt Charts bar chart for the Reports page
+Place this file in: Admin/ReportsChart.py
+
+Kept out of AdminComponents so the table views that share those components
+do not load PyQt6.QtCharts; only the Reports page needs it.
+"""
+
+from PyQt6.QtWidgets import *
+from PyQt6.QtGui import *
+from PyQt6.QtCore import *
+from PyQt6.QtCharts import *
+
+
+class SalesChart(QChartView):
+    """Sales bar chart widget"""
+
+    def __init__(self, sales_data):
+        super().__init__()
+
+        # Create bar set
+        bar_set = QBarSet("Monthly Sales (₱)")
+
+        # Add data points
+        months = list(sales_data.keys())
+        for month in months:
+            bar_set.append(sales_data[month])
+
+        # Style the bars
+        bar_set.setColor(QColor("#2196F3"))  # Blue color for bars
+        bar_set.setBorderColor(QColor("#1976D2"))  # Darker blue border
+
+        # Create bar series
+        series = QBarSeries()
+        series.append(bar_set)
+
+        # Create chart
+        chart = QChart()
+        chart.addSeries(series)
+        chart.setTitle("Sales Overview")
+        chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
+
+        # Create X axis (categories - months)
+        axis_x = QBarCategoryAxis()
+        axis_x.append(months)
+        axis_x.setTitleText("Months")
+        chart.addAxis(axis_x, Qt.AlignmentFlag.AlignBottom)
+        series.attachAxis(axis_x)
+
+        # Create Y axis (values)
+        axis_y = QValueAxis()
+        max_value = max(sales_data.values()) if sales_data.values() else 1000
+        axis_y.setRange(0, max_value * 1.2)
+        axis_y.setTitleText("Sales Amount (₱)")
+        axis_y.setLabelFormat("%.0f")
+        chart.addAxis(axis_y, Qt.AlignmentFlag.AlignLeft)
+        series.attachAxis(axis_y)
+
+        # Chart styling
+        chart.setBackgroundBrush(QBrush(QColor("#ffffff")))
+        chart.legend().setVisible(True)
+        chart.legend().setAlignment(Qt.AlignmentFlag.AlignBottom)
+
+        # Set chart to view
+        self.setChart(chart)
+        self.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.setMinimumHeight(400)
+
+        # Style the view
+        self.setStyleSheet("""
+            QChartView {
+                background-color: white;
+                border-radius: 12px;
+                border: 1px solid #e6e6e6;
+            }
+        """)
@@ -1,18 +1,31 @@
 from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
 from PyQt6.QtCore import *
-from Admin.AdminComponents import SalesChart
-from Tools.Utility import ReportGenerator
+from Tools.Theme import apply_theme
+from Admin.ReportsChart import SalesChart
+from Tools.DataLoader import DataLoader, CancelToken
+from Tools.ReportExporter import ReportExporter, DATASETS, available_formats
 from datetime import datetime
 
 
+class ExportProgress(QObject):
+    """Carries export progress from the worker thread to the GUI thread"""
+    progress = pyqtSignal(int, int)
+
+
 class ReportsView(QWidget):
     """Reports View - Display sales chart and export functionality"""
 
     def __init__(self, controller, parent=None):
         super().__init__(parent)
         self.controller = controller
-        self.report_generator = ReportGenerator(controller)
+        self.report_generator = None  # created on the first PDF export
+        self.exporter = ReportExporter(controller.db)
+        self.loader = DataLoader(self)
+        self.export_progress = ExportProgress(self)
+        self.export_progress.progress.connect(self.update_export_progress)
+        self.export_dialog = None
+        self.export_token = None
         self.initUI()
 
     def initUI(self):
@@ -106,6 +119,60 @@ class ReportsView(QWidget):
         date_range_layout.addWidget(self.period_combo)
 
         date_range_layout.addStretch()
+
+        # Full data export (every order / line item in the period)
+        data_label = QLabel("Export Data:")
+        data_label.setFont(QFont('Arial', 12, QFont.Weight.Bold))
+        data_label.setStyleSheet("color: #000000;")
+        date_range_layout.addWidget(data_label)
+
+        combo_style = """
+            QComboBox {
+                padding: 10px;
+                color: black;
+                border: 2px solid #e0e0e0;
+                border-radius: 8px;
+                font-size: 13px;
+                min-width: 130px;
+                background-color: white;
+            }
+        """
+        self.dataset_combo = QComboBox()
+        self.dataset_combo.setMinimumHeight(40)
+        self.dataset_combo.setStyleSheet(combo_style)
+        for dataset, spec in DATASETS.items():
+            self.dataset_combo.addItem(spec['title'], dataset)
+        date_range_layout.addWidget(self.dataset_combo)
+
+        self.format_combo = QComboBox()
+        self.format_combo.setMinimumHeight(40)
+        self.format_combo.setStyleSheet(combo_style)
+        for file_format, label, extension in available_formats():
+            self.format_combo.addItem(label, (file_format, extension))
+        date_range_layout.addWidget(self.format_combo)
+
+        self.export_data_btn = QPushButton("Export Data")
+        self.export_data_btn.setFont(QFont('Arial', 12, QFont.Weight.Bold))
+        self.export_data_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.export_data_btn.setMinimumHeight(40)
+        self.export_data_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #003274;
+                color: white;
+                border: none;
+                border-radius: 8px;
+                padding: 10px 20px;
+            }
+            QPushButton:hover {
+                background-color: #002050;
+            }
+            QPushButton:disabled {
+                background-color: #9e9e9e;
+            }
+        """)
+        self.export_data_btn.clicked.connect(self.export_data)
+        date_range_layout.addWidget(self.export_data_btn)
+
         layout.addLayout(date_range_layout)
 
         # Sales chart section with centered header
@@ -164,13 +231,17 @@ class ReportsView(QWidget):
         self.load_reports()
 
     def load_reports(self):
-        """Load and display sales chart"""
+        """Load sales data in the background and display the chart"""
+        self.loader.load(self.controller.get_monthly_sales, self.display_sales_chart,
+                         lambda message: self.show_message("Error", f"Error loading reports: {message}", "critical"))
+
+    def display_sales_chart(self, sales_data):
+        """Display the sales chart for loaded data"""
         try:
             # Clear existing chart
             self.clear_container(self.chart_layout)
 
             # Create sales chart (pass show_title=False if SalesChart supports it)
-            sales_data = self.controller.get_monthly_sales()
             sales_chart = SalesChart(sales_data)
             sales_chart.setMinimumHeight(360)
             sales_chart.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -207,11 +278,14 @@ class ReportsView(QWidget):
                 # Get report period
                 period = self.period_combo.currentText()
 
-                # Get sales data for the chart
-                sales_data = self.controller.get_monthly_sales()
+                # ReportLab is only loaded once a PDF is actually exported
+                if self.report_generator is None:
+                    from Tools.Utility import ReportGenerator
+                    self.report_generator = ReportGenerator(self.controller)
 
-                # Generate PDF using ReportGenerator with chart data
-                success = self.report_generator.generate_pdf(file_path, period, sales_data)
+                # Generate PDF using ReportGenerator; it reads every metric (chart
+                # data included) once into a snapshot before building the sections
+                success = self.report_generator.generate_pdf(file_path, period)
 
                 if success:
                     self.show_message(
@@ -235,28 +309,79 @@ class ReportsView(QWidget):
                 import traceback
                 traceback.print_exc()
 
+    def export_data(self):
+        """Stream every order or line item in the period to CSV / XLSX / Parquet / Arrow"""
+        dataset = self.dataset_combo.currentData()
+        file_format, extension = self.format_combo.currentData()
+        label = self.format_combo.currentText()
+        title = self.dataset_combo.currentText()
+
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            f"Export {title} as {label}",
+            f"MunchHub_{title.replace(' ', '')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{extension}",
+            f"{label} Files (*{extension});;All Files (*)"
+        )
+        if not file_path:
+            return
+        if not file_path.lower().endswith(extension):
+            file_path += extension
+
+        period = self.period_combo.currentText()
+        self.export_token = CancelToken()
+        token = self.export_token
+
+        self.export_dialog = QProgressDialog(f"Exporting {title.lower()}...", "Cancel", 0, 0, self)
+        self.export_dialog.setWindowTitle("Export Data")
+        self.export_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        self.export_dialog.setAutoClose(False)
+        self.export_dialog.setAutoReset(False)
+        self.export_dialog.setMinimumDuration(0)
+        self.export_dialog.canceled.connect(token.cancel)
+        self.export_dialog.show()
+        self.export_data_btn.setEnabled(False)
+
+        # The export runs on a pooled connection off the GUI thread; progress
+        # arrives through a queued signal and Cancel stops it after the current chunk
+        self.loader.load(self.exporter.export, self.on_export_finished, self.on_export_error,
+                         dataset, file_format, file_path, period,
+                         progress=self.export_progress.progress.emit,
+                         cancelled=lambda: token.cancelled,
+                         key='export')
+
+    def update_export_progress(self, done, total):
+        """Show rows written so far in the progress dialog"""
+        if self.export_dialog is None or self.export_token.cancelled:
+            return
+        self.export_dialog.setMaximum(max(total, 1))
+        self.export_dialog.setValue(done)
+        self.export_dialog.setLabelText(f"Exported {done:,} of {total:,} rows...")
+
+    def close_export_dialog(self):
+        if self.export_dialog is not None:
+            self.export_dialog.close()
+            self.export_dialog = None
+        self.export_data_btn.setEnabled(True)
+
+    def on_export_finished(self, result):
+        """Report how the export ended"""
+        cancelled = self.export_token.cancelled
+        self.close_export_dialog()
+        success, _, message = result
+        if success:
+            self.show_message("Export Successful", message, "information")
+        elif cancelled:
+            self.show_message("Export Cancelled", "The export was cancelled; no file was written.", "information")
+        else:
+            self.show_message("Export Failed", message, "critical")
+
+    def on_export_error(self, message):
+        self.close_export_dialog()
+        self.show_message("Export Failed", f"Failed to export data:\n{message}", "critical")
+
     def apply_message_box_style(self):
         """Apply black text styling to message boxes"""
-        QApplication.instance().setStyleSheet("""
-            QMessageBox {
-                background-color: white;
-            }
-            QMessageBox QLabel {
-                color: black;
-                font-size: 11px;
-            }
-            QMessageBox QPushButton {
-                color: black;
-                background-color: #e0e0e0;
-                border: 1px solid #ccc;
-                padding: 5px 15px;
-                border-radius: 4px;
-                min-width: 60px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-        """)
+        apply_theme()
 
     def show_message(self, title, message, msg_type):
         """Show message box with proper styling"""
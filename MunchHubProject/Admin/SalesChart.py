@@ -0,0 +1,171 @@
+"""
+SalesChart.py - Persistent bar chart behind the Sales Analytics page
+Place this file in: Admin/SalesChart.py
+
+The chart builds its Axes and one set of bar and value-label artists per
+view (day / month / year) once. Showing a view only updates heights, label
+text and visibility, and never clears the figure.
+
+Every rendered frame is kept per (view, year, month) together with the
+values it shows. Showing the same view with the same values again restores
+that frame with a blit instead of redrawing. Frames are dropped when the
+canvas is resized, and a frame is redrawn whenever its values change.
+"""
+
+import calendar
+from datetime import datetime
+
+from matplotlib.ticker import AutoLocator, ScalarFormatter
+
+
+BAR_COLOR = '#003274'
+EDGE_COLOR = '#002050'
+TEXT_COLOR = '#003274'
+
+MONTH_NAMES = [datetime(2000, month, 1).strftime('%b') for month in range(1, 13)]
+
+
+class BarSet:
+    """Bars and value labels of one view; grows when more slots are needed"""
+
+    def __init__(self, ax):
+        self.ax = ax
+        self.bars = []
+        self.labels = []
+
+    def ensure(self, count):
+        """Make sure at least `count` bars exist (new ones start hidden)"""
+        while len(self.bars) < count:
+            bar = self.ax.bar([len(self.bars)], [0], color=BAR_COLOR, alpha=0.8,
+                              edgecolor=EDGE_COLOR, linewidth=1.5)[0]
+            label = self.ax.text(0, 0, '', ha='center', va='bottom', color=TEXT_COLOR)
+            bar.set_visible(False)
+            label.set_visible(False)
+            self.bars.append(bar)
+            self.labels.append(label)
+
+    def update(self, positions, values, label_size, label_bold):
+        """Place one bar per position; bars beyond `positions` are hidden"""
+        self.ensure(len(positions))
+        weight = 'bold' if label_bold else 'normal'
+        for i, (bar, label) in enumerate(zip(self.bars, self.labels)):
+            if i >= len(positions):
+                bar.set_visible(False)
+                label.set_visible(False)
+                continue
+            value = values[i]
+            bar.set_x(positions[i] - bar.get_width() / 2)
+            bar.set_height(value)
+            # Empty slots (days / months without sales) draw nothing, not a flat edge
+            bar.set_visible(bool(value))
+            label.set_position((positions[i], value))
+            label.set_text(f'₱{value:,.0f}' if value else '')
+            label.set_fontsize(label_size)
+            label.set_fontweight(weight)
+            label.set_visible(bool(value))
+
+    def hide(self):
+        for artist in self.bars + self.labels:
+            artist.set_visible(False)
+
+
+class SalesChart:
+    """Day / month / year sales bars on one reusable Axes"""
+
+    def __init__(self, figure, canvas):
+        self.figure = figure
+        self.canvas = canvas
+        self.ax = figure.add_subplot(111)
+        self.ax.set_facecolor('#f8f9fa')
+        self.ax.grid(axis='y', alpha=0.3, linestyle='--')
+        self.ax.set_axisbelow(True)
+        self.ax.set_ylabel('Sales (₱)', fontsize=12, fontweight='bold', color=TEXT_COLOR)
+        self.empty_text = self.ax.text(0.5, 0.5, '', ha='center', va='center', fontsize=14,
+                                       color='#666', transform=self.ax.transAxes, visible=False)
+        self.bar_sets = {view: BarSet(self.ax) for view in ('day', 'month', 'year')}
+        self.frames = {}  # (view, year, month) -> (values shown, saved canvas region)
+        self.canvas.mpl_connect('resize_event', lambda event: self.frames.clear())
+
+    def show(self, view, data, year=None, month=None):
+        """
+        Display `data` (rows from the controller's get_*_sales) for a view.
+        Reuses the saved frame when the same view already showed the same values.
+        """
+        if view == 'day':
+            days = calendar.monthrange(year, month)[1]
+            sales = {item['day']: float(item['total_sales']) for item in data}
+            positions = list(range(1, days + 1))
+            values = [sales.get(day, 0.0) for day in positions]
+            month_name = datetime(year, month, 1).strftime('%B')
+            title = f'Daily Sales - {month_name} {year}'
+            xlabel, empty = 'Day of Month', 'No sales data available for this month'
+            ticks, xlim, label_size, label_bold = None, (0.4, days + 0.6), 9, False
+        elif view == 'month':
+            sales = {item['month']: float(item['total_sales']) for item in data}
+            positions = list(range(12))
+            values = [sales.get(m, 0.0) for m in range(1, 13)]
+            title = f'Monthly Sales - {year}'
+            xlabel, empty = 'Month', 'No sales data available for this year'
+            ticks, xlim, label_size, label_bold = MONTH_NAMES, (-0.6, 11.6), 9, False
+        else:
+            positions = list(range(len(data)))
+            values = [float(item['total_sales']) for item in data]
+            title = 'Yearly Sales Comparison'
+            xlabel, empty = 'Year', 'No sales data available'
+            ticks = [str(item['year']) for item in data]
+            xlim, label_size, label_bold = (-0.6, max(len(data), 1) - 0.4), 10, True
+
+        key = (view, year, month)
+        shown = (title, tuple(values)) if data else (title, None)
+        frame = self.frames.get(key)
+
+        self._update_artists(view, data, positions, values, title, xlabel, empty,
+                             ticks, xlim, label_size, label_bold)
+
+        if frame and frame[0] == shown:
+            # Same picture as last time: put the saved pixels back instead of redrawing
+            self.canvas.restore_region(frame[1])
+            self.canvas.blit(self.figure.bbox)
+            return
+
+        self.figure.tight_layout()
+        self.canvas.draw()
+        self.frames[key] = (shown, self.canvas.copy_from_bbox(self.figure.bbox))
+
+    def invalidate(self):
+        """Forget every saved frame (e.g. after a refresh)"""
+        self.frames.clear()
+
+    def _update_artists(self, view, data, positions, values, title, xlabel, empty,
+                        ticks, xlim, label_size, label_bold):
+        ax = self.ax
+        for name, bar_set in self.bar_sets.items():
+            if name != view:
+                bar_set.hide()
+
+        ax.set_title(title, fontsize=16, fontweight='bold', color=TEXT_COLOR, pad=20)
+        ax.set_xlabel(xlabel, fontsize=12, fontweight='bold', color=TEXT_COLOR)
+
+        if not data:
+            self.bar_sets[view].hide()
+            self.empty_text.set_text(empty)
+            self.empty_text.set_visible(True)
+            ax.set_xlim(0, 1)
+            ax.set_ylim(0, 1)
+            ax.xaxis.set_major_locator(AutoLocator())
+            ax.xaxis.set_major_formatter(ScalarFormatter())
+            return
+
+        self.empty_text.set_visible(False)
+        self.bar_sets[view].update(positions, values, label_size, label_bold)
+
+        if ticks is None:
+            ax.xaxis.set_major_locator(AutoLocator())
+            ax.xaxis.set_major_formatter(ScalarFormatter())
+        else:
+            ax.set_xticks(positions)
+            ax.set_xticklabels(ticks, rotation=0)
+        ax.set_xlim(*xlim)
+        top = max(values) if values else 0
+        # Leave room above the tallest bar for its value label
+        ax.set_ylim(0, top * 1.12 if top > 0 else 1)
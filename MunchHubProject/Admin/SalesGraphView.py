@@ -7,20 +7,28 @@ from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
 from PyQt6.QtCore import *
 from datetime import datetime
-import matplotlib.pyplot as plt
+from functools import partial
+import time
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from Tools.DataLoader import DataLoader
+from Admin.SalesChart import SalesChart
 
 
 class SalesGraphView(QWidget):
     """View for displaying sales graphs with filtering options"""
 
+    # Sales fetched for a view are reused until an order is written or this many seconds pass
+    SALES_CACHE_TTL = 30
+
     def __init__(self, controller, parent=None):
         super().__init__(parent)
         self.controller = controller
         self.current_view = 'month'  # Default view
         self.current_year = datetime.now().year
         self.current_month = datetime.now().month
+        self.loader = DataLoader(self)
+        self.sales_cache = {}  # (view, year, month) -> (orders version, fetched at, rows)
         self.initUI()
         self.load_data()
 
@@ -59,6 +67,7 @@ class SalesGraphView(QWidget):
         # Create matplotlib figure
         self.figure = Figure(figsize=(12, 6))
         self.canvas = FigureCanvas(self.figure)
+        self.chart = SalesChart(self.figure, self.canvas)
         graph_layout.addWidget(self.canvas)
 
         layout.addWidget(self.graph_container)
@@ -205,7 +214,7 @@ class SalesGraphView(QWidget):
                 background-color: #ffa726;
             }
         """)
-        refresh_btn.clicked.connect(self.load_data)
+        refresh_btn.clicked.connect(self.refresh)
         header_layout.addWidget(refresh_btn)
 
         return header
@@ -288,8 +297,22 @@ class SalesGraphView(QWidget):
         self.current_month = self.month_combo.itemData(index)
         self.load_data()
 
+    def refresh(self):
+        """Drop cached sales and frames and reload the current view"""
+        self.sales_cache.clear()
+        self.chart.invalidate()
+        self.load_data()
+
+    def current_key(self):
+        """Cache key of the selected view: (view, year, month)"""
+        if self.current_view == 'day':
+            return ('day', self.current_year, self.current_month)
+        if self.current_view == 'month':
+            return ('month', self.current_year, None)
+        return ('year', None, None)
+
     def load_data(self):
-        """Load and display sales data"""
+        """Show the selected view, querying only when its cached sales are stale"""
         # Set initial active button
         if self.current_view == 'day':
             self.set_active_button(self.day_btn)
@@ -298,124 +321,28 @@ class SalesGraphView(QWidget):
         else:
             self.set_active_button(self.year_btn)
 
-        if self.current_view == 'day':
-            self.load_daily_sales()
-        elif self.current_view == 'month':
-            self.load_monthly_sales()
-        else:
-            self.load_yearly_sales()
-
-    def load_daily_sales(self):
-        """Load sales by day for a specific month"""
-        data = self.controller.get_daily_sales(self.current_year, self.current_month)
-
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-
-        if not data:
-            ax.text(0.5, 0.5, 'No sales data available for this month',
-                    ha='center', va='center', fontsize=14, color='#666')
-            self.canvas.draw()
-            return
-
-        days = [item['day'] for item in data]
-        sales = [float(item['total_sales']) for item in data]
-
-        # Create bar chart
-        bars = ax.bar(days, sales, color='#003274', alpha=0.8, edgecolor='#002050', linewidth=1.5)
-
-        # Customize chart
-        month_name = datetime(self.current_year, self.current_month, 1).strftime('%B')
-        ax.set_title(f'Daily Sales - {month_name} {self.current_year}',
-                     fontsize=16, fontweight='bold', color='#003274', pad=20)
-        ax.set_xlabel('Day of Month', fontsize=12, fontweight='bold', color='#003274')
-        ax.set_ylabel('Sales (₱)', fontsize=12, fontweight='bold', color='#003274')
-        ax.grid(axis='y', alpha=0.3, linestyle='--')
-        ax.set_facecolor('#f8f9fa')
-
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width() / 2., height,
-                    f'₱{height:,.0f}',
-                    ha='center', va='bottom', fontsize=9, color='#003274')
-
-        self.figure.tight_layout()
-        self.canvas.draw()
-
-    def load_monthly_sales(self):
-        """Load sales by month for a specific year"""
-        data = self.controller.get_monthly_sales_by_year(self.current_year)
-
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-
-        if not data:
-            ax.text(0.5, 0.5, 'No sales data available for this year',
-                    ha='center', va='center', fontsize=14, color='#666')
-            self.canvas.draw()
+        key = self.current_key()
+        version = self.controller.db.orders_version
+        cached = self.sales_cache.get(key)
+        if cached and cached[0] == version and time.monotonic() - cached[1] < self.SALES_CACHE_TTL:
+            self.show_sales(key, cached[2])
             return
 
-        months = [datetime(2000, item['month'], 1).strftime('%b') for item in data]
-        sales = [float(item['total_sales']) for item in data]
-
-        # Create bar chart with gradient effect
-        bars = ax.bar(months, sales, color='#003274', alpha=0.8, edgecolor='#002050', linewidth=1.5)
-
-        # Customize chart
-        ax.set_title(f'Monthly Sales - {self.current_year}',
-                     fontsize=16, fontweight='bold', color='#003274', pad=20)
-        ax.set_xlabel('Month', fontsize=12, fontweight='bold', color='#003274')
-        ax.set_ylabel('Sales (₱)', fontsize=12, fontweight='bold', color='#003274')
-        ax.grid(axis='y', alpha=0.3, linestyle='--')
-        ax.set_facecolor('#f8f9fa')
-
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width() / 2., height,
-                    f'₱{height:,.0f}',
-                    ha='center', va='bottom', fontsize=9, color='#003274')
-
-        # Rotate x-axis labels for better readability
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=0)
-
-        self.figure.tight_layout()
-        self.canvas.draw()
-
-    def load_yearly_sales(self):
-        """Load sales by year"""
-        data = self.controller.get_yearly_sales()
-
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
+        # Query in the background; a newer selection replaces one still loading
+        view, year, month = key
+        if view == 'day':
+            fetch, args = self.controller.get_daily_sales, (year, month)
+        elif view == 'month':
+            fetch, args = self.controller.get_monthly_sales_by_year, (year,)
+        else:
+            fetch, args = self.controller.get_yearly_sales, ()
+        self.loader.load(fetch, partial(self.on_sales_loaded, key, version), None, *args)
 
-        if not data:
-            ax.text(0.5, 0.5, 'No sales data available',
-                    ha='center', va='center', fontsize=14, color='#666')
-            self.canvas.draw()
-            return
+    def on_sales_loaded(self, key, version, data):
+        self.sales_cache[key] = (version, time.monotonic(), data)
+        if key == self.current_key():
+            self.show_sales(key, data)
 
-        years = [str(item['year']) for item in data]
-        sales = [float(item['total_sales']) for item in data]
-
-        # Create bar chart
-        bars = ax.bar(years, sales, color='#003274', alpha=0.8, edgecolor='#002050', linewidth=1.5)
-
-        # Customize chart
-        ax.set_title('Yearly Sales Comparison',
-                     fontsize=16, fontweight='bold', color='#003274', pad=20)
-        ax.set_xlabel('Year', fontsize=12, fontweight='bold', color='#003274')
-        ax.set_ylabel('Sales (₱)', fontsize=12, fontweight='bold', color='#003274')
-        ax.grid(axis='y', alpha=0.3, linestyle='--')
-        ax.set_facecolor('#f8f9fa')
-
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width() / 2., height,
-                    f'₱{height:,.0f}',
-                    ha='center', va='bottom', fontsize=10, color='#003274', fontweight='bold')
-
-        self.figure.tight_layout()
-        self.canvas.draw()
\ No newline at end of file
+    def show_sales(self, key, data):
+        view, year, month = key
+        self.chart.show(view, data or [], year, month)
@@ -1,7 +1,9 @@
 from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
 from PyQt6.QtCore import *
-from Admin.AdminComponents import StyledTable, ActionButton
+from Tools.Theme import apply_theme
+from Admin.AdminComponents import StyledTableView, ActionButton
+from Tools.LazyTable import LazyTableModel, Column, CENTER
 import hashlib
 
 
@@ -120,71 +122,36 @@ class StaffManagementView(QWidget):
 
     def create_staff_table(self):
         """Create staff table"""
-        table = StyledTable()
-        table.setColumnCount(6)
-        table.setHorizontalHeaderLabels([
-            "Staff ID", "First Name", "Middle Name", "Last Name", "Username", "Phone Number"
-        ])
+        columns = [
+            Column("Staff ID", 'StaffID', align=CENTER),
+            Column("First Name", 'UFirstName'),
+            Column("Middle Name", 'UMiddleName'),
+            Column("Last Name", 'ULastName'),
+            Column("Username", 'Username'),
+            Column("Phone Number", text=lambda staff: staff.get('PhoneNum') or 'N/A', align=CENTER)
+        ]
+        self.staff_model = LazyTableModel(columns, key_field='StaffID', parent=self)
+        self.staff_model.load_failed.connect(
+            lambda message: self.show_message("Error", f"Error loading staff: {message}", "critical")
+        )
+        self.staff_model.modelReset.connect(lambda: self.filter_staff(self.search_input.text()))
 
-        # Enable single selection
-        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        table = StyledTableView(self.staff_model, empty_text="No staff members found")
 
         header = table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
 
         return table
 
     def load_staff(self):
-        """Load staff from database"""
-        try:
-            staff_list = self.controller.get_all_staff()
-            self.staff_table.setRowCount(len(staff_list))
-
-            for row, staff in enumerate(staff_list):
-                # Staff ID
-                id_item = QTableWidgetItem(staff['StaffID'])
-                id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.staff_table.setItem(row, 0, id_item)
-
-                # First Name
-                first_name_item = QTableWidgetItem(staff['UFirstName'])
-                self.staff_table.setItem(row, 1, first_name_item)
-
-                # Middle Name
-                middle_name_item = QTableWidgetItem(staff.get('UMiddleName') or "")
-                self.staff_table.setItem(row, 2, middle_name_item)
-
-                # Last Name
-                last_name_item = QTableWidgetItem(staff['ULastName'])
-                self.staff_table.setItem(row, 3, last_name_item)
-
-                # Username
-                username_item = QTableWidgetItem(staff['Username'])
-                self.staff_table.setItem(row, 4, username_item)
-
-                # Phone Number
-                phone_item = QTableWidgetItem(staff.get('PhoneNum', 'N/A'))
-                phone_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.staff_table.setItem(row, 5, phone_item)
-
-        except Exception as e:
-            self.show_message("Error", f"Error loading staff: {e}", "critical")
+        """Load staff from database in the background"""
+        self.staff_model.load_all(self.controller.get_all_staff)
 
     def filter_staff(self, search_text):
         """Filter staff by search text"""
-        for row in range(self.staff_table.rowCount()):
-            match = False
-            for col in range(6):  # Search in all columns
-                item = self.staff_table.item(row, col)
-                if item and search_text.lower() in item.text().lower():
-                    match = True
-                    break
+        search_text = search_text.lower()
+        for row, staff in enumerate(self.staff_model.rows()):
+            match = any(search_text in column.display(staff).lower() for column in self.staff_model.columns)
             self.staff_table.setRowHidden(row, not match)
 
     def add_staff(self):
@@ -195,17 +162,17 @@ class StaffManagementView(QWidget):
 
     def view_staff(self):
         """View staff details"""
-        selected_row = self.staff_table.currentRow()
-        if selected_row < 0:
+        staff = self.staff_table.selected_row()
+        if not staff:
             self.show_message("No Selection", "Please select a staff member to view.", "warning")
             return
 
-        staff_id = self.staff_table.item(selected_row, 0).text()
-        first_name = self.staff_table.item(selected_row, 1).text()
-        middle_name = self.staff_table.item(selected_row, 2).text()
-        last_name = self.staff_table.item(selected_row, 3).text()
-        username = self.staff_table.item(selected_row, 4).text()
-        phone = self.staff_table.item(selected_row, 5).text()
+        staff_id = staff['StaffID']
+        first_name = staff['UFirstName']
+        middle_name = staff.get('UMiddleName') or ""
+        last_name = staff['ULastName']
+        username = staff['Username']
+        phone = staff.get('PhoneNum') or 'N/A'
 
         dialog = StaffDetailsDialog(
             staff_id, first_name, middle_name, last_name, username, phone, parent=self
@@ -214,17 +181,17 @@ class StaffManagementView(QWidget):
 
     def edit_staff(self):
         """Edit staff information"""
-        selected_row = self.staff_table.currentRow()
-        if selected_row < 0:
+        staff = self.staff_table.selected_row()
+        if not staff:
             self.show_message("No Selection", "Please select a staff member to edit.", "warning")
             return
 
-        staff_id = self.staff_table.item(selected_row, 0).text()
-        first_name = self.staff_table.item(selected_row, 1).text()
-        middle_name = self.staff_table.item(selected_row, 2).text()
-        last_name = self.staff_table.item(selected_row, 3).text()
-        username = self.staff_table.item(selected_row, 4).text()
-        phone = self.staff_table.item(selected_row, 5).text()
+        staff_id = staff['StaffID']
+        first_name = staff['UFirstName']
+        middle_name = staff.get('UMiddleName') or ""
+        last_name = staff['ULastName']
+        username = staff['Username']
+        phone = staff.get('PhoneNum') or 'N/A'
 
         dialog = EditStaffDialog(
             self.controller, staff_id, first_name, middle_name, last_name, username, phone, parent=self
@@ -234,13 +201,13 @@ class StaffManagementView(QWidget):
 
     def delete_staff(self):
         """Delete selected staff member"""
-        selected_row = self.staff_table.currentRow()
-        if selected_row < 0:
+        staff = self.staff_table.selected_row()
+        if not staff:
             self.show_message("No Selection", "Please select a staff member to remove.", "warning")
             return
 
-        staff_id = self.staff_table.item(selected_row, 0).text()
-        staff_name = f"{self.staff_table.item(selected_row, 1).text()} {self.staff_table.item(selected_row, 3).text()}"
+        staff_id = staff['StaffID']
+        staff_name = f"{staff['UFirstName']} {staff['ULastName']}"
 
         # Apply message box styling
         self.apply_message_box_style()
@@ -263,26 +230,7 @@ class StaffManagementView(QWidget):
 
     def apply_message_box_style(self):
         """Apply black text styling to message boxes"""
-        QApplication.instance().setStyleSheet("""
-            QMessageBox {
-                background-color: white;
-            }
-            QMessageBox QLabel {
-                color: black;
-                font-size: 11px;
-            }
-            QMessageBox QPushButton {
-                color: black;
-                background-color: #e0e0e0;
-                border: 1px solid #ccc;
-                padding: 5px 15px;
-                border-radius: 4px;
-                min-width: 60px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-        """)
+        apply_theme()
 
     def show_message(self, title, message, msg_type):
         """Show message box with proper styling"""
@@ -539,26 +487,7 @@ class AddStaffDialog(QDialog):
 
     def apply_message_box_style(self):
         """Apply black text styling to message boxes"""
-        QApplication.instance().setStyleSheet("""
-            QMessageBox {
-                background-color: white;
-            }
-            QMessageBox QLabel {
-                color: black;
-                font-size: 11px;
-            }
-            QMessageBox QPushButton {
-                color: black;
-                background-color: #e0e0e0;
-                border: 1px solid #ccc;
-                padding: 5px 15px;
-                border-radius: 4px;
-                min-width: 60px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-        """)
+        apply_theme()
 
 
 class EditStaffDialog(QDialog):
@@ -731,26 +660,7 @@ class EditStaffDialog(QDialog):
 
     def apply_message_box_style(self):
         """Apply black text styling to message boxes"""
-        QApplication.instance().setStyleSheet("""
-            QMessageBox {
-                background-color: white;
-            }
-            QMessageBox QLabel {
-                color: black;
-                font-size: 11px;
-            }
-            QMessageBox QPushButton {
-                color: black;
-                background-color: #e0e0e0;
-                border: 1px solid #ccc;
-                padding: 5px 15px;
-                border-radius: 4px;
-                min-width: 60px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-        """)
+        apply_theme()
 
 
 class StaffDetailsDialog(QDialog):
@@ -10,6 +10,8 @@ MODIFICATIONS:
 from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
 from PyQt6.QtCore import *
+from Tools.Theme import CART_ITEM_STYLE, MENU_ITEM_STYLE, apply_theme
+from Tools.DataLoader import DataLoader
 
 # Import MVC components
 try:
@@ -56,6 +58,12 @@ class CustomerWindow(QMainWindow):
         self.selected_category = 'all'
         self.current_page = 'menu'
 
+        # Reused menu widgets: MenuItemWidget per MenuID, plus the banner and empty message
+        self.menu_item_widgets = {}
+        self.category_header_frame = None
+        self.no_items_label = None
+
+        self.loader = DataLoader(self)
         self.initUI()
         self.load_initial_data()
 
@@ -422,8 +430,10 @@ class CustomerWindow(QMainWindow):
             }
         """)
 
+        # The card rules are parsed once here instead of once per MenuItemWidget
         self.menu_container = QWidget()
-        self.menu_container.setStyleSheet("background-color: transparent;")
+        self.menu_container.setObjectName("menuContainer")
+        self.menu_container.setStyleSheet("#menuContainer { background-color: transparent; }" + MENU_ITEM_STYLE)
         self.menu_layout = QVBoxLayout()
         self.menu_layout.setSpacing(15)
         self.menu_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
@@ -469,8 +479,10 @@ class CustomerWindow(QMainWindow):
             }
         """)
 
+        # The row rules are parsed once here instead of once per CartItemWidget
         self.cart_container = QWidget()
-        self.cart_container.setStyleSheet("background-color: transparent;")
+        self.cart_container.setObjectName("cartContainer")
+        self.cart_container.setStyleSheet("#cartContainer { background-color: transparent; }" + CART_ITEM_STYLE)
         self.cart_layout = QVBoxLayout()
         self.cart_layout.setSpacing(10)
         self.cart_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
@@ -548,14 +560,20 @@ class CustomerWindow(QMainWindow):
         return panel
 
     def load_initial_data(self):
-        """Load categories and menu items"""
-        success, message = self.controller.initialize_data()
+        """Load categories and menu items in the background"""
+        self.loader.load(self.controller.initialize_data, self.on_initial_data_loaded,
+                         lambda message: self.on_initial_data_loaded((False, message)))
+
+    def on_initial_data_loaded(self, result):
+        """Show the menu once categories and items have loaded"""
+        success, message = result
         if not success:
-            QApplication.instance().setStyleSheet("QMessageBox QLabel { color: black; }")
+            apply_theme()
             QMessageBox.critical(self, 'Error', message)
             return
 
         self.display_categories()
+        self.prune_menu_item_widgets()
         self.display_menu_items()
         self.highlight_active_button(self.menu_btn)
 
@@ -596,72 +614,118 @@ class CustomerWindow(QMainWindow):
     def on_search_changed(self):
         """Handle search text change"""
         search_text = self.search_input.text().strip()
-        results = self.controller.search_menu(search_text)
+        results = self.controller.search_menu(search_text, self.selected_category)
         self.display_menu_items(results)
 
     def display_menu_items(self, items=None):
-        """Display menu items"""
-        while self.menu_layout.count():
-            child = self.menu_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        """
+        Display menu items.
 
+        Item widgets are kept per MenuID and reused: a search or category
+        change only re-binds, reorders and shows them, it never rebuilds them.
+        """
         if items is None:
             items = self.menu_model.filtered_items
 
-        if not items:
-            if self.search_input.text().strip():
-                message = f'No items found for "{self.search_input.text()}"\n\nTry a different search term'
-            else:
-                category_name = 'this category'
-                for i in range(self.category_dropdown.count()):
-                    if self.category_dropdown.itemData(i) == self.selected_category:
-                        category_name = self.category_dropdown.itemText(i)
-                        break
-                message = f'No items available in {category_name}\n\nTry selecting a different category'
-
-            no_items_label = QLabel(message)
-            no_items_label.setStyleSheet("color: #003274; font-size: 16px;")
-            no_items_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.menu_layout.addWidget(no_items_label)
-            return
-
-        if self.selected_category != 'all' and not self.search_input.text().strip():
-            category_name = ''
+        self.menu_container.setUpdatesEnabled(False)
+        try:
+            # Detach the current widgets; they stay alive for the next filter
+            while self.menu_layout.count():
+                child = self.menu_layout.takeAt(0)
+                if child.widget():
+                    child.widget().hide()
+
+            if not items:
+                self.show_menu_message()
+                return
+
+            self.show_category_header(items)
+
+            for item in items:
+                item_widget = self.get_menu_item_widget(item)
+                self.menu_layout.addWidget(item_widget)
+                item_widget.show()
+        finally:
+            self.menu_container.setUpdatesEnabled(True)
+
+    def get_menu_item_widget(self, item):
+        """Pooled MenuItemWidget for this item, created on first use"""
+        item_widget = self.menu_item_widgets.get(item['MenuID'])
+        if item_widget is None:
+            item_widget = MenuItemWidget(item, self.menu_container)
+            item_widget.item_added.connect(self.on_item_added_to_cart)
+            self.menu_item_widgets[item['MenuID']] = item_widget
+        else:
+            item_widget.bind(item)
+        return item_widget
+
+    def prune_menu_item_widgets(self):
+        """Drop pooled widgets of items that are no longer on the menu"""
+        for menu_id in list(self.menu_item_widgets):
+            if self.menu_model.get_item_by_id(menu_id) is None:
+                self.menu_item_widgets.pop(menu_id).deleteLater()
+
+    def show_menu_message(self):
+        """Show the 'no items' message for the current search or category"""
+        if self.search_input.text().strip():
+            message = f'No items found for "{self.search_input.text()}"\n\nTry a different search term'
+        else:
+            category_name = 'this category'
             for i in range(self.category_dropdown.count()):
                 if self.category_dropdown.itemData(i) == self.selected_category:
-                    category_name = self.category_dropdown.itemText(i).split(' (')[0]
+                    category_name = self.category_dropdown.itemText(i)
                     break
+            message = f'No items available in {category_name}\n\nTry selecting a different category'
+
+        if self.no_items_label is None:
+            self.no_items_label = QLabel(self.menu_container)
+            self.no_items_label.setStyleSheet("color: #003274; font-size: 16px;")
+            self.no_items_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.no_items_label.setText(message)
+        self.menu_layout.addWidget(self.no_items_label)
+        self.no_items_label.show()
+
+    def show_category_header(self, items):
+        """Show the category banner above the items when browsing a category"""
+        if self.selected_category == 'all' or self.search_input.text().strip():
+            return
 
-            if category_name:
-                header_frame = QFrame()
-                header_frame.setStyleSheet("""
-                    QFrame {
-                        background-color: #ffbd59;
-                        border-radius: 8px;
-                        padding: 10px;
-                    }
-                """)
-                header_layout = QHBoxLayout(header_frame)
-
-                category_header = QLabel(f'{category_name}')
-                category_header.setFont(QFont('Arial', 14, QFont.Weight.Bold))
-                category_header.setStyleSheet("color: #003274;")
-
-                item_count = QLabel(f'{len(items)} item{"s" if len(items) != 1 else ""}')
-                item_count.setFont(QFont('Arial', 12))
-                item_count.setStyleSheet("color: #003274;")
-
-                header_layout.addWidget(category_header)
-                header_layout.addStretch()
-                header_layout.addWidget(item_count)
-
-                self.menu_layout.addWidget(header_frame)
-
-        for item in items:
-            item_widget = MenuItemWidget(item)
-            item_widget.item_added.connect(self.on_item_added_to_cart)
-            self.menu_layout.addWidget(item_widget)
+        category_name = ''
+        for i in range(self.category_dropdown.count()):
+            if self.category_dropdown.itemData(i) == self.selected_category:
+                category_name = self.category_dropdown.itemText(i).split(' (')[0]
+                break
+        if not category_name:
+            return
+
+        if self.category_header_frame is None:
+            header_frame = QFrame(self.menu_container)
+            header_frame.setStyleSheet("""
+                QFrame {
+                    background-color: #ffbd59;
+                    border-radius: 8px;
+                    padding: 10px;
+                }
+            """)
+            header_layout = QHBoxLayout(header_frame)
+
+            self.category_header_label = QLabel()
+            self.category_header_label.setFont(QFont('Arial', 14, QFont.Weight.Bold))
+            self.category_header_label.setStyleSheet("color: #003274;")
+
+            self.category_count_label = QLabel()
+            self.category_count_label.setFont(QFont('Arial', 12))
+            self.category_count_label.setStyleSheet("color: #003274;")
+
+            header_layout.addWidget(self.category_header_label)
+            header_layout.addStretch()
+            header_layout.addWidget(self.category_count_label)
+            self.category_header_frame = header_frame
+
+        self.category_header_label.setText(category_name)
+        self.category_count_label.setText(f'{len(items)} item{"s" if len(items) != 1 else ""}')
+        self.menu_layout.addWidget(self.category_header_frame)
+        self.category_header_frame.show()
 
     def on_item_added_to_cart(self, item):
         """Handle item added to cart"""
@@ -710,20 +774,7 @@ class CustomerWindow(QMainWindow):
         current_quantity = cart_item['quantity']
 
         if change < 0 and current_quantity + change <= 0:
-            QApplication.instance().setStyleSheet("""
-                QMessageBox QLabel { color: black; }
-                QMessageBox QPushButton { 
-                    color: black; 
-                    background-color: #f0f0f0;
-                    border: 1px solid #ccc;
-                    padding: 5px 15px;
-                    border-radius: 3px;
-                    min-width: 60px;
-                }
-                QMessageBox QPushButton:hover {
-                    background-color: #e0e0e0;
-                }
-            """)
+            apply_theme()
 
             reply = QMessageBox.question(
                 self,
@@ -742,20 +793,7 @@ class CustomerWindow(QMainWindow):
 
     def on_cart_item_removed(self, cart_item):
         """Handle cart item removal"""
-        QApplication.instance().setStyleSheet("""
-            QMessageBox QLabel { color: black; }
-            QMessageBox QPushButton { 
-                color: black; 
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                padding: 5px 15px;
-                border-radius: 3px;
-                min-width: 60px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-        """)
+        apply_theme()
 
         reply = QMessageBox.question(
             self,
@@ -798,20 +836,7 @@ class CustomerWindow(QMainWindow):
 
     def confirm_and_place_order(self, order_details, cart_summary, tax):
         """Show final confirmation before placing order with tax - DISPLAYS TAX"""
-        QApplication.instance().setStyleSheet("""
-            QMessageBox QLabel { color: black; }
-            QMessageBox QPushButton { 
-                color: black; 
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                padding: 5px 15px;
-                border-radius: 3px;
-                min-width: 60px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-        """)
+        apply_theme()
 
         items_text = "\n".join([f"• {item['name']} x{item['quantity']}" for item in cart_summary['items']])
 
@@ -878,19 +903,7 @@ class CustomerWindow(QMainWindow):
                 'Thank you for your order! You can track it in Order History.'
             )
 
-            QApplication.instance().setStyleSheet("""
-                QMessageBox QLabel { color: black; }
-                QMessageBox QPushButton { 
-                    color: black; 
-                    background-color: #f0f0f0;
-                    border: 1px solid #ccc;
-                    padding: 5px 15px;
-                    border-radius: 3px;
-                }
-                QMessageBox QPushButton:hover {
-                    background-color: #e0e0e0;
-                }
-            """)
+            apply_theme()
             QMessageBox.information(self, 'Order Placed Successfully!', success_msg)
             self.update_cart_display()
         else:
@@ -903,19 +916,7 @@ class CustomerWindow(QMainWindow):
 
     def logout(self):
         """Logout and return to login"""
-        QApplication.instance().setStyleSheet("""
-            QMessageBox QLabel { color: black; }
-            QMessageBox QPushButton { 
-                color: black; 
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                padding: 5px 15px;
-                border-radius: 3px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-        """)
+        apply_theme()
 
         reply = QMessageBox.question(
             self,
@@ -932,7 +933,7 @@ class CustomerWindow(QMainWindow):
                 self.close()
             except Exception as e:
                 print(f"Logout error: {e}")
-                QApplication.instance().setStyleSheet("QMessageBox QLabel { color: black; }")
+                apply_theme()
                 QMessageBox.critical(self, 'Error', f'Failed to logout: {str(e)}')
 
         #
\ No newline at end of file
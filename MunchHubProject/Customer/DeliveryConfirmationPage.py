@@ -7,6 +7,7 @@ from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
 from PyQt6.QtCore import *
 from datetime import datetime
+from Tools.Theme import DELIVERY_CARD_STYLE, cached_font
 
 
 class DeliveryConfirmationPage(QWidget):
@@ -84,7 +85,9 @@ class DeliveryConfirmationPage(QWidget):
             }
         """)
 
+        # The card rules are parsed once here instead of once per order card
         self.orders_container = QWidget()
+        self.orders_container.setStyleSheet(DELIVERY_CARD_STYLE)
         self.orders_layout = QVBoxLayout()
         self.orders_layout.setSpacing(15)
         self.orders_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
@@ -96,27 +99,9 @@ class DeliveryConfirmationPage(QWidget):
     def load_deliverable_orders(self):
         """Load orders that are out for delivery"""
         try:
-            cursor = self.db_manager.connection.cursor(dictionary=True)
-            query = """
-                SELECT o.OrderID, o.TotalFee, o.DeliveryFee, o.Address,
-                       o.OrderStatus, p.PaymentMethod,
-                       (SELECT UpdateDate FROM OrderTrack 
-                        WHERE OrderID = o.OrderID 
-                        ORDER BY UpdateDate DESC LIMIT 1) as LastUpdate,
-                       GROUP_CONCAT(CONCAT(m.ItemName, ' x', ol.Quantity) 
-                                   SEPARATOR ', ') as Items
-                FROM Orders o
-                JOIN Payments p ON o.PaymentID = p.PaymentID
-                JOIN OrderList ol ON o.OrderID = ol.OrderID
-                JOIN MenuItems m ON ol.MenuID = m.MenuID
-                WHERE o.CustomerID = %s 
-                AND o.OrderStatus = 'Out for delivery'
-                GROUP BY o.OrderID
-                ORDER BY LastUpdate DESC
-            """
-            cursor.execute(query, (self.user_data['customer_id'],))
-            orders = cursor.fetchall()
-            cursor.close()
+            orders = self.db_manager.order_summary.get_customer_orders(
+                self.user_data['customer_id'], 'Out for delivery'
+            )
 
             self.display_orders(orders)
 
@@ -153,14 +138,7 @@ class DeliveryConfirmationPage(QWidget):
     def create_order_card(self, order):
         """Create a card widget for an order"""
         card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 2px solid #FF9800;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
+        card.setObjectName("deliveryCard")
 
         layout = QVBoxLayout()
         layout.setSpacing(15)
@@ -170,18 +148,13 @@ class DeliveryConfirmationPage(QWidget):
         header_layout = QHBoxLayout()
 
         order_id_label = QLabel(f"Order #{order['OrderID']}")
-        order_id_label.setFont(QFont('Arial', 16, QFont.Weight.Bold))
-        order_id_label.setStyleSheet("color: #003274;")
+        order_id_label.setObjectName("deliveryCardTitle")
+        order_id_label.setFont(cached_font(16, bold=True))
         header_layout.addWidget(order_id_label)
 
         status_label = QLabel("OUT FOR DELIVERY")
-        status_label.setFont(QFont('Arial', 11, QFont.Weight.Bold))
-        status_label.setStyleSheet("""
-            color: white;
-            background-color: #FF9800;
-            padding: 8px 15px;
-            border-radius: 6px;
-        """)
+        status_label.setObjectName("deliveryCardBadge")
+        status_label.setFont(cached_font(11, bold=True))
         header_layout.addWidget(status_label)
 
         header_layout.addStretch()
@@ -189,8 +162,8 @@ class DeliveryConfirmationPage(QWidget):
 
         # Separator
         separator = QFrame()
+        separator.setObjectName("deliveryCardSeparator")
         separator.setFrameShape(QFrame.Shape.HLine)
-        separator.setStyleSheet("background-color: #e0e0e0;")
         layout.addWidget(separator)
 
         # Order details
@@ -199,57 +172,47 @@ class DeliveryConfirmationPage(QWidget):
 
         # Items
         items_label = QLabel(f"Items: {order['Items']}")
-        items_label.setFont(QFont('Arial', 11))
-        items_label.setStyleSheet("color: #333;")
+        items_label.setObjectName("deliveryCardDetail")
+        items_label.setFont(cached_font(11))
         items_label.setWordWrap(True)
         details_layout.addWidget(items_label)
 
         # Address
         address_label = QLabel(f"Delivery to: {order['Address']}")
-        address_label.setFont(QFont('Arial', 11))
-        address_label.setStyleSheet("color: #333;")
+        address_label.setObjectName("deliveryCardDetail")
+        address_label.setFont(cached_font(11))
         address_label.setWordWrap(True)
         details_layout.addWidget(address_label)
 
         # Payment
         payment_label = QLabel(f"Payment: {order['PaymentMethod']}")
-        payment_label.setFont(QFont('Arial', 11))
-        payment_label.setStyleSheet("color: #333;")
+        payment_label.setObjectName("deliveryCardDetail")
+        payment_label.setFont(cached_font(11))
         details_layout.addWidget(payment_label)
 
         # Total
         total = order['TotalFee'] + order['DeliveryFee']
         total_label = QLabel(f"Total: ₱{total:.2f}")
-        total_label.setFont(QFont('Arial', 12, QFont.Weight.Bold))
-        total_label.setStyleSheet("color: #4CAF50;")
+        total_label.setObjectName("deliveryCardTotal")
+        total_label.setFont(cached_font(12, bold=True))
         details_layout.addWidget(total_label)
 
         # Last update
         if order['LastUpdate']:
             last_update_str = order['LastUpdate'].strftime('%b %d, %Y at %I:%M %p')
             update_label = QLabel(f" Last update: {last_update_str}")
-            update_label.setFont(QFont('Arial', 10))
-            update_label.setStyleSheet("color: #666;")
+            update_label.setObjectName("deliveryCardUpdate")
+            update_label.setFont(cached_font(10))
             details_layout.addWidget(update_label)
 
         layout.addLayout(details_layout)
 
         # Action button
         confirm_btn = QPushButton("✓ Confirm Delivery Received")
-        confirm_btn.setFont(QFont('Arial', 12, QFont.Weight.Bold))
+        confirm_btn.setObjectName("deliveryConfirmButton")
+        confirm_btn.setFont(cached_font(12, bold=True))
         confirm_btn.setMinimumHeight(50)
         confirm_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        confirm_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
         confirm_btn.clicked.connect(lambda: self.confirm_delivery(order))
         layout.addWidget(confirm_btn)
 
@@ -267,32 +230,36 @@ class DeliveryConfirmationPage(QWidget):
 
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                cursor = self.db_manager.connection.cursor(dictionary=True)
-
-                # Update order status to Delivered
-                cursor.execute(
-                    "UPDATE Orders SET OrderStatus = 'Delivered' WHERE OrderID = %s",
-                    (order['OrderID'],)
-                )
-
-                # Generate new TrackID
-                cursor.execute("SELECT TrackID FROM OrderTrack ORDER BY TrackID DESC LIMIT 1")
-                result = cursor.fetchone()
-                if result:
-                    last_num = int(result['TrackID'][1:])
-                    new_track_id = f"T{str(last_num + 1).zfill(3)}"
-                else:
-                    new_track_id = "T001"
-
-                # Add tracking record
-                cursor.execute(
-                    """INSERT INTO OrderTrack (TrackID, OrderID, Status, Notes, UpdateDate)
-                       VALUES (%s, %s, 'Delivered', 'Confirmed by customer', %s)""",
-                    (new_track_id, order['OrderID'], datetime.now())
-                )
-
-                self.db_manager.connection.commit()
-                cursor.close()
+                # One pooled connection: the order update and the derived tables commit together
+                with self.db_manager.borrow_connection() as conn:
+                    cursor = conn.cursor(dictionary=True)
+
+                    # Update order status to Delivered
+                    old_status = self.db_manager.sales_rollup.lock_order(cursor, order['OrderID'])
+                    cursor.execute(
+                        "UPDATE Orders SET OrderStatus = 'Delivered' WHERE OrderID = %s",
+                        (order['OrderID'],)
+                    )
+
+                    # Generate new TrackID
+                    new_track_id = self.db_manager.ids.next_id('track', cursor)
+
+                    # Add tracking record
+                    cursor.execute(
+                        """INSERT INTO OrderTrack (TrackID, OrderID, Status, Notes, UpdateDate)
+                           VALUES (%s, %s, 'Delivered', 'Confirmed by customer', %s)""",
+                        (new_track_id, order['OrderID'], datetime.now())
+                    )
+
+                    # Keep the daily sales rollup, order summary and order change feed in step with the status change
+                    self.db_manager.sales_rollup.refresh_for_order(cursor, order['OrderID'], old_status)
+                    self.db_manager.order_summary.refresh_for_order(cursor, order['OrderID'])
+                    self.db_manager.order_feed.record(cursor, order['OrderID'])
+
+                    conn.commit()
+                    cursor.close()
+                self.db_manager.notify_orders_changed()
+                self.db_manager.order_timeline.invalidate([order['OrderID']])
 
                 QMessageBox.information(
                     self,
@@ -305,8 +272,6 @@ class DeliveryConfirmationPage(QWidget):
                 self.load_deliverable_orders()
 
             except Exception as e:
-                if self.db_manager.connection:
-                    self.db_manager.connection.rollback()
                 print(f"Error confirming delivery: {e}")
                 import traceback
                 traceback.print_exc()
@@ -0,0 +1,132 @@
+"""
+MenuSearchIndex.py - Precomputed lookups for the customer menu
+Place this file in: Customer/MenuSearchIndex.py
+
+Built once when the menu loads so searching and category switching never
+rescan (or re-lowercase) the whole menu:
+    - MenuID -> item hash map
+    - CategoryID -> item positions
+    - normalized word tokens -> item positions (for typo-tolerant matching)
+    - character n-grams (1 to 3 chars) -> item positions
+
+A query word matches an item when it appears anywhere in the item's
+normalized name, as before. Words of up to 3 characters are a single n-gram
+lookup; longer words intersect their trigrams and confirm the few remaining
+candidates.
+"""
+
+import difflib
+import re
+import unicodedata
+
+
+GRAM_SIZE = 3
+
+
+def normalize(text):
+    """Lowercase, strip accents and collapse punctuation to single spaces"""
+    text = unicodedata.normalize('NFKD', text or "")
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(re.sub(r"[^0-9a-z]+", " ", text.lower()).split())
+
+
+class MenuSearchIndex:
+    """Search and category lookups over a fixed list of menu items"""
+
+    def __init__(self, items):
+        self.items = list(items)
+        self.by_id = {}
+        self.by_category = {}
+        self.tokens = {}
+        self.grams = {}
+        self.names = []
+        self._vocabulary = None  # first letter -> tokens, built on first fuzzy search
+
+        for position, item in enumerate(self.items):
+            self.by_id[item['MenuID']] = item
+            self.by_category.setdefault(item['CategoryID'], []).append(position)
+
+            name = normalize(item['ItemName'])
+            self.names.append(name)
+            for token in name.split():
+                self.tokens.setdefault(token, set()).add(position)
+            for size in range(1, GRAM_SIZE + 1):
+                for start in range(len(name) - size + 1):
+                    self.grams.setdefault(name[start:start + size], set()).add(position)
+
+    def get(self, menu_id):
+        """Item with this MenuID, or None"""
+        return self.by_id.get(menu_id)
+
+    def category_items(self, category_id):
+        """Items of one category, in menu order"""
+        return [self.items[p] for p in self.by_category.get(category_id, [])]
+
+    def category_count(self, category_id):
+        return len(self.by_category.get(category_id, []))
+
+    def search(self, text, category_id=None, fuzzy=False):
+        """
+        Items whose name contains every word of `text`, in menu order.
+
+        Args:
+            category_id: Restrict to one category ('all' or None for every item)
+            fuzzy: When nothing matches exactly, match words to the closest
+                menu words instead (e.g. 'burgr' finds 'burger')
+        """
+        words = normalize(text).split()
+        if category_id in (None, 'all'):
+            scope = None
+        else:
+            scope = set(self.by_category.get(category_id, []))
+
+        if not words:
+            positions = scope if scope is not None else range(len(self.items))
+            return [self.items[p] for p in sorted(positions)]
+
+        matches = self._match_words(words, scope)
+        if not matches and fuzzy:
+            matches = self._match_fuzzy(words, scope)
+        return [self.items[p] for p in sorted(matches)]
+
+    def _match_words(self, words, scope):
+        """Positions whose name contains every word"""
+        matches = scope
+        for word in sorted(words, key=len, reverse=True):
+            candidates = self._substring_candidates(word)
+            matches = candidates if matches is None else matches & candidates
+            if not matches:
+                return set()
+        return matches
+
+    def _substring_candidates(self, word):
+        if len(word) <= GRAM_SIZE:
+            return set(self.grams.get(word, ()))
+
+        candidates = None
+        for start in range(len(word) - GRAM_SIZE + 1):
+            found = self.grams.get(word[start:start + GRAM_SIZE])
+            if not found:
+                return set()
+            candidates = set(found) if candidates is None else candidates & found
+        return {p for p in candidates if word in self.names[p]}
+
+    def _match_fuzzy(self, words, scope):
+        """Positions whose name has a close match for every word"""
+        if self._vocabulary is None:
+            # Typos rarely hit the first letter, so only compare words sharing it
+            self._vocabulary = {}
+            for token in self.tokens:
+                self._vocabulary.setdefault(token[0], []).append(token)
+
+        matches = scope
+        for word in words:
+            vocabulary = self._vocabulary.get(word[0], [])
+            close = difflib.get_close_matches(word, vocabulary, n=5, cutoff=0.75)
+            candidates = set()
+            for token in close:
+                candidates |= self.tokens[token]
+            matches = candidates if matches is None else matches & candidates
+            if not matches:
+                return set()
+        return matches
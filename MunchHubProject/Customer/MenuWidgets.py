@@ -10,33 +10,26 @@ MODIFICATIONS:
 from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
 from PyQt6.QtCore import *
+from Tools.Theme import cached_font, set_style_state
 
 
 class MenuItemWidget(QWidget):
     """Widget for displaying a menu item with add to cart button"""
 
-    # Signal emitted when item is added to cart
-    item_added = pyqtSignal(dict)
+    # Signal emitted when item is added to cart (menu items are read-only mappings)
+    item_added = pyqtSignal(object)
 
     def __init__(self, item_data, parent=None):
         super().__init__(parent)
-        self.item_data = item_data
+        self.item_data = None
+        self.is_available = None
         self.initUI()
+        self.bind(item_data)
 
     def initUI(self):
-        """Initialize the menu item UI"""
+        """Initialize the menu item UI (styled by MENU_ITEM_STYLE in Tools/Theme.py)"""
         self.setFixedHeight(130)  # Increased for tax note
-        self.setStyleSheet("""
-            QWidget {
-                background-color: white;
-                border-radius: 10px;
-                border: 2px solid #e0e0e0;
-            }
-            QWidget:hover {
-                border: 2px solid #ffbd59;
-                background-color: #fffef8;
-            }
-        """)
+        self.setObjectName("menuItem")
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(15, 10, 15, 10)
@@ -47,76 +40,66 @@ class MenuItemWidget(QWidget):
         details_layout.setSpacing(5)
 
         # Item name
-        name_label = QLabel(self.item_data['ItemName'])
-        name_label.setFont(QFont('Arial', 14, QFont.Weight.Bold))
-        name_label.setStyleSheet("color: #003274; border: none;")
-        details_layout.addWidget(name_label)
+        self.name_label = QLabel()
+        self.name_label.setObjectName("menuItemName")
+        self.name_label.setFont(cached_font(14, bold=True))
+        details_layout.addWidget(self.name_label)
 
         # Price before tax
-        price = float(self.item_data['Price'])
-        price_label = QLabel(f"₱{price:.2f}")
-        price_label.setFont(QFont('Arial', 13, QFont.Weight.Bold))
-        price_label.setStyleSheet("color: #ff9800; border: none;")
-        details_layout.addWidget(price_label)
+        self.price_label = QLabel()
+        self.price_label.setObjectName("menuItemPrice")
+        self.price_label.setFont(cached_font(13, bold=True))
+        details_layout.addWidget(self.price_label)
 
         # Tax note
         tax_note = QLabel('(+12% tax at checkout)')
-        tax_note.setFont(QFont('Arial', 9))
-        tax_note.setStyleSheet("color: #999; border: none; font-style: italic;")
+        tax_note.setObjectName("menuItemTaxNote")
+        tax_note.setFont(cached_font(9))
         details_layout.addWidget(tax_note)
 
         # Availability status
-        if self.item_data.get('isAvailable', 1) == 1:
-            status_label = QLabel('✓ Available')
-            status_label.setStyleSheet("color: #4CAF50; font-size: 11px; border: none;")
-        else:
-            status_label = QLabel('✗ Out of Stock')
-            status_label.setStyleSheet("color: #F44336; font-size: 11px; border: none;")
-        details_layout.addWidget(status_label)
+        self.status_label = QLabel()
+        self.status_label.setObjectName("menuItemStatus")
+        details_layout.addWidget(self.status_label)
 
         details_layout.addStretch()
         layout.addLayout(details_layout, 1)
 
         # Right side - Add to cart button
         self.add_button = QPushButton('Add to Cart')
-        self.add_button.setFont(QFont('Arial', 11, QFont.Weight.Bold))
+        self.add_button.setObjectName("addToCartButton")
+        self.add_button.setFont(cached_font(11, bold=True))
         self.add_button.setFixedSize(130, 45)
         self.add_button.setCursor(Qt.CursorShape.PointingHandCursor)
 
-        # Disable button if not available
-        is_available = self.item_data.get('isAvailable', 1) == 1
-        self.add_button.setEnabled(is_available)
-
-        if is_available:
-            self.add_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #003274;
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                }
-                QPushButton:hover {
-                    background-color: #004a9e;
-                }
-                QPushButton:pressed {
-                    background-color: #002052;
-                }
-            """)
-        else:
-            self.add_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #cccccc;
-                    color: #666666;
-                    border: none;
-                    border-radius: 8px;
-                }
-            """)
-
         # CRITICAL: Connect the button click to emit signal
         self.add_button.clicked.connect(self.on_add_clicked)
 
         layout.addWidget(self.add_button)
 
+    def bind(self, item_data):
+        """
+        Show `item_data` in this widget. Widgets are reused across searches
+        and category changes, so only what actually changed is touched.
+        """
+        if item_data is self.item_data:
+            return
+        self.item_data = item_data
+
+        self.name_label.setText(item_data['ItemName'])
+        self.price_label.setText(f"₱{float(item_data['Price']):.2f}")
+
+        is_available = item_data.get('isAvailable', 1) == 1
+        if is_available == self.is_available:
+            return
+        self.is_available = is_available
+
+        self.status_label.setText('✓ Available' if is_available else '✗ Out of Stock')
+        set_style_state(self.status_label, 'available', is_available)
+
+        # Disable button if not available (the stylesheet greys out disabled buttons)
+        self.add_button.setEnabled(is_available)
+
     def on_add_clicked(self):
         """Handle add to cart button click"""
         # Emit signal with item data
@@ -124,14 +107,7 @@ class MenuItemWidget(QWidget):
 
         # Visual feedback
         self.add_button.setText('Added!')
-        self.add_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 8px;
-            }
-        """)
+        set_style_state(self.add_button, 'added', True)
 
         # Reset button after 1 second
         QTimer.singleShot(1000, self.reset_button)
@@ -139,20 +115,7 @@ class MenuItemWidget(QWidget):
     def reset_button(self):
         """Reset button to original state"""
         self.add_button.setText('Add to Cart')
-        self.add_button.setStyleSheet("""
-            QPushButton {
-                background-color: #003274;
-                color: white;
-                border: none;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #004a9e;
-            }
-            QPushButton:pressed {
-                background-color: #002052;
-            }
-        """)
+        set_style_state(self.add_button, 'added', False)
 
 
 class CartItemWidget(QWidget):
@@ -171,19 +134,12 @@ class CartItemWidget(QWidget):
         """Initialize the cart item UI with white background"""
         self.setFixedHeight(100)
 
-        # Force white background with !important equivalent by using object name
+        # Styled by CART_ITEM_STYLE in Tools/Theme.py, set on the cart container
         self.setObjectName("cartItem")
-        self.setStyleSheet("""
-            #cartItem {
-                background-color: white;
-                border-radius: 10px;
-                border: 2px solid #e0e0e0;
-            }
-        """)
 
         # Create a white inner container to ensure white background
         container = QWidget()
-        container.setStyleSheet("background-color: white; border-radius: 10px;")
+        container.setObjectName("cartItemBody")
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -197,8 +153,8 @@ class CartItemWidget(QWidget):
         top_layout = QHBoxLayout()
 
         name_label = QLabel(self.cart_item['name'])
-        name_label.setFont(QFont('Arial', 12, QFont.Weight.Bold))
-        name_label.setStyleSheet("color: #003274; border: none; background-color: transparent;")
+        name_label.setObjectName("cartItemName")
+        name_label.setFont(cached_font(12, bold=True))
         name_label.setWordWrap(True)
         top_layout.addWidget(name_label, 1)
 
@@ -206,19 +162,7 @@ class CartItemWidget(QWidget):
         remove_btn = QPushButton('✕')
         remove_btn.setFixedSize(25, 25)
         remove_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        remove_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #F44336;
-                color: white;
-                border: none;
-                border-radius: 12px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #D32F2F;
-            }
-        """)
+        remove_btn.setObjectName("cartRemoveButton")
         remove_btn.clicked.connect(lambda: self.item_removed.emit(self.cart_item))
         top_layout.addWidget(remove_btn)
 
@@ -229,15 +173,15 @@ class CartItemWidget(QWidget):
 
         # Price per item
         price_label = QLabel(f"₱{self.cart_item['price']:.2f}")
-        price_label.setFont(QFont('Arial', 10))
-        price_label.setStyleSheet("color: #666; border: none; background-color: transparent;")
+        price_label.setObjectName("cartItemPrice")
+        price_label.setFont(cached_font(10))
         bottom_layout.addWidget(price_label)
 
         bottom_layout.addStretch()
 
         # Quantity controls
         qty_container = QWidget()
-        qty_container.setStyleSheet("background-color: transparent; border: none;")
+        qty_container.setObjectName("cartQuantityControls")
         qty_layout = QHBoxLayout(qty_container)
         qty_layout.setContentsMargins(0, 0, 0, 0)
         qty_layout.setSpacing(8)
@@ -246,26 +190,14 @@ class CartItemWidget(QWidget):
         minus_btn = QPushButton('−')
         minus_btn.setFixedSize(30, 30)
         minus_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        minus_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e0e0e0;
-                color: #333;
-                border: none;
-                border-radius: 5px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-        """)
+        minus_btn.setObjectName("cartMinusButton")
         minus_btn.clicked.connect(lambda: self.quantity_changed.emit(self.cart_item, -1))
         qty_layout.addWidget(minus_btn)
 
         # Quantity display
         self.qty_label = QLabel(str(self.cart_item['quantity']))
-        self.qty_label.setFont(QFont('Arial', 12, QFont.Weight.Bold))
-        self.qty_label.setStyleSheet("color: #003274; border: none; background-color: transparent;")
+        self.qty_label.setObjectName("cartItemQuantity")
+        self.qty_label.setFont(cached_font(12, bold=True))
         self.qty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.qty_label.setFixedWidth(30)
         qty_layout.addWidget(self.qty_label)
@@ -274,19 +206,7 @@ class CartItemWidget(QWidget):
         plus_btn = QPushButton('+')
         plus_btn.setFixedSize(30, 30)
         plus_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        plus_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #003274;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #004a9e;
-            }
-        """)
+        plus_btn.setObjectName("cartPlusButton")
         plus_btn.clicked.connect(lambda: self.quantity_changed.emit(self.cart_item, 1))
         qty_layout.addWidget(plus_btn)
 
@@ -296,8 +216,8 @@ class CartItemWidget(QWidget):
 
         # Subtotal
         subtotal_label = QLabel(f"₱{self.cart_item['subtotal']:.2f}")
-        subtotal_label.setFont(QFont('Arial', 12, QFont.Weight.Bold))
-        subtotal_label.setStyleSheet("color: #ffbd59; border: none; background-color: transparent;")
+        subtotal_label.setObjectName("cartItemSubtotal")
+        subtotal_label.setFont(cached_font(12, bold=True))
         bottom_layout.addWidget(subtotal_label)
 
         layout.addLayout(bottom_layout)
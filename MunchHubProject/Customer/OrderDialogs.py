@@ -6,6 +6,8 @@ FIXED: Constructor parameter mismatch
 from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
 from PyQt6.QtCore import *
+from Tools.Theme import apply_theme, cached_color, cached_font
+from Tools.OrderFeedWatcher import OrderFeedWatcher
 
 
 class OrderVerificationDialog(QDialog):
@@ -450,9 +452,25 @@ class OrderHistoryDialog(QDialog):
         super().__init__(parent)
         self.customer_id = customer_id
         self.db_manager = db_manager
+        self.order_ids = set()
         self.initUI()
         self.load_orders()
 
+        # Staff updates to the listed orders refresh the table while it is open
+        self.order_watcher = OrderFeedWatcher(self.db_manager, parent=self)
+        self.order_watcher.orders_changed.connect(self.apply_order_changes)
+        self.order_watcher.start()
+
+    def done(self, result):
+        self.order_watcher.stop()
+        super().done(result)
+
+    def apply_order_changes(self, order_ids):
+        """Drop cached timelines of changed orders and reload if any are listed"""
+        self.db_manager.order_timeline.invalidate(order_ids)
+        if self.order_ids.intersection(order_ids):
+            self.load_orders()
+
     def initUI(self):
         self.setWindowTitle('Order History - MunchHub')
         self.setMinimumSize(900, 600)
@@ -566,21 +584,23 @@ class OrderHistoryDialog(QDialog):
     def load_orders(self):
         """Load orders from database"""
         try:
-            cursor = self.db_manager.connection.cursor(dictionary=True)
             query = """
                 SELECT o.OrderID, o.TotalFee, o.Tax, o.DeliveryFee, o.OrderStatus, 
-                       o.Address, p.PaymentMethod,
-                       (SELECT MIN(ot.UpdateDate) 
-                        FROM OrderTrack ot 
-                        WHERE ot.OrderID = o.OrderID) as OrderDate
+                       o.Address, p.PaymentMethod
                 FROM Orders o
                 JOIN Payments p ON o.PaymentID = p.PaymentID
                 WHERE o.CustomerID = %s
                 ORDER BY o.OrderID DESC
             """
-            cursor.execute(query, (self.customer_id,))
-            orders = cursor.fetchall()
-            cursor.close()
+            with self.db_manager.borrow_connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                cursor.execute(query, (self.customer_id,))
+                orders = cursor.fetchall()
+                cursor.close()
+
+            # The first tracking update is the order date; one query for all orders
+            self.db_manager.order_timeline.fill_order_dates(orders)
+            self.order_ids = {order['OrderID'] for order in orders}
 
             self.populate_table(orders)
 
@@ -594,7 +614,7 @@ class OrderHistoryDialog(QDialog):
         if not orders:
             empty_msg = QTableWidgetItem("No orders found")
             empty_msg.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            empty_msg.setForeground(QColor('black'))
+            empty_msg.setForeground(cached_color('black'))
             empty_msg.setFlags(empty_msg.flags() & ~Qt.ItemFlag.ItemIsSelectable)
             self.orders_table.setItem(0, 0, empty_msg)
             self.orders_table.setSpan(0, 0, 1, 6)
@@ -612,8 +632,8 @@ class OrderHistoryDialog(QDialog):
             # Order ID
             order_id_item = QTableWidgetItem(order['OrderID'])
             order_id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            order_id_item.setFont(QFont('Arial', 11, QFont.Weight.Bold))
-            order_id_item.setForeground(QColor('black'))
+            order_id_item.setFont(cached_font(11, bold=True))
+            order_id_item.setForeground(cached_color('black'))
             order_id_item.setFlags(order_id_item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
             self.orders_table.setItem(row, 0, order_id_item)
 
@@ -622,7 +642,7 @@ class OrderHistoryDialog(QDialog):
             date_str = order_date.strftime('%b %d, %Y') if order_date else 'N/A'
             date_item = QTableWidgetItem(date_str)
             date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            date_item.setForeground(QColor('black'))
+            date_item.setForeground(cached_color('black'))
             date_item.setFlags(date_item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
             self.orders_table.setItem(row, 1, date_item)
 
@@ -630,23 +650,23 @@ class OrderHistoryDialog(QDialog):
             total = float(order['TotalFee'])
             total_item = QTableWidgetItem(f"₱{total:.2f}")
             total_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            total_item.setFont(QFont('Arial', 11, QFont.Weight.Bold))
-            total_item.setForeground(QColor('black'))
+            total_item.setFont(cached_font(11, bold=True))
+            total_item.setForeground(cached_color('black'))
             total_item.setFlags(total_item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
             self.orders_table.setItem(row, 2, total_item)
 
             # Payment Method
             payment_item = QTableWidgetItem(order['PaymentMethod'])
             payment_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            payment_item.setForeground(QColor('black'))
+            payment_item.setForeground(cached_color('black'))
             payment_item.setFlags(payment_item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
             self.orders_table.setItem(row, 3, payment_item)
 
             # Status
             status_item = QTableWidgetItem(order['OrderStatus'])
             status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            status_item.setFont(QFont('Arial', 11, QFont.Weight.Bold))
-            status_item.setForeground(QColor(status_colors.get(order['OrderStatus'], '#666')))
+            status_item.setFont(cached_font(11, bold=True))
+            status_item.setForeground(cached_color(status_colors.get(order['OrderStatus'], '#666')))
             status_item.setFlags(status_item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
             self.orders_table.setItem(row, 4, status_item)
 
@@ -692,10 +712,7 @@ class OrderHistoryDialog(QDialog):
 
     def cancel_order(self, order):
         """Cancel an order"""
-        QApplication.instance().setStyleSheet("""
-            QMessageBox QLabel { color: black; }
-            QMessageBox QPushButton { color: black; }
-        """)
+        apply_theme()
 
         confirm = QMessageBox.question(
             self,
@@ -706,13 +723,22 @@ class OrderHistoryDialog(QDialog):
 
         if confirm == QMessageBox.StandardButton.Yes:
             try:
-                cursor = self.db_manager.connection.cursor()
-                cursor.execute(
-                    "UPDATE Orders SET OrderStatus='Cancelled' WHERE OrderID=%s",
-                    (order["OrderID"],)
-                )
-                self.db_manager.connection.commit()
-                cursor.close()
+                # One pooled connection: the order update and the derived tables commit together
+                with self.db_manager.borrow_connection() as conn:
+                    cursor = conn.cursor()
+                    old_status = self.db_manager.sales_rollup.lock_order(cursor, order["OrderID"])
+                    cursor.execute(
+                        "UPDATE Orders SET OrderStatus='Cancelled' WHERE OrderID=%s",
+                        (order["OrderID"],)
+                    )
+                    # Keep the daily sales rollup, order summary and order change feed in step with the status change
+                    self.db_manager.sales_rollup.refresh_for_order(cursor, order["OrderID"], old_status)
+                    self.db_manager.order_summary.refresh_for_order(cursor, order["OrderID"])
+                    self.db_manager.order_feed.record(cursor, order["OrderID"])
+
+                    conn.commit()
+                    cursor.close()
+                self.db_manager.notify_orders_changed()
                 QMessageBox.information(self, "Success", f"Order {order['OrderID']} has been cancelled.")
                 self.load_orders()
             except Exception as e:
@@ -730,9 +756,28 @@ class EnhancedOrderHistoryDialog(QDialog):
         self.customer_id = customer_id
         self.db_manager = db_manager
         self.selected_order_id = None
+        self.orders = {}
         self.initUI()
         self.load_orders()
 
+        # Staff updates to the listed orders refresh the list and timeline while open
+        self.order_watcher = OrderFeedWatcher(self.db_manager, parent=self)
+        self.order_watcher.orders_changed.connect(self.apply_order_changes)
+        self.order_watcher.start()
+
+    def done(self, result):
+        self.order_watcher.stop()
+        super().done(result)
+
+    def apply_order_changes(self, order_ids):
+        """Drop cached timelines of changed orders and reload if any are listed"""
+        self.db_manager.order_timeline.invalidate(order_ids)
+        if not set(self.orders).intersection(order_ids):
+            return
+        self.load_orders()
+        if self.selected_order_id in self.orders:
+            self.load_order_tracking(self.orders[self.selected_order_id])
+
     def initUI(self):
         self.setWindowTitle('Order History - MunchHub')
         self.setMinimumSize(1100, 650)
@@ -902,7 +947,6 @@ class EnhancedOrderHistoryDialog(QDialog):
     def load_orders(self):
         """Load orders from database"""
         try:
-            cursor = self.db_manager.connection.cursor(dictionary=True)
             query = """
                 SELECT o.OrderID, o.TotalFee, o.DeliveryFee, o.OrderStatus, 
                        o.Address, p.PaymentMethod, o.OrderDate
@@ -911,9 +955,15 @@ class EnhancedOrderHistoryDialog(QDialog):
                 WHERE o.CustomerID = %s
                 ORDER BY o.OrderDate DESC
             """
-            cursor.execute(query, (self.customer_id,))
-            orders = cursor.fetchall()
-            cursor.close()
+            with self.db_manager.borrow_connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                cursor.execute(query, (self.customer_id,))
+                orders = cursor.fetchall()
+                cursor.close()
+
+            # Load every listed order's timeline now, so selecting one needs no query
+            self.db_manager.order_timeline.load(order['OrderID'] for order in orders)
+            self.orders = {order['OrderID']: order for order in orders}
 
             self.populate_table(orders)
 
@@ -927,7 +977,7 @@ class EnhancedOrderHistoryDialog(QDialog):
         if not orders:
             empty_msg = QTableWidgetItem("No orders found")
             empty_msg.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            empty_msg.setForeground(QColor('black'))
+            empty_msg.setForeground(cached_color('black'))
             self.orders_table.setItem(0, 0, empty_msg)
             self.orders_table.setSpan(0, 0, 1, 5)
             return
@@ -944,8 +994,8 @@ class EnhancedOrderHistoryDialog(QDialog):
             # Order ID
             order_id_item = QTableWidgetItem(order['OrderID'])
             order_id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            order_id_item.setFont(QFont('Arial', 10, QFont.Weight.Bold))
-            order_id_item.setForeground(QColor('#003274'))
+            order_id_item.setFont(cached_font(10, bold=True))
+            order_id_item.setForeground(cached_color('#003274'))
             order_id_item.setData(Qt.ItemDataRole.UserRole, order)  # Store full order data
             self.orders_table.setItem(row, 0, order_id_item)
 
@@ -954,30 +1004,30 @@ class EnhancedOrderHistoryDialog(QDialog):
             date_str = order_date.strftime('%b %d, %I:%M %p') if order_date else 'N/A'
             date_item = QTableWidgetItem(date_str)
             date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            date_item.setFont(QFont('Arial', 9))
-            date_item.setForeground(QColor('black'))
+            date_item.setFont(cached_font(9))
+            date_item.setForeground(cached_color('black'))
             self.orders_table.setItem(row, 1, date_item)
 
             # Total
             total = float(order['TotalFee']) + float(order['DeliveryFee'])
             total_item = QTableWidgetItem(f"₱{total:.2f}")
             total_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            total_item.setFont(QFont('Arial', 10, QFont.Weight.Bold))
-            total_item.setForeground(QColor('black'))
+            total_item.setFont(cached_font(10, bold=True))
+            total_item.setForeground(cached_color('black'))
             self.orders_table.setItem(row, 2, total_item)
 
             # Payment
             payment_item = QTableWidgetItem(order['PaymentMethod'])
             payment_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            payment_item.setFont(QFont('Arial', 9))
-            payment_item.setForeground(QColor('black'))
+            payment_item.setFont(cached_font(9))
+            payment_item.setForeground(cached_color('black'))
             self.orders_table.setItem(row, 3, payment_item)
 
             # Status
             status_item = QTableWidgetItem(order['OrderStatus'])
             status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            status_item.setFont(QFont('Arial', 10, QFont.Weight.Bold))
-            status_item.setForeground(QColor(status_colors.get(order['OrderStatus'], '#666')))
+            status_item.setFont(cached_font(10, bold=True))
+            status_item.setForeground(cached_color(status_colors.get(order['OrderStatus'], '#666')))
             self.orders_table.setItem(row, 4, status_item)
 
     def on_order_selected(self):
@@ -1027,17 +1077,8 @@ class EnhancedOrderHistoryDialog(QDialog):
 
             self.timeline_layout.addWidget(info_frame)
 
-            # Get tracking records
-            cursor = self.db_manager.connection.cursor(dictionary=True)
-            cursor.execute("""
-                SELECT Status, Notes, UpdateDate
-                FROM OrderTrack
-                WHERE OrderID = %s
-                ORDER BY UpdateDate DESC
-            """, (order_data['OrderID'],))
-
-            tracking_records = cursor.fetchall()
-            cursor.close()
+            # Get tracking records (cached by load_orders)
+            tracking_records = self.db_manager.order_timeline.get(order_data['OrderID'])
 
             if not tracking_records:
                 no_tracking = QLabel('No tracking information available yet')
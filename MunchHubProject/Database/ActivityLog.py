@@ -0,0 +1,205 @@
+"""
+ActivityLog.py - Reads the staff activity log a page at a time
+Place this file in: Database/ActivityLog.py
+
+Both the admin Activity Log screen and the staff Activity Log page read
+StaffActivityLog newest first. Each page is a keyset query on
+(ActivityDate, LogID): the next page starts strictly below the last row
+already shown. MySQL walks the idx_activity_* indexes from that point and
+stops after `limit` rows, so page 500 costs the same as page 1.
+
+Staff and customer names are not joined into every page. The log rows carry
+StaffID and CustomerID, and NameCache resolves the few distinct IDs on a page
+with one IN lookup each, keeping the names for CACHE_TTL seconds. The Users
+joins are only added when the admin searches by name.
+"""
+
+import threading
+import time
+
+from Database.SearchIndexes import search_condition
+
+
+class NameCache:
+    """Staff and customer display names by ID"""
+
+    CACHE_TTL = 300
+
+    QUERIES = {
+        'staff': """
+            SELECT s.StaffID AS id,
+                   CONCAT(COALESCE(u.UFirstName, ''), ' ', COALESCE(u.ULastName, '')) AS name
+            FROM Staffs s
+            JOIN Users u ON s.UserID = u.UserID
+            WHERE s.StaffID IN ({})
+        """,
+        'customer': """
+            SELECT c.CustomerID AS id,
+                   CONCAT(COALESCE(u.UFirstName, ''), ' ', COALESCE(u.ULastName, '')) AS name
+            FROM Customers c
+            JOIN Users u ON c.UserID = u.UserID
+            WHERE c.CustomerID IN ({})
+        """
+    }
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self._names = {kind: {} for kind in self.QUERIES}
+        self._loaded_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """Forget every cached name (after a staff or customer is renamed or removed)"""
+        with self._lock:
+            for names in self._names.values():
+                names.clear()
+            self._loaded_at = time.monotonic()
+
+    def lookup(self, cursor, kind, ids):
+        """
+        Names for `ids` of `kind` ('staff' or 'customer'), fetching the missing ones.
+
+        Returns:
+            dict of id -> name; IDs with no user (or a blank name) map to None
+        """
+        with self._lock:
+            if time.monotonic() - self._loaded_at > self.CACHE_TTL:
+                for names in self._names.values():
+                    names.clear()
+                self._loaded_at = time.monotonic()
+            names = self._names[kind]
+            missing = [i for i in set(ids) if i is not None and i not in names]
+
+        if missing:
+            cursor.execute(self.QUERIES[kind].format(', '.join(['%s'] * len(missing))), missing)
+            found = {row['id']: row['name'].strip() or None for row in cursor.fetchall()}
+            with self._lock:
+                for i in missing:
+                    names[i] = found.get(i)
+
+        with self._lock:
+            return {i: names.get(i) for i in ids}
+
+
+class ActivityLog:
+    """Keyset-paged reads of StaffActivityLog"""
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self.names = NameCache(db_manager)
+
+    def page(self, after_row=None, limit=100, filters=None):
+        """
+        One page of activity logs, newest first.
+        Pass the last row of the previous page as `after_row` to load older rows.
+
+        Args:
+            filters: Optional dict with 'search' (staff / customer name or order ID
+                prefixes), 'status', 'staff_id', 'start_date' and 'end_date' (end exclusive)
+
+        Returns:
+            list of dicts with LogID, StaffID, StaffName, OrderID, CustomerID,
+            CustomerName, Action, Status and ActivityDate
+        Raises:
+            The database error, so a paged table reports it instead of
+            taking an empty page for the end of the log
+        """
+        filters = filters or {}
+        try:
+            # Events still queued in this process would otherwise be missing
+            self.db_manager.activity_writer.flush()
+            self.db_manager.search_indexes.ensure_ready()
+            with self.db_manager.borrow_connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+
+                conditions = []
+                params = []
+                if after_row:
+                    conditions.append("""
+                        (sal.ActivityDate < %s
+                         OR (sal.ActivityDate = %s AND sal.LogID < %s))
+                    """)
+                    params.extend([after_row['ActivityDate'], after_row['ActivityDate'], after_row['LogID']])
+                if filters.get('staff_id'):
+                    conditions.append("sal.StaffID = %s")
+                    params.append(filters['staff_id'])
+                if filters.get('status'):
+                    conditions.append("sal.Status = %s")
+                    params.append(filters['status'])
+                if filters.get('start_date'):
+                    conditions.append("sal.ActivityDate >= %s")
+                    params.append(filters['start_date'])
+                if filters.get('end_date'):
+                    conditions.append("sal.ActivityDate < %s")
+                    params.append(filters['end_date'])
+
+                # Name search is the only filter that needs the Users joins
+                joins = ""
+                search, search_params = search_condition(
+                    filters.get('search'),
+                    ['sal.OrderID', 'su.UFirstName', 'su.ULastName', 'cu.UFirstName', 'cu.ULastName']
+                )
+                if search:
+                    joins = """
+                        LEFT JOIN Staffs s ON sal.StaffID = s.StaffID
+                        LEFT JOIN Users su ON s.UserID = su.UserID
+                        LEFT JOIN Customers c ON sal.CustomerID = c.CustomerID
+                        LEFT JOIN Users cu ON c.UserID = cu.UserID
+                    """
+                    conditions.append(search)
+                    params.extend(search_params)
+
+                where = "WHERE " + " AND ".join(conditions) if conditions else ""
+                query = f"""
+                    SELECT sal.LogID, sal.StaffID, sal.OrderID, sal.CustomerID,
+                           sal.Action, sal.Status, sal.ActivityDate
+                    FROM StaffActivityLog sal
+                    {joins}
+                    {where}
+                    ORDER BY sal.ActivityDate DESC, sal.LogID DESC
+                    LIMIT %s
+                """
+                params.append(limit)
+
+                cursor.execute(query, params)
+                results = cursor.fetchall()
+
+                staff_names = self.names.lookup(cursor, 'staff', [r['StaffID'] for r in results])
+                customer_names = self.names.lookup(cursor, 'customer', [r['CustomerID'] for r in results])
+                cursor.close()
+
+            for result in results:
+                result['StaffName'] = (staff_names.get(result['StaffID'])
+                                       or f"Staff {result.get('StaffID') or 'Unknown'}")
+                result['CustomerName'] = (customer_names.get(result['CustomerID'])
+                                          or f"Customer {result.get('CustomerID') or 'Unknown'}")
+                if not result.get('Action'):
+                    result['Action'] = 'Unknown Action'
+                if not result.get('Status'):
+                    result['Status'] = 'Unknown'
+                if not result.get('OrderID'):
+                    result['OrderID'] = 'N/A'
+
+            return results
+
+        except Exception as e:
+            print(f"Error getting staff activity logs: {e}")
+            raise
+
+    def recent(self, limit=100):
+        """Newest `limit` log entries with the lowercase keys of the old activity summary"""
+        try:
+            rows = self.page(limit=limit)
+        except Exception:
+            return []
+        return [
+            {
+                'staff_name': row['StaffName'],
+                'customer': row['CustomerName'],
+                'order_id': row['OrderID'],
+                'action': row['Action'],
+                'status': row['Status'],
+                'timestamp': row['ActivityDate']
+            }
+            for row in rows
+        ]
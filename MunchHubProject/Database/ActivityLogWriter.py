@@ -0,0 +1,322 @@
+"""
+ActivityLogWriter.py - Buffered, append-only writer for StaffActivityLog
+Place this file in: Database/ActivityLogWriter.py
+
+Staff actions (accept, status update, delivered) used to insert their log
+row inside the order transaction. Now `record()` only appends the event to
+an in-memory queue plus one line of a local spool file, and returns. A
+background thread writes the queue to the database as a single multi-row
+INSERT every FLUSH_INTERVAL seconds, or sooner once BATCH_SIZE events are
+waiting.
+
+Each event gets its LogID when it is recorded (from the cached IdAllocator
+block), and the INSERT absorbs a duplicate LogID with ON DUPLICATE KEY
+UPDATE. Replaying a spool file twice is therefore harmless, while any other
+bad row (unknown StaffID, bad date...) is an error instead of a warning.
+Such a batch is retried row by row, and rows MySQL still rejects are moved
+to activity-rejected.jsonl with a message, so one bad event neither blocks
+the queue nor disappears silently.
+
+Each running instance holds an exclusive lock on activity-<pid>.lock next to
+its spool. After a crash, the next start replays only the spools whose lock
+it can take, i.e. those of processes that are no longer running. A spool
+being replayed is renamed to activity-<pid>.jsonl.replay-<replaying pid>;
+if the replaying instance dies too, the next start replays it again.
+"""
+
+import atexit
+import glob
+import json
+import os
+import threading
+from datetime import datetime
+
+from mysql.connector import DataError, IntegrityError
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def _acquire_lock(path):
+    """Open `path` and take a non-blocking exclusive lock; returns the open file or None"""
+    try:
+        handle = open(path, 'a+')
+    except OSError:
+        return None
+    try:
+        if fcntl:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        return handle
+    except OSError:
+        handle.close()
+        return None
+
+
+def _release_lock(handle, path):
+    """Drop a lock taken with _acquire_lock() and delete its file"""
+    handle.close()
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class ActivityLogWriter:
+    """Queues activity events and writes them to StaffActivityLog in batches"""
+
+    FLUSH_INTERVAL = 2.0
+    BATCH_SIZE = 50
+    SPOOL_DIR = os.path.join(os.path.expanduser('~'), '.munchhub', 'activity_spool')
+
+    INSERT_SQL = """
+        INSERT INTO StaffActivityLog
+        (LogID, StaffID, OrderID, CustomerID, Action, Status, ActivityDate)
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE LogID = LogID
+    """
+
+    def __init__(self, db_manager, spool_dir=None):
+        self.db_manager = db_manager
+        self.spool_dir = spool_dir or self.SPOOL_DIR
+        self.spool_path = os.path.join(self.spool_dir, f"activity-{os.getpid()}.jsonl")
+        self.lock_path = os.path.join(self.spool_dir, f"activity-{os.getpid()}.lock")
+        self._owner_lock = None
+        self._queue = []
+        self._lock = threading.Lock()         # guards the queue and the spool file
+        self._flush_lock = threading.Lock()   # one flush at a time
+        self._wake = threading.Condition(self._lock)
+        self._thread = None
+        self._stopping = False
+
+    def start(self):
+        """Replay spool files left by earlier runs and start the background flusher"""
+        if self._thread:
+            return
+        try:
+            os.makedirs(self.spool_dir, exist_ok=True)
+        except OSError as e:
+            print(f"⚠️ Warning: Activity spool unavailable ({e}); logging without it")
+        # Held until exit: tells other instances this spool is still in use
+        self._owner_lock = self._owner_lock or _acquire_lock(self.lock_path)
+        self._replay_spools()
+
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="ActivityLogWriter", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        """Stop the flusher and write out anything still queued"""
+        thread = self._thread
+        if thread:
+            with self._lock:
+                self._stopping = True
+                self._wake.notify()
+            thread.join(timeout=self.FLUSH_INTERVAL * 2)
+            self._thread = None
+        # Keep the lock while events remain spooled, so no other instance replays them early
+        if self.flush() and self._owner_lock:
+            _release_lock(self._owner_lock, self.lock_path)
+            self._owner_lock = None
+
+    def record(self, staff_id, order_id, customer_id, action, status):
+        """
+        Queue one activity event. Call it after the order change has been committed,
+        so a rolled-back change never leaves a log entry behind.
+
+        Returns:
+            The LogID assigned to the event, or None if it could not be queued
+        """
+        try:
+            event = {
+                'LogID': self.db_manager.ids.next_id('log'),
+                'StaffID': staff_id,
+                'OrderID': order_id,
+                'CustomerID': customer_id,
+                'Action': action,
+                'Status': status,
+                'ActivityDate': datetime.now().isoformat(sep=' ', timespec='seconds')
+            }
+        except Exception as e:
+            print(f"⚠️ Warning: Failed to log staff activity: {e}")
+            return None
+
+        with self._lock:
+            self._queue.append(event)
+            self._append_spool(event)
+            if len(self._queue) >= self.BATCH_SIZE:
+                self._wake.notify()
+        return event['LogID']
+
+    def pending(self):
+        """Number of events not yet written to the database"""
+        with self._lock:
+            return len(self._queue)
+
+    def flush(self):
+        """
+        Write every queued event now (readers call this so they see their own writes).
+
+        Returns:
+            True when the queue was written (or was empty)
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch = list(self._queue)
+            if not batch:
+                return True
+
+            if not self._insert(batch):
+                return False
+
+            with self._lock:
+                # Events recorded while the batch was being written stay queued
+                del self._queue[:len(batch)]
+                self._rewrite_spool(self._queue)
+            return True
+
+    def _run(self):
+        """Background loop: flush on the timer or when the batch threshold is hit"""
+        while True:
+            with self._lock:
+                if not self._stopping and len(self._queue) < self.BATCH_SIZE:
+                    self._wake.wait(self.FLUSH_INTERVAL)
+                if self._stopping:
+                    return
+            self.flush()
+
+    def _insert(self, events):
+        """Multi-row INSERT of `events`; leaves them queued if the database is unreachable"""
+        try:
+            with self.db_manager.borrow_connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    cursor.executemany(self.INSERT_SQL, [self._row(e) for e in events])
+                    conn.commit()
+                except (IntegrityError, DataError):
+                    # Some row is bad: write the others one by one and set the bad ones aside
+                    conn.rollback()
+                    rejected = []
+                    for event in events:
+                        try:
+                            cursor.execute(self.INSERT_SQL, self._row(event))
+                        except (IntegrityError, DataError) as e:
+                            rejected.append(dict(event, Error=str(e)))
+                    conn.commit()
+                    self._reject(rejected)
+                cursor.close()
+            return True
+        except Exception as e:
+            print(f"⚠️ Warning: Activity log flush failed, {len(events)} event(s) kept for retry: {e}")
+            return False
+
+    @staticmethod
+    def _row(event):
+        return (event['LogID'], event['StaffID'], event['OrderID'], event['CustomerID'],
+                event['Action'], event['Status'], event['ActivityDate'])
+
+    def _reject(self, events):
+        """Keep events MySQL refused in activity-rejected.jsonl for someone to look at"""
+        path = os.path.join(self.spool_dir, 'activity-rejected.jsonl')
+        for event in events:
+            print(f"⚠️ Warning: Activity log event {event['LogID']} rejected: {event['Error']}")
+        try:
+            with open(path, 'a', encoding='utf-8') as rejected:
+                rejected.writelines(json.dumps(event) + '\n' for event in events)
+        except OSError as e:
+            print(f"⚠️ Warning: Could not save rejected activity events: {e}")
+
+    # Spool file (caller holds self._lock)
+    def _append_spool(self, event):
+        try:
+            with open(self.spool_path, 'a', encoding='utf-8') as spool:
+                spool.write(json.dumps(event) + '\n')
+        except OSError as e:
+            print(f"⚠️ Warning: Could not write activity spool: {e}")
+
+    def _rewrite_spool(self, events):
+        try:
+            if not events:
+                if os.path.exists(self.spool_path):
+                    os.remove(self.spool_path)
+                return
+            temp_path = self.spool_path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as spool:
+                spool.writelines(json.dumps(event) + '\n' for event in events)
+            os.replace(temp_path, self.spool_path)
+        except OSError as e:
+            print(f"⚠️ Warning: Could not update activity spool: {e}")
+
+    def _replay_spools(self):
+        """Insert events from spool files written by runs that did not shut down cleanly"""
+        # Per-instance names only: activity-rejected.jsonl is not a spool
+        candidates = []
+        for path in glob.glob(os.path.join(self.spool_dir, 'activity-[0-9]*.jsonl')):
+            if path != self.spool_path:
+                candidates.append((path, path[:-len('.jsonl')] + '.lock'))
+        # Replays another instance claimed but never finished (it crashed mid-replay)
+        for path in glob.glob(os.path.join(self.spool_dir, 'activity-[0-9]*.jsonl.replay-*')):
+            replayer = path.rsplit('.replay-', 1)[1]
+            if replayer == str(os.getpid()):
+                candidates.append((path, None))  # an earlier process that had our pid
+            else:
+                candidates.append((path, os.path.join(self.spool_dir, f"activity-{replayer}.lock")))
+
+        for path, lock_path in candidates:
+            self._replay_spool(path, lock_path)
+
+    def _replay_spool(self, path, lock_path):
+        """Replay one spool if the instance holding `lock_path` is gone"""
+        # Only spools whose owner is gone: its lock is free (or it never had one)
+        owner_lock = None
+        if lock_path and os.path.exists(lock_path):
+            owner_lock = _acquire_lock(lock_path)
+            if owner_lock is None:
+                return  # that instance is still running
+
+        # Claim it under our pid before reading, so no other instance replays it
+        # meanwhile; if we crash mid-replay, the next start finds it as a stale replay
+        claimed = f"{path.rsplit('.replay-', 1)[0]}.replay-{os.getpid()}"
+        try:
+            os.replace(path, claimed)
+        except OSError:
+            if owner_lock:
+                owner_lock.close()
+            return
+
+        events = []
+        try:
+            with open(claimed, encoding='utf-8') as spool:
+                for line in spool:
+                    line = line.strip()
+                    if line:
+                        try:
+                            events.append(json.loads(line))
+                        except ValueError:
+                            pass  # torn last line from the crash
+        except OSError as e:
+            print(f"⚠️ Warning: Could not read activity spool {claimed}: {e}")
+            if owner_lock:
+                owner_lock.close()
+            return
+
+        if events and not self._insert(events):
+            # Keep them queued (and in our own spool) for the next flush
+            with self._lock:
+                for event in events:
+                    self._queue.append(event)
+                    self._append_spool(event)
+        try:
+            os.remove(claimed)
+        except OSError:
+            pass
+        if owner_lock:
+            _release_lock(owner_lock, lock_path)
+        if events:
+            print(f"Replayed {len(events)} spooled activity log event(s)")
@@ -0,0 +1,193 @@
+"""
+AuthService.py - One-query login for admins, staff and customers
+Place this file in: Database/AuthService.py
+
+Login used to try admin, then staff, then customer, each with its own
+lookup of the same username. Here every account that could own the
+username comes back from one statement (Users with its Staffs/Customers
+rows, plus a matching Admins row when that table exists), and the first
+role whose password matches wins, in the same admin > staff > customer
+order as before.
+
+Usernames that match no account are remembered for a few seconds, so a
+burst of attempts against an unknown username (whatever the password) does
+not reach the database again. Registering the username clears it.
+
+Passwords are checked with the DatabaseManager's PasswordHasher, and a
+stored legacy hash (or plain text) is rewritten in the current scheme on a
+successful login. Hashing is slow on purpose, so call authenticate() from a
+worker thread (LoginWindow runs it through a DataLoader).
+"""
+
+import threading
+import time
+
+from mysql.connector import Error
+
+
+USER_ACCOUNTS = """
+    SELECT u.UserID, u.Username, u.Password, u.UFirstName as FirstName,
+           u.UMiddleName as MiddleName, u.ULastName as LastName, u.PhoneNum,
+           s.StaffID, c.CustomerID, c.Address, NULL as AdminID
+    FROM Users u
+    LEFT JOIN Staffs s ON u.UserID = s.UserID
+    LEFT JOIN Customers c ON u.UserID = c.UserID
+    WHERE u.Username = %s
+"""
+
+# First SELECT of the UNION: MySQL names the result columns after it, so every
+# column needs the same name as in USER_ACCOUNTS
+ADMIN_ACCOUNTS = """
+    SELECT NULL as UserID, Username, Password, FirstName, MiddleName, LastName, PhoneNum,
+           NULL as StaffID, NULL as CustomerID, NULL as Address, AdminID
+    FROM Admins
+    WHERE Username = %s
+"""
+
+# Roles in the order they are tried
+ROLES = ('admin', 'staff', 'customer')
+
+
+class AuthService:
+    """Resolves a username and password to an admin, staff or customer account"""
+
+    # Seconds an unknown username is answered from memory
+    FAILURE_TTL = 5
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self._failures = {}  # unknown username (lower case) -> expiry time
+        self._lock = threading.Lock()
+
+    def authenticate(self, username, password, role=None):
+        """
+        Log in with one database round trip.
+
+        Args:
+            role: Only accept this role ('admin', 'staff' or 'customer');
+                None accepts the first matching role
+        Returns:
+            (success, account data with a 'role' key, message)
+        """
+        failure_key = username.lower()
+        if self._recently_failed(failure_key):
+            return False, None, "Invalid username or password!"
+
+        try:
+            accounts = self._fetch_accounts(username)
+        except Error as e:
+            print(f"Error authenticating {username}: {e}")
+            return False, None, f"Database error: {str(e)}"
+
+        if not accounts:
+            self._remember_failure(failure_key)
+            return False, None, "Invalid username or password!"
+
+        checked = {}  # stored password -> (matches, needs_upgrade); staff and customer share one
+        for account_role, account in self._candidates(accounts):
+            if role is not None and account_role != role:
+                continue
+            stored_password = account['Password']
+            if stored_password not in checked:
+                checked[stored_password] = self.db_manager.passwords.verify(stored_password, password)
+            matches, needs_upgrade = checked[stored_password]
+            if matches:
+                if needs_upgrade:
+                    self._upgrade_password(account_role, account, password)
+                print(f"{account_role.capitalize()} {username} authenticated successfully")
+                return True, self._account_data(account_role, account), "Login successful!"
+
+        return False, None, "Invalid username or password!"
+
+    def forget(self, username):
+        """Drop a remembered unknown `username` (e.g. after it is registered)"""
+        with self._lock:
+            self._failures.pop(username.lower(), None)
+
+    def _fetch_accounts(self, username):
+        query = USER_ACCOUNTS
+        params = (username,)
+        if self.db_manager.schema.ensure_loaded().has_admins_table:
+            query = ADMIN_ACCOUNTS + " UNION ALL " + USER_ACCOUNTS
+            params = (username, username)
+
+        with self.db_manager.borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(query, params)
+            accounts = cursor.fetchall()
+            cursor.close()
+        return accounts
+
+    @staticmethod
+    def _candidates(accounts):
+        """(role, account) pairs in login priority order"""
+        candidates = []
+        for account in accounts:
+            if account['AdminID']:
+                candidates.append(('admin', account))
+            if account['StaffID']:
+                candidates.append(('staff', account))
+            if account['CustomerID']:
+                candidates.append(('customer', account))
+        candidates.sort(key=lambda candidate: ROLES.index(candidate[0]))
+        return candidates
+
+    def _upgrade_password(self, role, account, password):
+        """Store `password` in the current hash scheme after a legacy match"""
+        if role == 'admin':
+            table, key_column, key = 'Admins', 'AdminID', account['AdminID']
+        else:
+            table, key_column, key = 'Users', 'UserID', account['UserID']
+
+        new_hash = self.db_manager.hash_password(password, table)
+        if new_hash == account['Password']:
+            return  # Column still too narrow for the new scheme
+        try:
+            with self.db_manager.borrow_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f"UPDATE {table} SET Password = %s WHERE {key_column} = %s",
+                               (new_hash, key))
+                conn.commit()
+                cursor.close()
+            print(f"Upgraded password hash for {account['Username']}")
+        except Error as e:
+            # The login itself still succeeds; the upgrade is retried next time
+            print(f"Error upgrading password hash: {e}")
+
+    @staticmethod
+    def _account_data(role, account):
+        full_name = f"{account['FirstName']} {account.get('MiddleName') or ''} {account['LastName']}".strip()
+        data = {
+            'username': account['Username'],
+            'full_name': full_name,
+            'phone_number': account.get('PhoneNum') or '',
+            'role': role
+        }
+        if role == 'admin':
+            data['admin_id'] = account['AdminID']
+        else:
+            data['user_id'] = account['UserID']
+        if role == 'staff':
+            data['staff_id'] = account['StaffID']
+        elif role == 'customer':
+            data['customer_id'] = account['CustomerID']
+            data['address'] = account['Address']
+        return data
+
+    def _recently_failed(self, key):
+        with self._lock:
+            expiry = self._failures.get(key)
+            if expiry is None:
+                return False
+            if expiry < time.monotonic():
+                del self._failures[key]
+                return False
+            return True
+
+    def _remember_failure(self, key):
+        now = time.monotonic()
+        with self._lock:
+            # Keep the map small under a flood of distinct attempts
+            if len(self._failures) > 1000:
+                self._failures = {k: v for k, v in self._failures.items() if v > now}
+            self._failures[key] = now + self.FAILURE_TTL
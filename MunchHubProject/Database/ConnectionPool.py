@@ -0,0 +1,204 @@
+"""
+ConnectionPool.py - Pooled MySQL connections for MunchHub
+Place this file in: Database/ConnectionPool.py
+
+Controllers borrow a connection for the length of one unit of work and hand
+it back afterwards, so concurrent windows/threads no longer queue behind a
+single shared socket.
+"""
+
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+import mysql.connector
+from mysql.connector import Error
+
+
+class PoolExhaustedError(Error):
+    """Raised when no pooled connection becomes free within the timeout"""
+
+
+class ConnectionPool:
+    """Fixed-size, thread-safe pool of MySQL connections with health checks"""
+
+    def __init__(self, host, database, user, password, pool_size=5,
+                 borrow_timeout=10, health_check_interval=30):
+        """
+        Args:
+            pool_size: Maximum number of open connections
+            borrow_timeout: Seconds to wait for a free connection before failing
+            health_check_interval: Idle seconds after which a connection is pinged
+                                   (and reconnected if stale) before being handed out
+        """
+        self.config = {
+            'host': host,
+            'database': database,
+            'user': user,
+            'password': password
+        }
+        self.pool_size = pool_size
+        self.borrow_timeout = borrow_timeout
+        self.health_check_interval = health_check_interval
+
+        self._idle = queue.LifoQueue(maxsize=pool_size)
+        self._last_used = {}
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _open_connection(self):
+        """Open a brand new connection"""
+        return mysql.connector.connect(**self.config)
+
+    def warm_up(self, count=1):
+        """Open `count` connections up front so the first borrowers don't pay for it"""
+        for _ in range(min(count, self.pool_size)):
+            with self._lock:
+                if self._created >= self.pool_size:
+                    return
+                self._created += 1
+            try:
+                connection = self._open_connection()
+            except Error:
+                with self._lock:
+                    self._created -= 1
+                raise
+            self._release(connection)
+
+    def _is_healthy(self, connection):
+        """Check a pooled connection, reconnecting it if the server dropped it"""
+        last_used = self._last_used.get(id(connection), 0)
+        if time.monotonic() - last_used < self.health_check_interval:
+            return True
+        try:
+            connection.ping(reconnect=True, attempts=2, delay=0)
+            return True
+        except Error as e:
+            print(f"Discarding stale pooled connection: {e}")
+            return False
+
+    def _discard(self, connection):
+        """Close a connection and free its slot in the pool"""
+        self._last_used.pop(id(connection), None)
+        try:
+            connection.close()
+        except Error:
+            pass
+        with self._lock:
+            self._created -= 1
+
+    def acquire(self):
+        """Take a connection from the pool, opening a new one if there is room"""
+        if self._closed:
+            raise Error(msg="Connection pool is closed")
+
+        deadline = time.monotonic() + self.borrow_timeout
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                connection = None
+
+            if connection is not None:
+                if self._is_healthy(connection):
+                    return connection
+                self._discard(connection)
+                continue
+
+            with self._lock:
+                can_open = self._created < self.pool_size
+                if can_open:
+                    self._created += 1
+            if can_open:
+                try:
+                    return self._open_connection()
+                except Error:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise PoolExhaustedError(
+                    msg=f"No database connection available after {self.borrow_timeout}s "
+                        f"(pool size {self.pool_size})"
+                )
+            try:
+                connection = self._idle.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            if self._is_healthy(connection):
+                return connection
+            self._discard(connection)
+
+    def _release(self, connection):
+        """Put a connection back in the idle queue"""
+        if self._closed:
+            self._discard(connection)
+            return
+        self._last_used[id(connection)] = time.monotonic()
+        self._idle.put_nowait(connection)
+
+    def release(self, connection):
+        """Return a borrowed connection, discarding it if it is broken"""
+        try:
+            if not connection.is_connected():
+                self._discard(connection)
+                return
+            # Never hand an open transaction to the next borrower
+            if connection.in_transaction:
+                connection.rollback()
+        except Error as e:
+            print(f"Discarding pooled connection on release: {e}")
+            self._discard(connection)
+            return
+        self._release(connection)
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a connection for a block of work.
+
+        The connection is rolled back if the block raises, and always returned
+        to the pool afterwards. Callers commit explicitly.
+        """
+        connection = self.acquire()
+        try:
+            yield connection
+        except Exception:
+            try:
+                connection.rollback()
+            except Error:
+                pass
+            raise
+        finally:
+            self.release(connection)
+
+    @contextmanager
+    def cursor(self, dictionary=False):
+        """Borrow a connection and open a cursor on it; yields (connection, cursor)"""
+        with self.connection() as connection:
+            cursor = connection.cursor(dictionary=dictionary)
+            try:
+                yield connection, cursor
+            finally:
+                cursor.close()
+
+    def stats(self):
+        """Current pool usage, handy for debugging"""
+        with self._lock:
+            created = self._created
+        idle = self._idle.qsize()
+        return {'size': self.pool_size, 'open': created, 'idle': idle, 'in_use': created - idle}
+
+    def close(self):
+        """Close every idle connection; borrowed ones are closed when returned"""
+        self._closed = True
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(connection)
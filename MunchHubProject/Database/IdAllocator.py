@@ -0,0 +1,163 @@
+"""
+IdAllocator.py - Central ID allocation for MunchHub tables
+Place this file in: Database/IdAllocator.py
+
+Replaces the "SELECT ... ORDER BY ID DESC LIMIT 1" + 1 pattern. Numbers are
+reserved atomically from the IdSequences counter table, so two concurrent
+checkouts can never be given the same ID.
+
+Customer-visible sequences (orders, tracking, users...) are gapless. Pass
+the caller's cursor and the number is taken with one UPDATE inside the
+caller's own transaction: no second connection, no extra commit, and a
+rollback gives the number back. The trade-off is that the counter row stays
+locked until the caller commits, so two checkouts take their order numbers
+one after the other.
+
+Activity-log IDs are only seen by the database, so they are reserved in
+blocks on a separate connection and handed out from memory; numbers left in
+a block when the app exits are skipped.
+
+DatabaseManager.connect() calls prepare(), which creates the counter table
+and syncs every counter, so no DDL or table scan ever runs inside an order
+transaction.
+"""
+
+import threading
+
+
+# name: (prefix, table, id column, zero-padded width)
+SEQUENCES = {
+    'user': ('U', 'Users', 'UserID', 3),
+    'customer': ('C', 'Customers', 'CustomerID', 3),
+    'staff': ('S', 'Staffs', 'StaffID', 3),
+    'order': ('O', 'Orders', 'OrderID', 3),
+    'payment': ('P', 'Payments', 'PaymentID', 3),
+    'track': ('T', 'OrderTrack', 'TrackID', 3),
+    'log': ('L', 'StaffActivityLog', 'LogID', 3),
+}
+
+# Sequences that may skip numbers, with how many to reserve per round trip
+BLOCK_SIZES = {
+    'log': 10,
+}
+
+
+class IdAllocator:
+    """Hands out prefixed IDs (O001, T001, L001...) from the IdSequences counters"""
+
+    def __init__(self, db_manager, block_sizes=None):
+        """
+        Args:
+            block_sizes: Overrides for BLOCK_SIZES; sequences not listed reserve
+                         one number at a time (gapless)
+        """
+        self.db_manager = db_manager
+        self.block_sizes = dict(BLOCK_SIZES, **(block_sizes or {}))
+        self._blocks = {}  # name -> [next number, end of block (exclusive)]
+        self._table_ready = False
+        self._synced = set()
+        self._lock = threading.Lock()
+
+    def prepare(self):
+        """Create the counter table and bring every counter up to date (once, at connect)"""
+        with self.db_manager.borrow_connection() as conn:
+            cursor = conn.cursor()
+            self._ensure_table(cursor)
+            for name in SEQUENCES:
+                self._sync_sequence(cursor, name)
+            conn.commit()
+            cursor.close()
+
+    def _ensure_table(self, cursor=None):
+        """
+        Create the counter table on first use. DDL commits implicitly, so
+        without a cursor it runs on its own pooled connection.
+        """
+        if self._table_ready:
+            return
+        if cursor is None:
+            with self.db_manager.borrow_connection() as conn:
+                cursor = conn.cursor()
+                self._ensure_table(cursor)
+                cursor.close()
+            return
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS IdSequences (
+                SeqName VARCHAR(30) NOT NULL PRIMARY KEY,
+                NextValue INT UNSIGNED NOT NULL
+            )
+        """)
+        self._table_ready = True
+
+    def _sync_sequence(self, cursor, name):
+        """
+        Make sure the counter is ahead of every ID already in the table.
+        Runs once per sequence per process; numeric MAX so O1000 sorts after O999.
+        """
+        prefix, table, column, _ = SEQUENCES[name]
+        cursor.execute(f"""
+            INSERT INTO IdSequences (SeqName, NextValue)
+            SELECT %s, COALESCE(MAX(CAST(SUBSTRING({column}, 2) AS UNSIGNED)), 0) + 1
+            FROM {table}
+            WHERE {column} LIKE %s
+            ON DUPLICATE KEY UPDATE NextValue = GREATEST(NextValue, VALUES(NextValue))
+        """, (name, f"{prefix}%"))
+        self._synced.add(name)
+
+    def _reserve(self, cursor, name, count):
+        """Reserve `count` numbers with the given cursor (no commit); returns the first one"""
+        if name not in self._synced:
+            self._sync_sequence(cursor, name)
+        # LAST_INSERT_ID(expr) hands the new value back with the UPDATE's reply
+        cursor.execute(
+            "UPDATE IdSequences SET NextValue = LAST_INSERT_ID(NextValue + %s) WHERE SeqName = %s",
+            (count, name)
+        )
+        return cursor.lastrowid - count
+
+    def _reserve_block(self, name, count):
+        """Atomically reserve `count` numbers on a pooled connection; returns the first one"""
+        with self.db_manager.borrow_connection() as conn:
+            cursor = conn.cursor()
+            self._ensure_table(cursor)
+            start = self._reserve(cursor, name, count)
+            conn.commit()
+            cursor.close()
+        return start
+
+    def next_number(self, name, cursor=None):
+        """
+        Next raw number for a sequence.
+
+        Args:
+            cursor: The caller's cursor, to take a gapless number inside its
+                    transaction. Block-cached sequences ignore it.
+        """
+        if name not in SEQUENCES:
+            raise KeyError(f"Unknown ID sequence: {name}")
+
+        if cursor is not None and self.block_sizes.get(name, 1) == 1:
+            self._ensure_table()
+            return self._reserve(cursor, name, 1)
+
+        with self._lock:
+            block = self._blocks.get(name)
+            if not block or block[0] >= block[1]:
+                size = self.block_sizes.get(name, 1)
+                start = self._reserve_block(name, size)
+                block = [start, start + size]
+                self._blocks[name] = block
+            number = block[0]
+            block[0] += 1
+            return number
+
+    def next_id(self, name, cursor=None):
+        """Next formatted ID for a sequence, e.g. next_id('order', cursor) -> 'O042'"""
+        prefix, _, _, width = SEQUENCES[name]
+        return f"{prefix}{str(self.next_number(name, cursor)).zfill(width)}"
+
+    def reset_cache(self):
+        """Forget cached blocks (e.g. after restoring a backup) so the next call resyncs"""
+        with self._lock:
+            self._blocks.clear()
+            self._synced.clear()
@@ -0,0 +1,102 @@
+"""
+MenuCatalog.py - Shared in-memory menu and category cache
+Place this file in: Database/MenuCatalog.py
+
+Every customer window, the admin menu screens and the PDF report read the
+same menu. Instead of each running its own join, they all read one
+CatalogSnapshot held by the DatabaseManager.
+
+The catalog carries a version number. Menu and category writes call
+`invalidate()`, which bumps it, and the next reader rebuilds the snapshot
+once. Snapshots are never modified after they are built (rows are read-only
+mappings), so every window in the process can share the same one safely.
+Edits made from another machine are picked up after MAX_AGE seconds.
+"""
+
+import threading
+import time
+from types import MappingProxyType
+
+
+class CatalogSnapshot:
+    """Immutable view of the menu at one catalog version"""
+
+    def __init__(self, version, items, categories):
+        self.version = version
+        # All menu items (available or not), ordered by MenuID
+        self.items = tuple(MappingProxyType(item) for item in items)
+        # All categories, ordered by CategoryID
+        self.categories = tuple(MappingProxyType(category) for category in categories)
+
+        # What customers see: available items by category and name, and only
+        # the categories that have at least one of them
+        self.available_items = tuple(sorted(
+            (item for item in self.items if item['isAvailable'] == 1),
+            key=lambda item: (item['CategoryName'], item['ItemName'])
+        ))
+        available_ids = {item['CategoryID'] for item in self.available_items}
+        self.available_categories = tuple(sorted(
+            (category for category in self.categories if category['CategoryID'] in available_ids),
+            key=lambda category: category['CategoryName']
+        ))
+
+
+class MenuCatalog:
+    """Versioned, process-wide cache of MenuItems and Categories"""
+
+    # Rebuild at least this often so edits from other machines show up
+    MAX_AGE = 60
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self.version = 0
+        self._snapshot = None
+        self._loaded_at = 0
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """Mark the cached catalog stale after a menu or category write"""
+        with self._lock:
+            self.version += 1
+
+    def snapshot(self):
+        """
+        Current catalog snapshot, rebuilt only when the version changed
+        (or it is older than MAX_AGE). Raises if the database read fails.
+        """
+        with self._lock:
+            snapshot = self._snapshot
+            if (snapshot is not None and snapshot.version == self.version
+                    and time.monotonic() - self._loaded_at < self.MAX_AGE):
+                return snapshot
+
+            version = self.version
+            items, categories = self._read_catalog()
+            self._snapshot = CatalogSnapshot(version, items, categories)
+            self._loaded_at = time.monotonic()
+            return self._snapshot
+
+    def _read_catalog(self):
+        """Read every menu item and category in one borrowed connection"""
+        # Older databases have no Description column
+        description = self.db_manager.schema.ensure_loaded().menu_description_sql
+
+        with self.db_manager.borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(f"""
+                SELECT m.MenuID, m.ItemName, m.Price, {description},
+                       m.isAvailable, m.CategoryID, c.CategoryName
+                FROM MenuItems m
+                JOIN Categories c ON m.CategoryID = c.CategoryID
+                ORDER BY m.MenuID
+            """)
+            items = cursor.fetchall()
+
+            cursor.execute("""
+                SELECT CategoryID, CategoryName, Description
+                FROM Categories
+                ORDER BY CategoryID
+            """)
+            categories = cursor.fetchall()
+            cursor.close()
+        return items, categories
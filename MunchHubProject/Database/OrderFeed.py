@@ -0,0 +1,112 @@
+"""
+OrderFeed.py - Change log of order writes for live views
+Place this file in: Database/OrderFeed.py
+
+Every write that touches an order also appends its OrderID to the
+OrderChanges table, in the same transaction. Views remember the last
+ChangeID they saw and ask only for newer rows, which is a primary key range
+scan, so polling every few seconds costs next to nothing and works across
+every running copy of the app.
+
+ChangeIDs are allocated at insert time but become visible at commit, so a
+reader could step past a change whose transaction commits a moment later.
+To cover that, the read position only advances past changes older than a
+short settle window; newer ones are delivered again on the next poll.
+"""
+
+
+class OrderFeed:
+    """Records and reads the OrderChanges log"""
+
+    def __init__(self, db_manager, keep_days=2, settle_seconds=2):
+        """
+        Args:
+            keep_days: Change rows older than this are pruned on startup
+            settle_seconds: Changes younger than this are re-read on the next call
+        """
+        self.db_manager = db_manager
+        self.keep_days = keep_days
+        self.settle_seconds = settle_seconds
+        self._ready = False
+
+    def ensure_ready(self):
+        """
+        Create the change log on first use and prune old rows.
+        Runs on its own pooled connection because DDL commits implicitly.
+        """
+        if self._ready:
+            return
+        with self.db_manager.borrow_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS OrderChanges (
+                    ChangeID BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
+                    OrderID VARCHAR(20) NOT NULL,
+                    ChangedAt DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    KEY idx_changes_date (ChangedAt)
+                )
+            """)
+            cursor.execute(
+                "DELETE FROM OrderChanges WHERE ChangedAt < NOW() - INTERVAL %s DAY",
+                (self.keep_days,)
+            )
+            conn.commit()
+            cursor.close()
+        self._ready = True
+
+    def record(self, cursor, order_id):
+        """
+        Log a change to `order_id`.
+
+        Call this with the caller's cursor before committing, so the change
+        only becomes visible together with the write itself.
+        """
+        self.ensure_ready()
+        cursor.execute("INSERT INTO OrderChanges (OrderID) VALUES (%s)", (order_id,))
+
+    def latest_change(self):
+        """ChangeID of the newest change, the starting point for a new reader"""
+        try:
+            self.ensure_ready()
+            with self.db_manager.borrow_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT COALESCE(MAX(ChangeID), 0) FROM OrderChanges")
+                change_id = cursor.fetchone()[0]
+                cursor.close()
+            return change_id
+        except Exception as e:
+            print(f"Error reading order feed position: {e}")
+            return 0
+
+    def changes_since(self, change_id, limit=500):
+        """
+        Orders changed after `change_id`.
+
+        Returns:
+            (position to pass next time, list of distinct OrderIDs in change order).
+            At most `limit` changes are read per call; the rest come next time.
+        """
+        try:
+            self.ensure_ready()
+            with self.db_manager.borrow_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT ChangeID, OrderID, ChangedAt < NOW() - INTERVAL %s SECOND as Settled
+                    FROM OrderChanges
+                    WHERE ChangeID > %s
+                    ORDER BY ChangeID
+                    LIMIT %s
+                """, (self.settle_seconds, change_id, limit))
+                rows = cursor.fetchall()
+                cursor.close()
+        except Exception as e:
+            print(f"Error reading order feed: {e}")
+            return change_id, []
+
+        position = change_id
+        for row_id, _, settled in rows:
+            if not settled:
+                break
+            position = row_id
+        order_ids = list(dict.fromkeys(order_id for _, order_id, _ in rows))
+        return position, order_ids
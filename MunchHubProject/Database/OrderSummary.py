@@ -0,0 +1,189 @@
+"""
+OrderSummary.py - Denormalized one-row-per-order summary for order queues
+Place this file in: Database/OrderSummary.py
+
+The staff pending queue and the customer delivery confirmation page used to
+build their item text with GROUP_CONCAT over OrderList JOIN MenuItems, and
+they looked up the latest OrderTrack update with a correlated subquery, on
+every load. OrderSummary keeps the result of all that in one row per order:
+customer name, payment method, item text and count, and last tracking
+update. The queues then read one table through an index on the columns they
+filter by.
+
+Like the sales rollup, a summary row is updated inside the same transaction
+as every order write (placement, accept, tracking update, delivery), so it
+never drifts from the base tables. The item and customer names are copies,
+so renaming a menu item or a user also refreshes the summaries that show it.
+
+The table is created, and backfilled if empty, when the app connects.
+Rebuild every row from the command line:
+    python -m Database.OrderSummary --backfill
+"""
+
+
+SUMMARY_UPSERT = """
+    INSERT INTO OrderSummary
+        (OrderID, CustomerID, StaffID, OrderStatus, OrderDate, CustomerName,
+         PaymentMethod, TotalFee, DeliveryFee, Address, Items, ItemCount, LastUpdate)
+    SELECT o.OrderID, o.CustomerID, o.StaffID, o.OrderStatus, o.OrderDate,
+           CONCAT(COALESCE(u.UFirstName, ''), ' ', COALESCE(u.ULastName, '')),
+           p.PaymentMethod, o.TotalFee, o.DeliveryFee, o.Address,
+           (SELECT GROUP_CONCAT(CONCAT(m.ItemName, ' (', ol.Quantity, ')') SEPARATOR ', ')
+            FROM OrderList ol
+            JOIN MenuItems m ON ol.MenuID = m.MenuID
+            WHERE ol.OrderID = o.OrderID),
+           (SELECT COALESCE(SUM(ol.Quantity), 0) FROM OrderList ol WHERE ol.OrderID = o.OrderID),
+           (SELECT MAX(ot.UpdateDate) FROM OrderTrack ot WHERE ot.OrderID = o.OrderID)
+    FROM Orders o
+    LEFT JOIN Customers c ON o.CustomerID = c.CustomerID
+    LEFT JOIN Users u ON c.UserID = u.UserID
+    LEFT JOIN Payments p ON o.PaymentID = p.PaymentID
+    {condition}
+    ON DUPLICATE KEY UPDATE
+        CustomerID = VALUES(CustomerID), StaffID = VALUES(StaffID),
+        OrderStatus = VALUES(OrderStatus), OrderDate = VALUES(OrderDate),
+        CustomerName = VALUES(CustomerName), PaymentMethod = VALUES(PaymentMethod),
+        TotalFee = VALUES(TotalFee), DeliveryFee = VALUES(DeliveryFee),
+        Address = VALUES(Address), Items = VALUES(Items),
+        ItemCount = VALUES(ItemCount), LastUpdate = VALUES(LastUpdate)
+"""
+
+
+class OrderSummary:
+    """Maintains and reads the OrderSummary table"""
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self._ready = False
+
+    def ensure_ready(self, backfill_if_empty=True):
+        """
+        Create the summary table on first use and backfill it if it is empty.
+        Runs on its own pooled connection because DDL commits implicitly.
+
+        DatabaseManager.connect() calls this once; the refresh_* write paths
+        never backfill, since they run inside an open order transaction.
+        """
+        if self._ready:
+            return
+        with self.db_manager.borrow_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS OrderSummary (
+                    OrderID VARCHAR(20) NOT NULL PRIMARY KEY,
+                    CustomerID VARCHAR(20),
+                    StaffID VARCHAR(20),
+                    OrderStatus VARCHAR(30),
+                    OrderDate DATETIME,
+                    CustomerName VARCHAR(255),
+                    PaymentMethod VARCHAR(50),
+                    TotalFee DECIMAL(10,2),
+                    DeliveryFee DECIMAL(10,2),
+                    Address TEXT,
+                    Items TEXT,
+                    ItemCount INT UNSIGNED NOT NULL DEFAULT 0,
+                    LastUpdate DATETIME,
+                    KEY idx_summary_queue (OrderStatus, StaffID, OrderDate),
+                    KEY idx_summary_customer (CustomerID, OrderStatus, LastUpdate)
+                )
+            """)
+            cursor.execute("SELECT EXISTS(SELECT 1 FROM OrderSummary) as filled")
+            filled = cursor.fetchone()[0]
+            cursor.close()
+        self._ready = True
+        if not filled and backfill_if_empty:
+            self.backfill()
+
+    def backfill(self):
+        """
+        Rebuild every summary row from Orders/OrderList/OrderTrack.
+
+        Returns:
+            Number of orders summarized
+        """
+        with self.db_manager.borrow_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM OrderSummary")
+            cursor.execute(SUMMARY_UPSERT.format(condition=""))
+            written = cursor.rowcount
+            conn.commit()
+            cursor.close()
+
+        print(f"Order summary backfilled: {written} orders")
+        return written
+
+    def refresh_for_order(self, cursor, order_id):
+        """
+        Rebuild the summary row of `order_id`.
+
+        Call this with the caller's cursor after the order, its lines or its
+        tracking change, before committing, so both land atomically.
+        """
+        self.ensure_ready(backfill_if_empty=False)
+        cursor.execute(SUMMARY_UPSERT.format(condition="WHERE o.OrderID = %s"), (order_id,))
+
+    def refresh_for_menu_item(self, cursor, menu_id):
+        """Rebuild the summary rows of every order containing `menu_id` (after a rename)"""
+        self.ensure_ready(backfill_if_empty=False)
+        cursor.execute(SUMMARY_UPSERT.format(
+            condition="WHERE o.OrderID IN (SELECT OrderID FROM OrderList WHERE MenuID = %s)"
+        ), (menu_id,))
+
+    def refresh_for_user(self, cursor, user_id):
+        """Rebuild the summary rows of the orders placed by `user_id` (after a name change)"""
+        self.ensure_ready(backfill_if_empty=False)
+        cursor.execute(SUMMARY_UPSERT.format(condition="WHERE u.UserID = %s"), (user_id,))
+
+    # ==================== READERS ====================
+
+    def _fetch(self, query, params=()):
+        """Run a read-only summary query and return dict rows"""
+        self.ensure_ready()
+        with self.db_manager.borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            cursor.close()
+        return rows
+
+    def get_unassigned_pending(self, order_ids=None):
+        """Pending orders no staff member has accepted yet, newest first"""
+        params = []
+        order_filter = ""
+        if order_ids:
+            order_filter = f"AND OrderID IN ({', '.join(['%s'] * len(order_ids))})"
+            params.extend(order_ids)
+        return self._fetch(f"""
+            SELECT OrderID, TotalFee, DeliveryFee, Address, CustomerID,
+                   CustomerName, PaymentMethod, Items
+            FROM OrderSummary
+            WHERE OrderStatus = 'Pending' AND StaffID IS NULL {order_filter}
+            ORDER BY OrderDate DESC
+        """, params)
+
+    def get_customer_orders(self, customer_id, status):
+        """A customer's orders in one status, most recently tracked first"""
+        return self._fetch("""
+            SELECT OrderID, TotalFee, DeliveryFee, Address, OrderStatus,
+                   PaymentMethod, LastUpdate, Items, ItemCount
+            FROM OrderSummary
+            WHERE CustomerID = %s AND OrderStatus = %s
+            ORDER BY LastUpdate DESC
+        """, (customer_id, status))
+
+
+if __name__ == "__main__":
+    import sys
+    from Database.DatabaseManager import DatabaseManager
+
+    if '--backfill' not in sys.argv:
+        print("Usage: python -m Database.OrderSummary --backfill")
+        sys.exit(1)
+
+    db = DatabaseManager()
+    if db.connect():
+        db.order_summary.ensure_ready(backfill_if_empty=False)
+        db.order_summary.backfill()
+        db.disconnect()
+    else:
+        print("Failed to connect to database")
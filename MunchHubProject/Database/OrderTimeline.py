@@ -0,0 +1,100 @@
+"""
+OrderTimeline.py - Cached OrderTrack timelines for the customer order history
+Place this file in: Database/OrderTimeline.py
+
+The order history dialogs need two things from OrderTrack. They need the
+first update of every listed order, shown as its date, and the full
+timeline of whichever order the customer clicks. Both used to be queried
+row by row: a correlated MIN() subquery per order and a fresh query per
+click.
+
+OrderTimeline loads the tracking rows for every order on screen with one
+IN (...) query and keeps them in a least-recently-used cache for the rest of
+the session, so clicking through the list costs no queries. Entries are
+dropped when the order change feed (or a local write) reports the order as
+changed, and the next read fetches them again.
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class OrderTimeline:
+    """Per-session LRU cache of OrderTrack rows by OrderID"""
+
+    MAX_ORDERS = 500
+
+    def __init__(self, db_manager, max_orders=None):
+        self.db_manager = db_manager
+        self.max_orders = max_orders or self.MAX_ORDERS
+        self._timelines = OrderedDict()  # OrderID -> tuple of track rows, newest first
+        self._lock = threading.Lock()
+
+    def load(self, order_ids):
+        """
+        Timelines for `order_ids`, fetching every uncached one in a single query.
+
+        Returns:
+            dict of OrderID -> tuple of {'Status', 'Notes', 'UpdateDate'} rows, newest first
+        """
+        order_ids = list(dict.fromkeys(order_ids))
+        with self._lock:
+            missing = [order_id for order_id in order_ids if order_id not in self._timelines]
+
+        if missing:
+            fetched = {order_id: [] for order_id in missing}
+            with self.db_manager.borrow_connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                cursor.execute(f"""
+                    SELECT OrderID, Status, Notes, UpdateDate
+                    FROM OrderTrack
+                    WHERE OrderID IN ({', '.join(['%s'] * len(missing))})
+                    ORDER BY UpdateDate DESC
+                """, missing)
+                for row in cursor.fetchall():
+                    fetched[row.pop('OrderID')].append(row)
+                cursor.close()
+
+            with self._lock:
+                for order_id, rows in fetched.items():
+                    self._timelines[order_id] = tuple(rows)
+
+        with self._lock:
+            result = {}
+            for order_id in order_ids:
+                # A concurrent invalidate() may have dropped it again; treat as empty
+                result[order_id] = self._timelines.get(order_id, ())
+                if order_id in self._timelines:
+                    self._timelines.move_to_end(order_id)
+            while len(self._timelines) > self.max_orders:
+                self._timelines.popitem(last=False)
+            return result
+
+    def get(self, order_id):
+        """Timeline of one order (newest first), from the cache when possible"""
+        return self.load([order_id])[order_id]
+
+    def cached(self, order_id):
+        """Timeline of one order if it is already cached, else None (never queries)"""
+        with self._lock:
+            return self._timelines.get(order_id)
+
+    def fill_order_dates(self, orders, key='OrderDate'):
+        """
+        Set `key` on each order dict to its first tracking update, loading
+        every timeline with one query. Orders with no tracking get None.
+        """
+        timelines = self.load(order['OrderID'] for order in orders)
+        for order in orders:
+            rows = timelines.get(order['OrderID'])
+            order[key] = rows[-1]['UpdateDate'] if rows else None
+        return orders
+
+    def invalidate(self, order_ids=None):
+        """Drop the cached timelines of `order_ids` (all of them when None)"""
+        with self._lock:
+            if order_ids is None:
+                self._timelines.clear()
+                return
+            for order_id in order_ids:
+                self._timelines.pop(order_id, None)
@@ -0,0 +1,129 @@
+"""
+PasswordHasher.py - Password hashing schemes for MunchHub accounts
+Place this file in: Database/PasswordHasher.py
+
+New passwords are stored as salted scrypt hashes:
+    $scrypt$ln=14,r=8,p=1$<salt>$<hash>
+Older accounts may still hold an unsalted SHA-256 hex digest or plain text.
+Those still verify, and AuthService rewrites them to the current scheme on
+the next successful login, so legacy hashes disappear over time.
+
+scrypt is deliberately slow, so logins verify on a worker thread. Pick a
+work factor for the login machine with:
+    python -m Database.PasswordHasher --benchmark 250
+(250 = milliseconds per hash) and set PasswordHasher.DEFAULT_LOG_N to the result.
+"""
+
+import base64
+import hashlib
+import hmac
+import os
+import time
+
+
+def _b64encode(data):
+    return base64.b64encode(data).decode('ascii').rstrip('=')
+
+
+def _b64decode(text):
+    return base64.b64decode(text + '=' * (-len(text) % 4))
+
+
+class PasswordHasher:
+    """Hashes new passwords with scrypt and verifies every stored format"""
+
+    SCHEME = 'scrypt'
+    DEFAULT_LOG_N = 14  # N = 2**14, about 50 ms on a typical desktop
+    SALT_BYTES = 16
+    KEY_BYTES = 32
+
+    def __init__(self, log_n=DEFAULT_LOG_N, r=8, p=1):
+        self.log_n = log_n
+        self.r = r
+        self.p = p
+        # Hash length for these settings, checked against the Password column size
+        self.hash_length = len(self._format(b'\0' * self.SALT_BYTES, b'\0' * self.KEY_BYTES))
+
+    # ==================== HASHING ====================
+
+    def hash(self, password):
+        """Salted scrypt hash of `password` in the current settings"""
+        salt = os.urandom(self.SALT_BYTES)
+        return self._format(salt, self._scrypt(password, salt, self.log_n, self.r, self.p))
+
+    @staticmethod
+    def legacy_hash(password):
+        """Unsalted SHA-256 hex digest (the original MunchHub format)"""
+        return hashlib.sha256(password.encode()).hexdigest()
+
+    def _format(self, salt, key):
+        return f"${self.SCHEME}$ln={self.log_n},r={self.r},p={self.p}${_b64encode(salt)}${_b64encode(key)}"
+
+    def _scrypt(self, password, salt, log_n, r, p):
+        n = 2 ** log_n
+        return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p,
+                              maxmem=128 * n * r * p + 1024 * 1024, dklen=self.KEY_BYTES)
+
+    # ==================== VERIFYING ====================
+
+    def verify(self, stored_password, password):
+        """
+        Check `password` against a stored value of any supported format.
+
+        Returns:
+            (matches, needs_upgrade) - needs_upgrade is True when the stored value
+            is a legacy format or weaker scrypt settings than the current ones
+        """
+        if not stored_password:
+            return False, False
+
+        if stored_password.startswith(f"${self.SCHEME}$"):
+            try:
+                _, _, settings, salt, key = stored_password.split('$')
+                params = dict(item.split('=') for item in settings.split(','))
+                log_n, r, p = int(params['ln']), int(params['r']), int(params['p'])
+                expected = _b64decode(key)
+                actual = self._scrypt(password, _b64decode(salt), log_n, r, p)
+            except (ValueError, KeyError) as e:
+                print(f"Unreadable password hash: {e}")
+                return False, False
+            matches = hmac.compare_digest(actual, expected)
+            return matches, matches and (log_n, r, p) < (self.log_n, self.r, self.p)
+
+        # Legacy SHA-256 digests are 64 hex characters; anything short is plain text
+        if stored_password.startswith('$') or len(stored_password) > 50:
+            matches = hmac.compare_digest(stored_password, self.legacy_hash(password))
+        else:
+            matches = hmac.compare_digest(stored_password.encode(), password.encode())
+        return matches, matches
+
+    # ==================== TUNING ====================
+
+    def benchmark(self, budget_ms=250, max_log_n=20):
+        """
+        Largest work factor (log2 N) whose hash still fits in `budget_ms`.
+        Prints the time taken at each step.
+        """
+        best = 10
+        for log_n in range(10, max_log_n + 1):
+            start = time.perf_counter()
+            self._scrypt('benchmark', b'\0' * self.SALT_BYTES, log_n, self.r, self.p)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"  ln={log_n:<3} {elapsed_ms:8.1f} ms")
+            if elapsed_ms > budget_ms:
+                break
+            best = log_n
+        return best
+
+
+if __name__ == "__main__":
+    import sys
+
+    if '--benchmark' not in sys.argv:
+        print("Usage: python -m Database.PasswordHasher --benchmark [milliseconds]")
+        sys.exit(1)
+
+    position = sys.argv.index('--benchmark')
+    budget = float(sys.argv[position + 1]) if len(sys.argv) > position + 1 else 250
+    log_n = PasswordHasher().benchmark(budget)
+    print(f"Recommended: PasswordHasher.DEFAULT_LOG_N = {log_n}")
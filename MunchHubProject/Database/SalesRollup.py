@@ -0,0 +1,319 @@
+"""
+SalesRollup.py - Pre-aggregated daily sales for MunchHub reports
+Place this file in: Database/SalesRollup.py
+
+DailySalesRollup keeps one row per (day, order status) with revenue, order
+count and item count. Sales graphs and reports read this small table instead
+of scanning Orders/OrderList with YEAR()/MONTH()/DAY() on every load.
+
+Whenever an order is created or changes status, its own amounts (the
+SubTotals of its lines, as charged) are added to its (day, status) row and,
+on a status change, taken off the (day, old status) row, inside the same
+transaction. Only the changed order's row and at most two rollup rows are
+locked, so concurrent checkouts on the same day do not block each other.
+
+The table is created, and backfilled if empty, when the app connects.
+Backfill (or rebuild) from the command line:
+    python -m Database.SalesRollup --backfill
+"""
+
+from datetime import date
+
+
+# Per-order line totals (as charged), restricted to the orders in the date window
+ROLLUP_SELECT = """
+    SELECT DATE(o.OrderDate) as SalesDate,
+           o.OrderStatus,
+           COALESCE(SUM(li.revenue), 0) as Revenue,
+           COALESCE(SUM(o.TotalFee), 0) as GrossTotal,
+           COUNT(*) as OrderCount,
+           COALESCE(SUM(li.items), 0) as ItemCount
+    FROM Orders o
+    LEFT JOIN (
+        SELECT ol.OrderID,
+               SUM(ol.SubTotal) as revenue,
+               SUM(ol.Quantity) as items
+        FROM OrderList ol
+        JOIN Orders lo ON ol.OrderID = lo.OrderID
+        WHERE lo.OrderDate IS NOT NULL {line_condition}
+        GROUP BY ol.OrderID
+    ) li ON li.OrderID = o.OrderID
+    WHERE o.OrderDate IS NOT NULL {order_condition}
+    GROUP BY DATE(o.OrderDate), o.OrderStatus
+"""
+
+ROLLUP_INSERT = """
+    INSERT INTO DailySalesRollup (SalesDate, OrderStatus, Revenue, GrossTotal, OrderCount, ItemCount)
+"""
+
+# One order's contribution to the rollup
+ORDER_TOTALS = """
+    SELECT DATE(o.OrderDate) as SalesDate,
+           o.OrderStatus,
+           COALESCE(SUM(ol.SubTotal), 0) as Revenue,
+           COALESCE(o.TotalFee, 0) as GrossTotal,
+           COALESCE(SUM(ol.Quantity), 0) as ItemCount
+    FROM Orders o
+    LEFT JOIN OrderList ol ON ol.OrderID = o.OrderID
+    WHERE o.OrderID = %s
+    GROUP BY o.OrderID
+"""
+
+ADD_ORDER = """
+    INSERT INTO DailySalesRollup (SalesDate, OrderStatus, Revenue, GrossTotal, OrderCount, ItemCount)
+    VALUES (%s, %s, %s, %s, 1, %s)
+    ON DUPLICATE KEY UPDATE Revenue = Revenue + %s,
+                            GrossTotal = GrossTotal + %s,
+                            OrderCount = OrderCount + 1,
+                            ItemCount = ItemCount + %s
+"""
+
+# GREATEST keeps the unsigned counters from underflowing if the row was rebuilt meanwhile
+REMOVE_ORDER = """
+    UPDATE DailySalesRollup
+    SET Revenue = Revenue - %s,
+        GrossTotal = GrossTotal - %s,
+        OrderCount = GREATEST(OrderCount, 1) - 1,
+        ItemCount = GREATEST(ItemCount, %s) - %s
+    WHERE SalesDate = %s AND OrderStatus = %s
+"""
+
+
+class SalesRollup:
+    """Maintains and reads the DailySalesRollup table"""
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self._ready = False
+
+    def ensure_ready(self, backfill_if_empty=True):
+        """
+        Create the rollup table on first use and backfill it if it is empty.
+        Runs on its own pooled connection because DDL commits implicitly.
+
+        DatabaseManager.connect() calls this once. Write paths pass
+        backfill_if_empty=False: a backfill on a second connection would wait
+        on the order row their own transaction has locked.
+        """
+        if self._ready:
+            return
+        with self.db_manager.borrow_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS DailySalesRollup (
+                    SalesDate DATE NOT NULL,
+                    OrderStatus VARCHAR(30) NOT NULL,
+                    Revenue DECIMAL(14,2) NOT NULL DEFAULT 0,
+                    GrossTotal DECIMAL(14,2) NOT NULL DEFAULT 0,
+                    OrderCount INT UNSIGNED NOT NULL DEFAULT 0,
+                    ItemCount INT UNSIGNED NOT NULL DEFAULT 0,
+                    PRIMARY KEY (SalesDate, OrderStatus),
+                    KEY idx_rollup_status_date (OrderStatus, SalesDate)
+                )
+            """)
+            cursor.execute("SELECT EXISTS(SELECT 1 FROM DailySalesRollup) as filled")
+            filled = cursor.fetchone()[0]
+            cursor.close()
+        self._ready = True
+        if not filled and backfill_if_empty:
+            self.backfill()
+
+    def backfill(self, start_date=None, end_date=None):
+        """
+        Rebuild rollup rows from Orders/OrderList.
+
+        Args:
+            start_date: First day to rebuild (inclusive); None rebuilds everything
+            end_date: Last day to rebuild (exclusive); None means no upper bound
+        Returns:
+            Number of rollup rows written
+        """
+        conditions = []
+        params = []
+        if start_date:
+            conditions.append("AND {alias}.OrderDate >= %s")
+            params.append(start_date)
+        if end_date:
+            conditions.append("AND {alias}.OrderDate < %s")
+            params.append(end_date)
+
+        line_condition = " ".join(conditions).format(alias='lo')
+        order_condition = " ".join(conditions).format(alias='o')
+
+        with self.db_manager.borrow_connection() as conn:
+            cursor = conn.cursor()
+            if start_date or end_date:
+                delete_conditions = []
+                if start_date:
+                    delete_conditions.append("SalesDate >= %s")
+                if end_date:
+                    delete_conditions.append("SalesDate < %s")
+                cursor.execute(f"DELETE FROM DailySalesRollup WHERE {' AND '.join(delete_conditions)}", params)
+            else:
+                cursor.execute("DELETE FROM DailySalesRollup")
+
+            query = ROLLUP_INSERT + ROLLUP_SELECT.format(line_condition=line_condition,
+                                                         order_condition=order_condition)
+            cursor.execute(query, params + params)
+            written = cursor.rowcount
+            conn.commit()
+            cursor.close()
+
+        print(f"Sales rollup backfilled: {written} day/status rows")
+        return written
+
+    def lock_order(self, cursor, order_id):
+        """
+        Lock the order row and return its current status (None if not found).
+
+        Call this before changing an order's status and pass the result to
+        refresh_for_order() as old_status.
+        """
+        cursor.execute("SELECT OrderStatus FROM Orders WHERE OrderID = %s FOR UPDATE", (order_id,))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        return row['OrderStatus'] if isinstance(row, dict) else row[0]
+
+    def refresh_for_order(self, cursor, order_id, old_status=None):
+        """
+        Apply one order's change to the rollup.
+
+        Call this with the caller's cursor right after an order is inserted or
+        its status changes, before committing, so both land atomically.
+
+        Args:
+            old_status: Status before the change (from lock_order()); None for a new order
+        """
+        self.ensure_ready(backfill_if_empty=False)
+
+        cursor.execute(ORDER_TOTALS, (order_id,))
+        row = cursor.fetchone()
+        if not row:
+            return
+        if not isinstance(row, dict):
+            row = dict(zip(('SalesDate', 'OrderStatus', 'Revenue', 'GrossTotal', 'ItemCount'), row))
+        if not row['SalesDate'] or old_status == row['OrderStatus']:
+            return
+
+        changes = [(row['OrderStatus'], True)]
+        if old_status is not None:
+            changes.append((old_status, False))
+        # Same lock order in every transaction: rollup rows by status name
+        for status, add in sorted(changes):
+            amounts = (row['Revenue'], row['GrossTotal'])
+            if add:
+                cursor.execute(ADD_ORDER, (row['SalesDate'], status) + amounts + (row['ItemCount'],)
+                               + amounts + (row['ItemCount'],))
+            else:
+                cursor.execute(REMOVE_ORDER, amounts + (row['ItemCount'], row['ItemCount'],
+                                                        row['SalesDate'], status))
+
+    # ==================== READERS ====================
+
+    def _fetch(self, query, params=()):
+        """Run a read-only rollup query and return dict rows"""
+        self.ensure_ready()
+        with self.db_manager.borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            cursor.close()
+        return rows
+
+    def get_daily(self, year, month, status='Delivered'):
+        """Rows of (day, revenue, total_fee, order_count, item_count) for one month"""
+        start = date(year, month, 1)
+        end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+        return self._fetch("""
+            SELECT DAY(SalesDate) as day,
+                   SUM(Revenue) as revenue,
+                   SUM(GrossTotal) as total_fee,
+                   SUM(OrderCount) as order_count,
+                   SUM(ItemCount) as item_count
+            FROM DailySalesRollup
+            WHERE OrderStatus = %s AND SalesDate >= %s AND SalesDate < %s
+            GROUP BY SalesDate
+            ORDER BY SalesDate
+        """, (status, start, end))
+
+    def get_monthly(self, year, status='Delivered'):
+        """Rows of (month, revenue, total_fee, order_count, item_count) for one year"""
+        return self._fetch("""
+            SELECT MONTH(SalesDate) as month,
+                   SUM(Revenue) as revenue,
+                   SUM(GrossTotal) as total_fee,
+                   SUM(OrderCount) as order_count,
+                   SUM(ItemCount) as item_count
+            FROM DailySalesRollup
+            WHERE OrderStatus = %s AND SalesDate >= %s AND SalesDate < %s
+            GROUP BY MONTH(SalesDate)
+            ORDER BY month
+        """, (status, date(year, 1, 1), date(year + 1, 1, 1)))
+
+    def get_yearly(self, status='Delivered'):
+        """Rows of (year, revenue, total_fee, order_count, item_count) across all years"""
+        return self._fetch("""
+            SELECT YEAR(SalesDate) as year,
+                   SUM(Revenue) as revenue,
+                   SUM(GrossTotal) as total_fee,
+                   SUM(OrderCount) as order_count,
+                   SUM(ItemCount) as item_count
+            FROM DailySalesRollup
+            WHERE OrderStatus = %s
+            GROUP BY YEAR(SalesDate)
+            ORDER BY year
+        """, (status,))
+
+    def get_range(self, start, end):
+        """Every (day, status) rollup row in the half-open [start, end) window"""
+        return self._fetch("""
+            SELECT SalesDate, OrderStatus, Revenue, GrossTotal, OrderCount, ItemCount
+            FROM DailySalesRollup
+            WHERE SalesDate >= %s AND SalesDate < %s
+            ORDER BY SalesDate, OrderStatus
+        """, (start, end))
+
+    def get_revenue_by_status(self, start=None, end=None):
+        """{status: revenue} over [start, end); no bounds means every day"""
+        condition = ""
+        params = ()
+        if start and end:
+            condition = "WHERE SalesDate >= %s AND SalesDate < %s"
+            params = (start, end)
+        rows = self._fetch(f"""
+            SELECT OrderStatus, COALESCE(SUM(Revenue), 0) as revenue
+            FROM DailySalesRollup
+            {condition}
+            GROUP BY OrderStatus
+        """, params)
+        return {row['OrderStatus']: row['revenue'] for row in rows}
+
+    def get_totals(self, start, end, status='Delivered'):
+        """Summed revenue, total_fee, order_count and item_count for one status in [start, end)"""
+        rows = self._fetch("""
+            SELECT COALESCE(SUM(Revenue), 0) as revenue,
+                   COALESCE(SUM(GrossTotal), 0) as total_fee,
+                   COALESCE(SUM(OrderCount), 0) as order_count,
+                   COALESCE(SUM(ItemCount), 0) as item_count
+            FROM DailySalesRollup
+            WHERE OrderStatus = %s AND SalesDate >= %s AND SalesDate < %s
+        """, (status, start, end))
+        return rows[0]
+
+
+if __name__ == "__main__":
+    import sys
+    from Database.DatabaseManager import DatabaseManager
+
+    if '--backfill' not in sys.argv:
+        print("Usage: python -m Database.SalesRollup --backfill")
+        sys.exit(1)
+
+    db = DatabaseManager()
+    if db.connect():
+        db.sales_rollup.ensure_ready(backfill_if_empty=False)
+        db.sales_rollup.backfill()
+        db.disconnect()
+    else:
+        print("Failed to connect to database")
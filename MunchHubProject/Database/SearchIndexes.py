@@ -0,0 +1,83 @@
+"""
+SearchIndexes.py - Indexes and WHERE helpers behind the admin filters
+Place this file in: Database/SearchIndexes.py
+
+The Orders and Activity Log filters become parameterized WHERE clauses on
+status, date, staff and name columns, and page with a keyset on the sort
+key. The composite indexes below let MySQL answer each filter with a range
+scan that is already in sort order, instead of sorting a full table scan.
+
+Text search matches word prefixes ('jo' finds 'John'), since LIKE 'jo%'
+can use an index and LIKE '%jo%' cannot.
+"""
+
+
+# (table, index name, columns)
+SEARCH_INDEXES = [
+    ('Orders', 'idx_orders_status_id', 'OrderStatus, OrderID'),
+    ('Orders', 'idx_orders_date', 'OrderDate'),
+    ('Users', 'idx_users_first_name', 'UFirstName'),
+    ('Users', 'idx_users_last_name', 'ULastName'),
+    ('StaffActivityLog', 'idx_activity_date', 'ActivityDate, LogID'),
+    ('StaffActivityLog', 'idx_activity_staff_date', 'StaffID, ActivityDate, LogID'),
+    ('StaffActivityLog', 'idx_activity_status_date', 'Status, ActivityDate, LogID'),
+    ('StaffActivityLog', 'idx_activity_order', 'OrderID'),
+]
+
+
+def escape_like(text):
+    """Escape LIKE wildcards so user input matches literally"""
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def search_condition(text, columns):
+    """
+    WHERE fragment requiring every word of `text` to be a prefix of one of `columns`.
+
+    Returns:
+        (sql, params), or ("", []) when `text` is blank
+    """
+    clauses = []
+    params = []
+    for word in (text or "").split():
+        clauses.append("(" + " OR ".join(f"{column} LIKE %s" for column in columns) + ")")
+        params.extend([escape_like(word) + '%'] * len(columns))
+    return " AND ".join(clauses), params
+
+
+class SearchIndexes:
+    """Creates the indexes used by filtered admin queries"""
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self._ready = False
+
+    def ensure_ready(self):
+        """
+        Create any missing search index on first use.
+        MySQL has no CREATE INDEX IF NOT EXISTS, so existing ones are looked up first.
+        """
+        if self._ready:
+            return
+        self._ready = True
+        try:
+            with self.db_manager.borrow_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT DISTINCT LOWER(TABLE_NAME), LOWER(INDEX_NAME)
+                    FROM information_schema.STATISTICS
+                    WHERE TABLE_SCHEMA = DATABASE()
+                """)
+                existing = set(cursor.fetchall())
+
+                for table, name, columns in SEARCH_INDEXES:
+                    if (table.lower(), name.lower()) in existing:
+                        continue
+                    try:
+                        cursor.execute(f"CREATE INDEX {name} ON {table} ({columns})")
+                        print(f"Created index {name} on {table}")
+                    except Exception as e:
+                        print(f"Could not create index {name} on {table}: {e}")
+                cursor.close()
+        except Exception as e:
+            print(f"Error checking search indexes: {e}")
@@ -12,31 +12,44 @@ parent_dir = os.path.dirname(current_dir)
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-# Import Customer Dashboard with multiple fallback options
-CustomerWindow = None
-try:
-    from Customer.CustomerWindow import CustomerWindow
+from Tools.DataLoader import DataLoader
 
-    print("✓ CustomerWindow imported from Customer.CustomerWindow")
-except ImportError:
+
+def load_customer_window():
+    """
+    Import CustomerWindow (with the same fallback locations as before) when a
+    customer logs in, so the login screen does not load the customer modules.
+    Returns None if it cannot be found.
+    """
+    try:
+        from Customer.CustomerWindow import CustomerWindow
+
+        print("✓ CustomerWindow imported from Customer.CustomerWindow")
+        return CustomerWindow
+    except ImportError:
+        pass
     try:
         # Try direct import from same directory
-        sys.path.insert(0, current_dir)
+        if current_dir not in sys.path:
+            sys.path.insert(0, current_dir)
         from CustomerWindow import CustomerWindow
 
         print("✓ CustomerWindow imported from current directory")
+        return CustomerWindow
     except ImportError:
-        try:
-            # Try importing from Customer subfolder in current directory
-            customer_path = os.path.join(current_dir, 'Customer')
-            if customer_path not in sys.path:
-                sys.path.insert(0, customer_path)
-            from CustomerWindow import CustomerWindow
+        pass
+    try:
+        # Try importing from Customer subfolder in current directory
+        customer_path = os.path.join(current_dir, 'Customer')
+        if customer_path not in sys.path:
+            sys.path.insert(0, customer_path)
+        from CustomerWindow import CustomerWindow
 
-            print("✓ CustomerWindow imported from Customer subfolder")
-        except ImportError:
-            print("✗ CustomerWindow not found in any location")
-            CustomerWindow = None
+        print("✓ CustomerWindow imported from Customer subfolder")
+        return CustomerWindow
+    except ImportError:
+        print("✗ CustomerWindow not found in any location")
+        return None
 
 
 class LoginWindow(QMainWindow):
@@ -44,6 +57,7 @@ class LoginWindow(QMainWindow):
         super().__init__()
         self.db_manager = db_manager
         self.password_visible = False
+        self.loader = DataLoader(self)
         self.initUI()
 
     def initUI(self):
@@ -260,6 +274,7 @@ class LoginWindow(QMainWindow):
         """)
         login_button.clicked.connect(self.handle_login)
         login_layout.addWidget(login_button)
+        self.login_button = login_button
 
         # Sign up link
         signup_container = QHBoxLayout()
@@ -305,8 +320,40 @@ class LoginWindow(QMainWindow):
             self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
             self.password_toggle.setText('show')
 
+    def start_connecting(self):
+        """
+        Connect to the database on a worker thread once the event loop runs.
+        Login stays disabled until the connection is ready.
+        """
+        self.login_button.setEnabled(False)
+        self.login_button.setText('Connecting...')
+        self.loader.load(self.db_manager.connect, self.on_connected,
+                         lambda message: self.on_connected(False), key='connect')
+
+    def on_connected(self, connected):
+        """Enable login, or report the failed connection and quit"""
+        if connected:
+            self.login_button.setEnabled(True)
+            self.login_button.setText('Login')
+            return
+
+        QMessageBox.critical(
+            self,
+            'Database Connection Error',
+            'Failed to connect to the database.\n\n'
+            'Please ensure:\n'
+            '1. MySQL server is running\n'
+            '2. Database "munchhubdb" exists\n'
+            '3. Connection credentials are correct\n'
+            '4. All required tables are created'
+        )
+        QApplication.exit(1)
+
     def handle_login(self):
         """Handle login - automatically detects user type"""
+        if self.loader.is_loading('connect'):
+            return
+
         username = self.username_input.text().strip()
         password = self.password_input.text()
 
@@ -333,27 +380,35 @@ class LoginWindow(QMainWindow):
             QMessageBox.critical(self, 'Error', 'Database connection not available!')
             return
 
-        # Try to authenticate as admin from database (if admin table exists)
-        admin_success, admin_data, admin_message = self.db_manager.authenticate_admin(username, password)
+        if self.loader.is_loading('login'):
+            return
 
-        if admin_success:
-            self.admin_data = admin_data
+        # One lookup resolves admin, staff or customer (in that order). Password
+        # hashing is slow on purpose, so it runs off the GUI thread.
+        self.login_button.setEnabled(False)
+        self.login_button.setText('Logging in...')
+        self.loader.load(self.db_manager.authenticate, self.on_login_result,
+                         lambda message: self.on_login_result((False, None, message)),
+                         username, password, key='login')
+
+    def on_login_result(self, result):
+        """Open the window for the authenticated role, or report the failure"""
+        success, account, message = result
+        self.login_button.setEnabled(True)
+        self.login_button.setText('Login')
+
+        if success and account['role'] == 'admin':
+            self.admin_data = account
             self.open_admin_dashboard()
             return
 
-        # Try to authenticate as staff
-        staff_success, staff_data, staff_message = self.db_manager.authenticate_staff(username, password)
-
-        if staff_success:
-            self.staff_data = staff_data
+        if success and account['role'] == 'staff':
+            self.staff_data = account
             self.open_staff_dashboard()
             return
 
-        # Try to authenticate as regular user/customer
-        user_success, user_data, user_message = self.db_manager.authenticate_user(username, password)
-
-        if user_success:
-            self.user_data = user_data
+        if success:
+            self.user_data = account
             self.open_customer_window()
             return
 
@@ -386,6 +441,7 @@ class LoginWindow(QMainWindow):
 
     def open_customer_window(self):
         """Open customer main window"""
+        CustomerWindow = load_customer_window()
         if CustomerWindow is None:
             QMessageBox.critical(
                 self,
@@ -6,6 +6,8 @@ Place this file in: Staff/ActivityLogPage.py
 from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
 from PyQt6.QtCore import *
+from Tools.Theme import apply_theme
+from Tools.LazyTable import LazyTableModel, LazyTableView, Column, ButtonDelegate, Button, CENTER
 
 
 class ActivityLogPage(QWidget):
@@ -76,22 +78,49 @@ class ActivityLogPage(QWidget):
 
         return header_layout
 
+    STATUS_COLORS = {
+        'Pending': '#FF9800',
+        'Preparing': '#2196F3',
+        'Out for delivery': '#9C27B0',
+        'Delivered': '#4CAF50',
+        'Cancelled': '#F44336'
+    }
+
+    # Shown in the Actions column for orders that can no longer be delivered
+    STATUS_INDICATORS = {
+        'Delivered': ("Complete", '#4CAF50'),
+        'Cancelled': ("Cancelled", '#F44336')
+    }
+
     def create_activity_table(self):
         """Create activity table"""
-        table = QTableWidget()
-        table.setColumnCount(7)
-        table.setHorizontalHeaderLabels([
-            "Order ID", "Customer", "Action", "Status", "Date & Time", "Details", "Actions"
-        ])
+        columns = [
+            Column("Order ID", 'OrderID', align=CENTER, bold=True, size=10, color='#003274'),
+            Column("Customer", 'CustomerName', color='black'),
+            Column("Action", 'Action', color='black'),
+            Column("Status", 'Status', align=CENTER, bold=True, size=10,
+                   color=lambda a: self.STATUS_COLORS.get(a['Status'], '#666')),
+            Column("Date & Time", text=lambda a: a['ActivityDate'].strftime('%b %d, %Y %I:%M %p'),
+                   align=CENTER, color='black'),
+            Column("Details"),
+            Column("Actions", align=CENTER, bold=True,
+                   text=lambda a: self.STATUS_INDICATORS.get(a['Status'], ("—", '#999'))[0],
+                   color=lambda a: self.STATUS_INDICATORS.get(a['Status'], ("—", '#999'))[1])
+        ]
+        self.activity_model = LazyTableModel(columns, key_field='LogID', page_size=50, parent=self)
+        self.activity_model.load_failed.connect(
+            lambda message: QMessageBox.critical(self, "Error", f"Error loading activity log: {message}")
+        )
 
+        table = LazyTableView(self.activity_model, empty_text="No activity records found")
         table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: white;
                 border: 1px solid #e0e0e0;
                 border-radius: 8px;
                 gridline-color: #f0f0f0;
             }
-            QTableWidget::item {
+            QTableView::item {
                 color: black;
                 padding: 8px;
             }
@@ -104,199 +133,35 @@ class ActivityLogPage(QWidget):
             }
         """)
 
-        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         # MODIFIED: Disable table selection and focus
-        table.setSelectionMode(QTableWidget.SelectionMode.NoSelection)
+        table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
         table.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        table.verticalHeader().setVisible(False)
-        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         table.verticalHeader().setDefaultSectionSize(65)
 
-        return table
-
-    def load_data(self):
-        """Load activity log"""
-        activities = self.controller.get_activity_log()
-        self.populate_table(activities)
-
-    def populate_table(self, activities):
-        """Populate table with activities"""
-        self.activity_table.setRowCount(len(activities) if activities else 1)
-
-        if not activities:
-            empty_msg = QTableWidgetItem("No activity records found")
-            empty_msg.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            empty_msg.setForeground(QColor('#999'))
-            # MODIFIED: Disable item selection
-            empty_msg.setFlags(empty_msg.flags() & ~Qt.ItemFlag.ItemIsSelectable)
-            self.activity_table.setItem(0, 0, empty_msg)
-            self.activity_table.setSpan(0, 0, 1, 7)
-            return
-
-        status_colors = {
-            'Pending': '#FF9800',
-            'Preparing': '#2196F3',
-            'Out for delivery': '#9C27B0',
-            'Delivered': '#4CAF50',
-            'Cancelled': '#F44336'
-        }
-
-        for row, activity in enumerate(activities):
-            # Order ID
-            order_item = QTableWidgetItem(activity['OrderID'])
-            order_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            order_item.setFont(QFont('Arial', 10, QFont.Weight.Bold))
-            order_item.setForeground(QColor('#003274'))
-            # MODIFIED: Disable item selection
-            order_item.setFlags(order_item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
-            self.activity_table.setItem(row, 0, order_item)
-
-            # Customer
-            customer_item = QTableWidgetItem(activity['CustomerName'])
-            customer_item.setForeground(QColor('black'))
-            # MODIFIED: Disable item selection
-            customer_item.setFlags(customer_item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
-            self.activity_table.setItem(row, 1, customer_item)
-
-            # Action
-            action_item = QTableWidgetItem(activity['Action'])
-            action_item.setForeground(QColor('black'))
-            # MODIFIED: Disable item selection
-            action_item.setFlags(action_item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
-            self.activity_table.setItem(row, 2, action_item)
-
-            # Status
-            status_item = QTableWidgetItem(activity['Status'])
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            status_item.setFont(QFont('Arial', 10, QFont.Weight.Bold))
-            status_item.setForeground(QColor(status_colors.get(activity['Status'], '#666')))
-            # MODIFIED: Disable item selection
-            status_item.setFlags(status_item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
-            self.activity_table.setItem(row, 3, status_item)
-
-            # Date & Time
-            date_str = activity['ActivityDate'].strftime('%b %d, %Y %I:%M %p')
-            date_item = QTableWidgetItem(date_str)
-            date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            date_item.setForeground(QColor('black'))
-            # MODIFIED: Disable item selection
-            date_item.setFlags(date_item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
-            self.activity_table.setItem(row, 4, date_item)
-
-            # Details button
-            details_widget = self.create_details_button(activity)
-            self.activity_table.setCellWidget(row, 5, details_widget)
-
-            # Action buttons (Mark as Delivered if status is Out for delivery)
-            if activity['Status'] == 'Out for delivery':
-                action_widget = self.create_action_button(activity)
-                self.activity_table.setCellWidget(row, 6, action_widget)
-            else:
-                # Show status indicator
-                status_widget = self.create_status_indicator(activity['Status'])
-                self.activity_table.setCellWidget(row, 6, status_widget)
-
-    def create_details_button(self, activity):
-        """Create details button"""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        details_btn = QPushButton("View")
-        details_btn.setFixedSize(80, 30)
-        details_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        details_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-        """)
-        details_btn.clicked.connect(lambda: self.view_details(activity))
+        details = ButtonDelegate([Button('view', "View", '#2196F3')], table)
+        details.clicked.connect(lambda _, activity: self.view_details(activity))
+        table.setItemDelegateForColumn(5, details)
 
-        layout.addWidget(details_btn)
-
-        return widget
-
-    def create_action_button(self, activity):
-        """Create action button for orders out for delivery"""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        deliver_btn = QPushButton("Delivered")
-        deliver_btn.setFixedSize(100, 30)
-        deliver_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        deliver_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
-        deliver_btn.clicked.connect(lambda: self.mark_as_delivered(activity))
-
-        layout.addWidget(deliver_btn)
-
-        return widget
-
-    def create_status_indicator(self, status):
-        """Create status indicator for completed/cancelled orders"""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        if status == 'Delivered':
-            indicator = QLabel("Complete")
-            indicator.setStyleSheet("""
-                color: #4CAF50;
-                font-weight: bold;
-                font-size: 10px;
-            """)
-        elif status == 'Cancelled':
-            indicator = QLabel("Cancelled")
-            indicator.setStyleSheet("""
-                color: #F44336;
-                font-weight: bold;
-                font-size: 10px;
-            """)
-        else:
-            indicator = QLabel("—")
-            indicator.setStyleSheet("color: #999;")
+        # Mark as Delivered only while the order is out for delivery,
+        # otherwise the cell shows the status indicator text
+        deliver = ButtonDelegate(
+            lambda a: [Button('deliver', "Delivered", '#4CAF50', width=100)]
+            if a['Status'] == 'Out for delivery' else [],
+            table
+        )
+        deliver.clicked.connect(lambda _, activity: self.mark_as_delivered(activity))
+        table.setItemDelegateForColumn(6, deliver)
 
-        layout.addWidget(indicator)
+        return table
 
-        return widget
+    def load_data(self):
+        """Load activity log in the background"""
+        self.activity_model.load(self.controller.get_activity_log)
 
     def mark_as_delivered(self, activity):
         """Mark order as delivered"""
         # Set message box styling for black text
-        QApplication.instance().setStyleSheet("""
-            QMessageBox QLabel { color: black; }
-            QMessageBox QPushButton { 
-                color: black;
-                background-color: #e0e0e0;
-                border: 1px solid #ccc;
-                padding: 5px 15px;
-                border-radius: 4px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-        """)
+        apply_theme()
 
         reply = QMessageBox.question(
             self,
@@ -311,19 +176,7 @@ class ActivityLogPage(QWidget):
             success, message = self.controller.mark_order_delivered(activity['OrderID'])
 
             # Set message box styling for black text
-            QApplication.instance().setStyleSheet("""
-                QMessageBox QLabel { color: black; }
-                QMessageBox QPushButton { 
-                    color: black;
-                    background-color: #e0e0e0;
-                    border: 1px solid #ccc;
-                    padding: 5px 15px;
-                    border-radius: 4px;
-                }
-                QMessageBox QPushButton:hover {
-                    background-color: #d0d0d0;
-                }
-            """)
+            apply_theme()
 
             if success:
                 QMessageBox.information(
@@ -339,19 +192,7 @@ class ActivityLogPage(QWidget):
     def view_details(self, activity):
         """View activity details"""
         # Set message box styling for black text
-        QApplication.instance().setStyleSheet("""
-            QMessageBox QLabel { color: black; }
-            QMessageBox QPushButton { 
-                color: black;
-                background-color: #e0e0e0;
-                border: 1px solid #ccc;
-                padding: 5px 15px;
-                border-radius: 4px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-        """)
+        apply_theme()
 
         details_text = f"""
 Order ID: {activity['OrderID']}
@@ -6,7 +6,10 @@ Place this file in: Staff/ManageOrdersPage.py
 from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
 from PyQt6.QtCore import *
+from Tools.Theme import apply_theme
 from Staff.OrderDialogs import OrderAcceptDialog
+from Tools.DataLoader import DataLoader
+from Tools.LazyTable import LazyTableModel, LazyTableView, Column, CENTER, RIGHT
 
 
 class ManageOrdersPage(QWidget):
@@ -16,6 +19,8 @@ class ManageOrdersPage(QWidget):
         super().__init__(parent)
         self.controller = controller
         self.parent_window = parent
+        self.loader = DataLoader(self)
+        self.changed_order_ids = []  # Feed changes still being fetched
         self.initUI()
 
     def initUI(self):
@@ -83,24 +88,32 @@ class ManageOrdersPage(QWidget):
 
     def create_orders_table(self):
         """Create orders table"""
-        table = QTableWidget()
-        table.setColumnCount(6)
-        table.setHorizontalHeaderLabels([
-            "Order ID", "Customer", "Items", "Total", "Address", "Payment"
-        ])
-
+        columns = [
+            Column("Order ID", 'OrderID', align=CENTER, bold=True, size=10, color='#003274'),
+            Column("Customer", 'CustomerName', color='black'),
+            Column("Items", text=lambda o: o['Items'][:50] + "..." if o['Items'] and len(o['Items']) > 50 else (o['Items'] or ""),
+                   color='black', tooltip=lambda o: o['Items'] or ""),
+            Column("Total", text=lambda o: f"₱{float(o['TotalFee']) + float(o['DeliveryFee']):.2f}",
+                   align=RIGHT, bold=True, size=10, color='#FF9800'),
+            Column("Address", text=lambda o: o['Address'][:30] + "..." if len(o['Address']) > 30 else o['Address'],
+                   color='black', tooltip=lambda o: o['Address']),
+            Column("Payment", 'PaymentMethod', align=CENTER, color='black')
+        ]
+        self.orders_model = LazyTableModel(columns, key_field='OrderID', parent=self)
+
+        table = LazyTableView(self.orders_model, empty_text="No pending orders available")
         table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: white;
                 border: 1px solid #e0e0e0;
                 border-radius: 8px;
                 gridline-color: #f0f0f0;
             }
-            QTableWidget::item {
+            QTableView::item {
                 color: black;
                 padding: 8px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #4CAF50;
                 color: white;
             }
@@ -112,12 +125,6 @@ class ManageOrdersPage(QWidget):
                 border: none;
             }
         """)
-
-        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        table.verticalHeader().setVisible(False)
-        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         table.verticalHeader().setDefaultSectionSize(70)
 
         # Enable double-click to accept
@@ -126,95 +133,35 @@ class ManageOrdersPage(QWidget):
         return table
 
     def load_data(self):
-        """Load pending orders"""
-        orders = self.controller.get_pending_orders()
-        self.populate_table(orders)
-
-    def populate_table(self, orders):
-        """Populate table with orders"""
-        self.orders_table.setRowCount(len(orders) if orders else 1)
-
-        if not orders:
-            empty_msg = QTableWidgetItem("No pending orders available")
-            empty_msg.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            empty_msg.setForeground(QColor('#999'))
-            self.orders_table.setItem(0, 0, empty_msg)
-            self.orders_table.setSpan(0, 0, 1, 6)
-            return
-
-        for row, order in enumerate(orders):
-            # Store order data in the row
-            self.orders_table.setRowHeight(row, 70)
-
-            # Order ID
-            id_item = QTableWidgetItem(order['OrderID'])
-            id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            id_item.setFont(QFont('Arial', 10, QFont.Weight.Bold))
-            id_item.setForeground(QColor('#003274'))
-            id_item.setData(Qt.ItemDataRole.UserRole, order)  # Store full order data
-            self.orders_table.setItem(row, 0, id_item)
-
-            # Customer
-            customer_item = QTableWidgetItem(order['CustomerName'])
-            customer_item.setForeground(QColor('black'))
-            self.orders_table.setItem(row, 1, customer_item)
-
-            # Items
-            items_text = order['Items'][:50] + "..." if order['Items'] and len(order['Items']) > 50 else order['Items']
-            items_item = QTableWidgetItem(items_text)
-            items_item.setForeground(QColor('black'))
-            items_item.setToolTip(order['Items'] or "")
-            self.orders_table.setItem(row, 2, items_item)
-
-            # Total
-            total = float(order['TotalFee']) + float(order['DeliveryFee'])
-            total_item = QTableWidgetItem(f"₱{total:.2f}")
-            total_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            total_item.setFont(QFont('Arial', 10, QFont.Weight.Bold))
-            total_item.setForeground(QColor('#FF9800'))
-            self.orders_table.setItem(row, 3, total_item)
-
-            # Address
-            address_text = order['Address'][:30] + "..." if len(order['Address']) > 30 else order['Address']
-            address_item = QTableWidgetItem(address_text)
-            address_item.setForeground(QColor('black'))
-            address_item.setToolTip(order['Address'])
-            self.orders_table.setItem(row, 4, address_item)
-
-            # Payment
-            payment_item = QTableWidgetItem(order['PaymentMethod'])
-            payment_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            payment_item.setForeground(QColor('black'))
-            self.orders_table.setItem(row, 5, payment_item)
+        """Load pending orders in the background"""
+        self.orders_model.load_all(self.controller.get_pending_orders)
+
+    def apply_order_changes(self, order_ids):
+        """Refresh only the rows of orders reported by the order feed"""
+        # A newer fetch replaces an unfinished one, so carry its IDs along
+        self.changed_order_ids.extend(i for i in order_ids if i not in self.changed_order_ids)
+        order_ids = list(self.changed_order_ids)
+        self.loader.load(self.controller.get_pending_orders,
+                         lambda orders: self.update_order_rows(order_ids, orders),
+                         None, order_ids, key='changes')
+
+    def update_order_rows(self, order_ids, orders):
+        """
+        Apply changed orders in place: update rows still pending, insert new
+        ones at the top and drop orders that were accepted or cancelled.
+        """
+        self.changed_order_ids = [i for i in self.changed_order_ids if i not in order_ids]
+        self.orders_model.upsert_rows(order_ids, orders)
 
     def apply_message_box_style(self):
         """Apply black text styling to message boxes"""
-        QApplication.instance().setStyleSheet("""
-            QMessageBox {
-                background-color: white;
-            }
-            QMessageBox QLabel {
-                color: black;
-                font-size: 13px;
-            }
-            QMessageBox QPushButton {
-                color: black;
-                background-color: #e0e0e0;
-                border: 1px solid #ccc;
-                padding: 5px 15px;
-                border-radius: 4px;
-                min-width: 60px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-        """)
+        apply_theme()
 
     def accept_selected_order(self):
         """Accept the selected order"""
-        selected_row = self.orders_table.currentRow()
+        order = self.orders_table.selected_row()
 
-        if selected_row < 0:
+        if not order:
             self.apply_message_box_style()
             QMessageBox.warning(
                 self,
@@ -223,26 +170,11 @@ class ManageOrdersPage(QWidget):
             )
             return
 
-        # Get order data from the first column
-        id_item = self.orders_table.item(selected_row, 0)
-        if not id_item:
-            return
-
-        order = id_item.data(Qt.ItemDataRole.UserRole)
-        if not order:
-            self.apply_message_box_style()
-            QMessageBox.warning(
-                self,
-                'Error',
-                'Could not retrieve order data. Please refresh and try again.'
-            )
-            return
-
         # Open accept dialog
         dialog = OrderAcceptDialog(self, order, self.controller)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            # Reload data to refresh the table
-            self.load_data()
+            # Refresh just this order's row
+            self.apply_order_changes([order['OrderID']])
 
             # Show success message with black text
             self.apply_message_box_style()
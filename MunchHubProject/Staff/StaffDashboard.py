@@ -10,6 +10,8 @@ from Staff.StaffController import StaffController
 from Staff.ManageOrdersPage import ManageOrdersPage
 from Staff.ActivityLogPage import ActivityLogPage
 from Staff.TrackOrdersPage import TrackOrdersPage
+from Tools.OrderFeedWatcher import OrderFeedWatcher
+from Tools.Theme import STAFF_NAV_STYLE, set_style_state
 
 
 class StaffDashboard(QMainWindow):
@@ -53,8 +55,14 @@ class StaffDashboard(QMainWindow):
 
         main_layout.addWidget(self.content_stack, 1)
 
-        # Load initial page
+        # Load the order pages once; after that the order feed keeps them current
         self.manage_orders_page.load_data()
+        self.track_orders_page.load_data()
+
+        self.order_watcher = OrderFeedWatcher(self.db_manager, parent=self)
+        self.order_watcher.orders_changed.connect(self.manage_orders_page.apply_order_changes)
+        self.order_watcher.orders_changed.connect(self.track_orders_page.apply_order_changes)
+        self.order_watcher.start()
 
     def create_sidebar(self):
         """Create navigation sidebar"""
@@ -83,7 +91,8 @@ class StaffDashboard(QMainWindow):
 
         # Navigation buttons
         nav_widget = QWidget()
-        nav_widget.setStyleSheet("background: transparent;")
+        nav_widget.setObjectName("staffNav")
+        nav_widget.setStyleSheet("#staffNav { background: transparent; }" + STAFF_NAV_STYLE)
         nav_layout = QVBoxLayout(nav_widget)
         nav_layout.setContentsMargins(20, 20, 20, 20)
         nav_layout.setSpacing(10)
@@ -159,35 +168,9 @@ class StaffDashboard(QMainWindow):
         btn.setCursor(Qt.CursorShape.PointingHandCursor)
         btn.setFixedHeight(50)
 
-        if active:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: rgba(255, 189, 89, 0.9);
-                    color: #003274;
-                    border: none;
-                    border-radius: 8px;
-                    text-align: left;
-                    padding-left: 20px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(255, 189, 89, 1);
-                }
-            """)
-        else:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    color: white;
-                    border: 2px solid rgba(255,255,255,0.2);
-                    border-radius: 8px;
-                    text-align: left;
-                    padding-left: 20px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(255,255,255,0.1);
-                    border: 2px solid rgba(255,255,255,0.4);
-                }
-            """)
+        # Styled by STAFF_NAV_STYLE on the nav widget; "active" picks the highlighted look
+        btn.setObjectName("staffNavButton")
+        btn.setProperty("active", active)
 
         return btn
 
@@ -221,47 +204,14 @@ class StaffDashboard(QMainWindow):
 
     def switch_page(self, index, button):
         """Switch between pages"""
-        # Reset all buttons
         for btn in [self.manage_orders_btn, self.activity_log_btn, self.track_orders_btn]:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    color: white;
-                    border: 2px solid rgba(255,255,255,0.2);
-                    border-radius: 8px;
-                    text-align: left;
-                    padding-left: 20px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(255,255,255,0.1);
-                    border: 2px solid rgba(255,255,255,0.4);
-                }
-            """)
-
-        # Set active button
-        button.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(255, 189, 89, 0.9);
-                color: #003274;
-                border: none;
-                border-radius: 8px;
-                text-align: left;
-                padding-left: 20px;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 189, 89, 1);
-            }
-        """)
+            set_style_state(btn, "active", btn is button)
 
-        # Switch page and load data
+        # Switch page; the order pages are kept live by the order feed
         self.content_stack.setCurrentIndex(index)
 
-        if index == 0:
-            self.manage_orders_page.load_data()
-        elif index == 1:
+        if index == 1:
             self.activity_log_page.load_data()
-        elif index == 2:
-            self.track_orders_page.load_data()
 
     def logout(self):
         """Logout"""
@@ -273,6 +223,7 @@ class StaffDashboard(QMainWindow):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
+            self.order_watcher.stop()
             from Main.LoginWindow import LoginWindow
             self.login_window = LoginWindow(self.db_manager)
             self.login_window.show()
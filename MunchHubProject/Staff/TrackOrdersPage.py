@@ -6,7 +6,10 @@ Place this file in: Staff/TrackOrdersPage.py
 from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
 from PyQt6.QtCore import *
+from Tools.Theme import apply_theme
 from Staff.OrderDialogs import TrackUpdateDialog
+from Tools.DataLoader import DataLoader
+from Tools.LazyTable import LazyTableModel, LazyTableView, Column, ButtonDelegate, Button, CENTER
 
 
 class TrackOrdersPage(QWidget):
@@ -16,6 +19,8 @@ class TrackOrdersPage(QWidget):
         super().__init__(parent)
         self.controller = controller
         self.parent_window = parent
+        self.loader = DataLoader(self)
+        self.changed_order_ids = []  # Feed changes still being fetched
         self.initUI()
 
     def initUI(self):
@@ -61,22 +66,35 @@ class TrackOrdersPage(QWidget):
 
         return header_layout
 
+    STATUS_COLORS = {
+        'Confirmed': '#4CAF50',
+        'Preparing': '#2196F3',
+        'Out for delivery': '#9C27B0'
+    }
+
     def create_track_table(self):
         """Create track table"""
-        table = QTableWidget()
-        table.setColumnCount(6)
-        table.setHorizontalHeaderLabels([
-            "Track ID", "Order ID", "Status", "Notes", "Update Date", "Action"
-        ])
-
+        columns = [
+            Column("Track ID", 'TrackID', align=CENTER, bold=True, size=10, color='#003274'),
+            Column("Order ID", 'OrderID', align=CENTER, bold=True, size=10, color='#003274'),
+            Column("Status", 'Status', align=CENTER, bold=True, size=10,
+                   color=lambda t: self.STATUS_COLORS.get(t['Status'], '#666')),
+            Column("Notes", text=lambda t: t['Notes'] or "—", color='black'),
+            Column("Update Date", text=lambda t: t['UpdateDate'].strftime('%b %d, %Y %I:%M %p'),
+                   align=CENTER, color='black'),
+            Column("Action")
+        ]
+        self.track_model = LazyTableModel(columns, key_field='TrackID', parent=self)
+
+        table = LazyTableView(self.track_model, empty_text="No tracking records found")
         table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: white;
                 border: 1px solid #e0e0e0;
                 border-radius: 8px;
                 gridline-color: #f0f0f0;
             }
-            QTableWidget::item {
+            QTableView::item {
                 color: black;
                 padding: 8px;
             }
@@ -89,137 +107,49 @@ class TrackOrdersPage(QWidget):
             }
         """)
 
-        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        table.setSelectionMode(QTableWidget.SelectionMode.NoSelection)
+        table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
         table.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        table.verticalHeader().setVisible(False)
-        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         table.verticalHeader().setDefaultSectionSize(60)
 
+        # Update button painted by a delegate rather than a widget per row
+        actions = ButtonDelegate([Button('update', "Update", '#FF9800', width=90)], table)
+        actions.clicked.connect(lambda _, track: self.update_track(track))
+        table.setItemDelegateForColumn(5, actions)
+
         return table
 
     def load_data(self):
-        """Load track orders"""
-        tracks = self.controller.get_track_orders()
-        self.populate_table(tracks)
-
-    def populate_table(self, tracks):
-        """Populate table with tracking records"""
-        self.track_table.setRowCount(len(tracks) if tracks else 1)
-
-        if not tracks:
-            empty_msg = QTableWidgetItem("No tracking records found")
-            empty_msg.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            empty_msg.setForeground(QColor('#999'))
-            empty_msg.setFlags(empty_msg.flags() & ~Qt.ItemFlag.ItemIsSelectable)
-            self.track_table.setItem(0, 0, empty_msg)
-            self.track_table.setSpan(0, 0, 1, 6)
-            return
-
-        status_colors = {
-            'Confirmed': '#4CAF50',
-            'Preparing': '#2196F3',
-            'Out for delivery': '#9C27B0'
-        }
-
-        for row, track in enumerate(tracks):
-            # Track ID
-            track_id_item = QTableWidgetItem(track['TrackID'])
-            track_id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            track_id_item.setFont(QFont('Arial', 10, QFont.Weight.Bold))
-            track_id_item.setForeground(QColor('#003274'))
-            track_id_item.setFlags(track_id_item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
-            self.track_table.setItem(row, 0, track_id_item)
-
-            # Order ID
-            order_item = QTableWidgetItem(track['OrderID'])
-            order_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            order_item.setFont(QFont('Arial', 10, QFont.Weight.Bold))
-            order_item.setForeground(QColor('#003274'))
-            order_item.setFlags(order_item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
-            self.track_table.setItem(row, 1, order_item)
-
-            # Status
-            status_item = QTableWidgetItem(track['Status'])
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            status_item.setFont(QFont('Arial', 10, QFont.Weight.Bold))
-            status_item.setForeground(QColor(status_colors.get(track['Status'], '#666')))
-            status_item.setFlags(status_item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
-            self.track_table.setItem(row, 2, status_item)
-
-            # Notes
-            notes_item = QTableWidgetItem(track['Notes'] or "—")
-            notes_item.setForeground(QColor('black'))
-            notes_item.setFlags(notes_item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
-            self.track_table.setItem(row, 3, notes_item)
-
-            # Update Date
-            date_str = track['UpdateDate'].strftime('%b %d, %Y %I:%M %p')
-            date_item = QTableWidgetItem(date_str)
-            date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            date_item.setForeground(QColor('black'))
-            date_item.setFlags(date_item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
-            self.track_table.setItem(row, 4, date_item)
-
-            # Action button
-            action_widget = self.create_action_button(track)
-            self.track_table.setCellWidget(row, 5, action_widget)
-
-    def create_action_button(self, track):
-        """Create update button"""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        update_btn = QPushButton("Update")
-        update_btn.setFixedSize(90, 30)
-        update_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        update_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FF9800;
-                color: white;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: #F57C00;
-            }
-        """)
-        update_btn.clicked.connect(lambda: self.update_track(track))
-
-        layout.addWidget(update_btn)
-
-        return widget
+        """Load track orders in the background"""
+        self.track_model.load_all(self.controller.get_track_orders)
+
+    def apply_order_changes(self, order_ids):
+        """Refresh only the tracking rows of orders reported by the order feed"""
+        # A newer fetch replaces an unfinished one, so carry its IDs along
+        self.changed_order_ids.extend(i for i in order_ids if i not in self.changed_order_ids)
+        order_ids = list(self.changed_order_ids)
+        self.loader.load(self.controller.get_track_orders,
+                         lambda tracks: self.update_track_rows(order_ids, tracks),
+                         None, order_ids, key='changes')
+
+    def update_track_rows(self, order_ids, tracks):
+        """
+        Replace the rows of the changed orders with their current tracking
+        records, newest first at the top; finished orders simply drop out.
+        """
+        self.changed_order_ids = [i for i in self.changed_order_ids if i not in order_ids]
+
+        changed = set(order_ids)
+        self.track_model.remove_rows_where(lambda t: t['OrderID'] in changed)
+        self.track_model.insert_rows(0, list(tracks or []))
 
     def update_track(self, track):
         """Open update track dialog"""
         dialog = TrackUpdateDialog(self, track, self.controller)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.load_data()
+            self.apply_order_changes([track['OrderID']])
 
     def showEvent(self, event):
         """Apply global message box styling when page is shown"""
         super().showEvent(event)
         # Set global stylesheet for message boxes
-        QApplication.instance().setStyleSheet("""
-            QMessageBox {
-                background-color: white;
-            }
-            QMessageBox QLabel {
-                color: black;
-                font-size: 11px;
-            }
-            QMessageBox QPushButton {
-                color: black;
-                background-color: #e0e0e0;
-                border: 1px solid #ccc;
-                padding: 5px 15px;
-                border-radius: 4px;
-                min-width: 60px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-        """)
\ No newline at end of file
+        apply_theme()
\ No newline at end of file
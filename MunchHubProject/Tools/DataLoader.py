@@ -0,0 +1,201 @@
+"""
+DataLoader.py - Background data loading for MunchHub views
+Place this file in: Tools/DataLoader.py
+
+Views hand their database calls to a DataLoader instead of running them on
+the GUI thread. The call runs on a shared QThreadPool and its result is
+delivered back on the GUI thread through Qt signals, so the window keeps
+painting while a slow query runs.
+
+Each load has a key (e.g. 'orders'). Starting a new load for a key cancels
+the previous one: if it has not started yet it is pulled from the queue,
+and if it is already running its result is dropped when it arrives.
+
+Tasks are not auto-deleted by the pool. The loader keeps each task alive
+until the worker reports it done, so cancelling a task that has already run
+(its result still queued) never touches a deleted C++ object.
+
+Usage:
+    self.loader = DataLoader(self)
+    self.loader.load(self.controller.get_pending_orders, self.populate_table)
+"""
+
+import itertools
+import threading
+import traceback
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+
+
+# Leave at least one pooled DB connection free for writes made on the GUI thread
+MAX_WORKER_THREADS = 4
+
+_thread_pool = None
+
+# request id -> _LoadTask the pool may still run. Module level, so a task
+# outlives a DataLoader whose widget is destroyed while the task runs.
+_live_tasks = {}
+
+
+def get_thread_pool():
+    """Shared pool used by every DataLoader"""
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = QThreadPool()
+        _thread_pool.setMaxThreadCount(MAX_WORKER_THREADS)
+    return _thread_pool
+
+
+class CancelToken:
+    """Flag shared between a load request and its worker"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+
+class _LoadSignals(QObject):
+    """Signals emitted from the worker thread, received on the GUI thread"""
+    result = pyqtSignal(str, int, object)
+    error = pyqtSignal(str, int, str)
+    done = pyqtSignal(int)
+
+
+class _LoadTask(QRunnable):
+    """Runs one blocking call on a pool thread"""
+
+    def __init__(self, key, request_id, token, signals, fn, args, kwargs):
+        super().__init__()
+        self.key = key
+        self.request_id = request_id
+        self.token = token
+        self.signals = signals
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self):
+        try:
+            self._run()
+        finally:
+            self.signals.done.emit(self.request_id)
+
+    def _run(self):
+        if self.token.cancelled:
+            return
+        try:
+            data = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            if not self.token.cancelled:
+                traceback.print_exc()
+                self.signals.error.emit(self.key, self.request_id, str(e))
+            return
+        if not self.token.cancelled:
+            self.signals.result.emit(self.key, self.request_id, data)
+
+
+class DataLoader(QObject):
+    """Runs view data loads off the GUI thread and delivers the latest result per key"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._signals = _LoadSignals()
+        self._signals.result.connect(self._on_result)
+        self._signals.error.connect(self._on_error)
+        self._signals.done.connect(self._on_done)
+
+        self._pending = {}  # key -> (request_id, token, task, on_result, on_error)
+
+        # Stop delivering results once the owning widget is gone
+        if parent is not None:
+            parent.destroyed.connect(lambda *_, pending=self._pending: _cancel_pending(pending))
+
+    def load(self, fn, on_result, on_error=None, *args, key='default', **kwargs):
+        """
+        Run `fn(*args, **kwargs)` on a worker thread.
+
+        Args:
+            fn: Blocking call that returns the data (usually a controller method)
+            on_result: Called on the GUI thread with the return value of `fn`
+            on_error: Called on the GUI thread with an error message if `fn` raises
+            key: Loads sharing a key replace each other; only the newest is delivered
+        Returns:
+            The CancelToken for this request
+        """
+        self.cancel(key)
+
+        request_id = _new_request_id()
+        token = CancelToken()
+        task = _LoadTask(key, request_id, token, self._signals, fn, args, kwargs)
+        task.setAutoDelete(False)
+        _live_tasks[request_id] = task
+        self._pending[key] = (request_id, token, task, on_result, on_error)
+        get_thread_pool().start(task)
+        return token
+
+    def cancel(self, key='default'):
+        """Cancel the outstanding load for `key`, if any"""
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        request_id, token, task, _, _ = pending
+        token.cancel()
+        if get_thread_pool().tryTake(task):
+            # Never ran, so no done signal will come for it
+            _live_tasks.pop(request_id, None)
+
+    def cancel_all(self):
+        """Cancel every outstanding load"""
+        for key in list(self._pending):
+            self.cancel(key)
+
+    def is_loading(self, key='default'):
+        return key in self._pending
+
+    def _take(self, key, request_id):
+        """Remove and return the pending entry if it is still the current request"""
+        pending = self._pending.get(key)
+        if pending is None or pending[0] != request_id or pending[1].cancelled:
+            return None
+        return self._pending.pop(key)
+
+    @pyqtSlot(int)
+    def _on_done(self, request_id):
+        _live_tasks.pop(request_id, None)
+
+    @pyqtSlot(str, int, object)
+    def _on_result(self, key, request_id, data):
+        pending = self._take(key, request_id)
+        if pending is not None:
+            pending[3](data)
+
+    @pyqtSlot(str, int, str)
+    def _on_error(self, key, request_id, message):
+        pending = self._take(key, request_id)
+        if pending is None:
+            return
+        on_error = pending[4]
+        if on_error:
+            on_error(message)
+        else:
+            print(f"Error loading data ({key}): {message}")
+
+
+_request_ids = itertools.count(1)
+
+
+def _new_request_id():
+    """Request ids are unique across loaders, since _live_tasks is shared"""
+    return next(_request_ids)
+
+
+def _cancel_pending(pending):
+    """Cancel every token in a DataLoader's pending map"""
+    for _, token, _, _, _ in pending.values():
+        token.cancel()
@@ -1,8 +1,163 @@
 """
 Database Schema Checker
 Run this script to verify your database structure and see what columns exist
+
+SchemaCapabilities is the runtime side: it reads information_schema once
+when the database connects and answers "does this database have X?" from
+memory, so logins, menu loads and checkouts never run SHOW COLUMNS/TABLES.
+After a migration (e.g. adding Orders.Tax), call db_manager.schema.refresh().
+
+Columns that are too short are only reported on connect; widen them once with
+    python -m Tools.DataSchemaChecker --widen-columns
+"""
+
+import threading
+
+from mysql.connector import Error
+
+
+# SQL variants chosen once per schema, so callers don't branch on every call
+ORDER_INSERT_WITH_TAX = """
+    INSERT INTO Orders (OrderID, CustomerID, StaffID, PaymentID, Address, TotalFee, Tax, DeliveryFee, OrderStatus)
+    VALUES (%s, %s, NULL, %s, %s, %s, %s, %s, 'Pending')
+"""
+
+# Tax column doesn't exist - insert without it (backward compatibility)
+ORDER_INSERT_WITHOUT_TAX = """
+    INSERT INTO Orders (OrderID, CustomerID, StaffID, PaymentID, Address, TotalFee, DeliveryFee, OrderStatus)
+    VALUES (%s, %s, NULL, %s, %s, %s, %s, 'Pending')
 """
 
+# Tax column doesn't exist - work it out from TotalFee
+ORDER_TAX_STORED = "o.Tax"
+ORDER_TAX_DERIVED = "ROUND((o.TotalFee - o.DeliveryFee) * 0.12 / 1.12, 2) as Tax"
+
+MENU_DESCRIPTION_STORED = "m.Description"
+MENU_DESCRIPTION_MISSING = "NULL as Description"
+
+# (table, column) -> minimum VARCHAR length; reported on connect, widened by --widen-columns
+MIN_COLUMN_LENGTHS = {
+    # O{order number}L{line}: the original varchar(5) ran out around order 100
+    ('OrderList', 'OrderListID'): 20,
+}
+
+
+class SchemaCapabilities:
+    """Optional tables and columns of the connected database, read once"""
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self._lock = threading.Lock()
+        self.loaded = False
+        self.columns = {}  # lowercase table -> frozenset of lowercase column names
+        self.column_lengths = {}  # (lowercase table, lowercase column) -> max characters
+
+        # Capability flags
+        self.orders_has_tax = False
+        self.menu_has_description = False
+        self.has_admins_table = False
+
+        # SQL fragments for the flags above
+        self.order_insert_sql = ORDER_INSERT_WITHOUT_TAX
+        self.order_tax_sql = ORDER_TAX_DERIVED
+        self.menu_description_sql = MENU_DESCRIPTION_MISSING
+
+    def refresh(self):
+        """Re-read the schema (at startup, and after any migration)"""
+        with self._lock:
+            with self.db_manager.borrow_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT LOWER(TABLE_NAME), LOWER(COLUMN_NAME), CHARACTER_MAXIMUM_LENGTH
+                    FROM information_schema.COLUMNS
+                    WHERE TABLE_SCHEMA = DATABASE()
+                """)
+                rows = cursor.fetchall()
+                cursor.close()
+
+            columns = {}
+            lengths = {}
+            for table, column, max_length in rows:
+                columns.setdefault(table, set()).add(column)
+                if max_length is not None:
+                    lengths[(table, column)] = int(max_length)
+            self.columns = {table: frozenset(names) for table, names in columns.items()}
+            self.column_lengths = lengths
+
+            self.orders_has_tax = self.has_column('Orders', 'Tax')
+            self.menu_has_description = self.has_column('MenuItems', 'Description')
+            self.has_admins_table = self.has_table('Admins')
+
+            self.order_insert_sql = ORDER_INSERT_WITH_TAX if self.orders_has_tax else ORDER_INSERT_WITHOUT_TAX
+            self.order_tax_sql = ORDER_TAX_STORED if self.orders_has_tax else ORDER_TAX_DERIVED
+            self.menu_description_sql = (
+                MENU_DESCRIPTION_STORED if self.menu_has_description else MENU_DESCRIPTION_MISSING
+            )
+            self.loaded = True
+
+        # The menu query depends on the Description flag
+        self.db_manager.menu_catalog.invalidate()
+
+        if not self.orders_has_tax:
+            print("WARNING: Tax column not found in Orders. Orders are saved without tax tracking.")
+            print("Please run: ALTER TABLE Orders ADD COLUMN Tax DECIMAL(10,2) NOT NULL DEFAULT 0.00 AFTER DeliveryFee;")
+
+    def short_columns(self):
+        """(table, column, current length, required length) for every column below MIN_COLUMN_LENGTHS"""
+        short = []
+        for (table, column), length in MIN_COLUMN_LENGTHS.items():
+            current = self.column_length(table, column)
+            if current is not None and current < length:
+                short.append((table, column, current, length))
+        return short
+
+    def check_column_lengths(self):
+        """Print the migration for every column that is too short (run after connecting)"""
+        short = self.short_columns()
+        for table, column, current, length in short:
+            print(f"WARNING: {table}.{column} is VARCHAR({current}), MunchHub needs VARCHAR({length}).")
+            print(f"Please run: ALTER TABLE {table} MODIFY {column} VARCHAR({length}) NOT NULL;")
+            print("Or: python -m Tools.DataSchemaChecker --widen-columns")
+        return not short
+
+    def widen_columns(self):
+        """
+        Widen ID columns that are shorter than MIN_COLUMN_LENGTHS. A one-off
+        migration, run only from the command line (--widen-columns).
+        Returns True if any column was changed.
+        """
+        widened = False
+        for table, column, current, length in self.short_columns():
+            try:
+                with self.db_manager.borrow_connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute(f"ALTER TABLE {table} MODIFY {column} VARCHAR({length}) NOT NULL")
+                    cursor.close()
+                print(f"Widened {table}.{column} from VARCHAR({current}) to VARCHAR({length})")
+                widened = True
+            except Error as e:
+                print(f"WARNING: Could not widen {table}.{column}: {e}")
+                print(f"Please run: ALTER TABLE {table} MODIFY {column} VARCHAR({length}) NOT NULL;")
+        if widened:
+            self.refresh()
+        return widened
+
+    def ensure_loaded(self):
+        """Load the schema on first use if connect() could not"""
+        if not self.loaded:
+            self.refresh()
+        return self
+
+    def has_table(self, table):
+        return table.lower() in self.columns
+
+    def has_column(self, table, column):
+        return column.lower() in self.columns.get(table.lower(), ())
+
+    def column_length(self, table, column):
+        """Maximum length of a text column, or None if unknown"""
+        return self.column_lengths.get((table.lower(), column.lower()))
+
 
 def check_database_schema(db_manager):
     """Check and print database schema for debugging"""
@@ -106,12 +261,16 @@ def check_database_schema(db_manager):
 
 # To use this checker, add this to your main file or run it separately:
 if __name__ == "__main__":
+    import sys
     from Database.DatabaseManager import DatabaseManager
 
     # Create database connection
     db = DatabaseManager()
     if db.connect():
-        check_database_schema(db)
+        if '--widen-columns' in sys.argv:
+            db.schema.widen_columns()
+        else:
+            check_database_schema(db)
         db.disconnect()
     else:
         print("Failed to connect to database")
\ No newline at end of file
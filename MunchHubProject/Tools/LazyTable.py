@@ -0,0 +1,407 @@
+"""
+LazyTable.py - Shared model/view layer for MunchHub tables
+Place this file in: Tools/LazyTable.py
+
+Tables used to build a styled QTableWidgetItem for every cell and a widget
+for every row's buttons, all up front. Here rows stay plain dicts inside a
+QAbstractTableModel, the view only asks for the cells it paints, fonts and
+colors are shared objects, and buttons are painted by a delegate.
+
+Paged tables pull the next page (keyset, off the GUI thread) when the user
+scrolls near the bottom, so opening a table with 100k rows only reads the
+first page.
+
+Usage:
+    columns = [
+        Column("Order ID", 'OrderID', bold=True, color='#003274', align=CENTER),
+        Column("Status", 'OrderStatus', color=lambda row: STATUS_COLORS.get(row['OrderStatus'])),
+    ]
+    self.model = LazyTableModel(columns, key_field='OrderID', parent=self)
+    self.table = LazyTableView(self.model, empty_text="No orders found")
+    self.model.load(self.controller.get_orders_page)
+"""
+
+from PyQt6.QtWidgets import QTableView, QStyledItemDelegate, QStyle, QHeaderView, QAbstractItemView
+from PyQt6.QtGui import QPainter
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QEvent, QRect, pyqtSignal
+from Tools.DataLoader import DataLoader
+from Tools.Theme import cached_color, cached_font
+
+
+CENTER = Qt.AlignmentFlag.AlignCenter
+RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+LEFT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+
+class Column:
+    """
+    How one column renders a row dict.
+
+    Args:
+        title: Header text
+        key: Row field shown when `text` is not given
+        text: Callable(row) -> display string
+        color: Color string, or callable(row) -> color string
+        bold / size: Font weight and point size
+        align: Qt alignment flags
+        tooltip: Callable(row) -> tooltip string
+    """
+
+    def __init__(self, title, key=None, text=None, color=None, bold=False, size=None,
+                 align=None, tooltip=None):
+        self.title = title
+        self.key = key
+        self.text = text
+        self.color = color
+        self.bold = bold
+        self.size = size
+        self.align = align
+        self.tooltip = tooltip
+
+    def display(self, row):
+        if self.text:
+            return self.text(row)
+        value = row.get(self.key) if self.key else None
+        return "" if value is None else str(value)
+
+    def foreground(self, row):
+        color = self.color(row) if callable(self.color) else self.color
+        return cached_color(color) if color else None
+
+    def font(self):
+        if self.bold or self.size:
+            return cached_font(self.size, self.bold)
+        return None
+
+
+class LazyTableModel(QAbstractTableModel):
+    """Table model over a list of row dicts, filled a page at a time"""
+
+    loading_changed = pyqtSignal(bool)
+    load_failed = pyqtSignal(str)
+
+    def __init__(self, columns, key_field=None, page_size=200, parent=None):
+        """
+        Args:
+            columns: List of Column
+            key_field: Row field that identifies a row (for find/upsert)
+            page_size: Rows requested per page
+        """
+        super().__init__(parent)
+        self.columns = columns
+        self.key_field = key_field
+        self.page_size = page_size
+        self.loader = DataLoader(self)
+
+        self._rows = []
+        self._fetch_page = None
+        self._exhausted = True
+        self._loading = False
+
+    # ==================== LOADING ====================
+
+    def load(self, fetch_page):
+        """
+        Start over with a paged source.
+
+        `fetch_page(after_row, limit)` runs on a worker thread and returns the
+        next `limit` rows after `after_row` (None for the first page). A short
+        page means there is nothing more.
+        """
+        self.loader.cancel('page')
+        self.beginResetModel()
+        self._rows = []
+        self._fetch_page = fetch_page
+        self._exhausted = False
+        self._set_loading(False)
+        self.endResetModel()
+        self.fetchMore(QModelIndex())
+
+    def load_all(self, fetch_all):
+        """Replace the contents with everything `fetch_all()` returns (small tables)"""
+        self._fetch_page = None
+        self._set_loading(True)
+        self.loader.load(fetch_all, self.set_rows, self._on_error, key='page')
+
+    def set_rows(self, rows):
+        """Replace the contents with `rows`"""
+        self.loader.cancel('page')
+        self.beginResetModel()
+        self._rows = list(rows or [])
+        self._exhausted = True
+        self.endResetModel()
+        self._set_loading(False)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._fetch_page is not None and not self._exhausted and not self._loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self._set_loading(True)
+        after_row = self._rows[-1] if self._rows else None
+        self.loader.load(self._fetch_page, self._append_page, self._on_error,
+                         after_row, self.page_size, key='page')
+
+    def _append_page(self, rows):
+        rows = rows or []
+        if len(rows) < self.page_size:
+            self._exhausted = True
+        if rows:
+            start = len(self._rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+        self._set_loading(False)
+
+    def _on_error(self, message):
+        self._exhausted = True
+        self._set_loading(False)
+        self.load_failed.emit(message)
+
+    def _set_loading(self, loading):
+        if loading != self._loading:
+            self._loading = loading
+            self.loading_changed.emit(loading)
+
+    @property
+    def is_loading(self):
+        return self._loading
+
+    # ==================== ROW ACCESS ====================
+
+    def row_at(self, row):
+        """Row dict at `row`, or None"""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def rows(self):
+        return self._rows
+
+    def find_row(self, key):
+        """Index of the row whose key_field equals `key`, or -1"""
+        for row, data in enumerate(self._rows):
+            if data.get(self.key_field) == key:
+                return row
+        return -1
+
+    def insert_rows(self, position, rows):
+        """Insert row dicts at `position`"""
+        if not rows:
+            return
+        self.beginInsertRows(QModelIndex(), position, position + len(rows) - 1)
+        self._rows[position:position] = rows
+        self.endInsertRows()
+
+    def remove_rows_where(self, predicate):
+        """Remove every row for which `predicate(row)` is true"""
+        for row in range(len(self._rows) - 1, -1, -1):
+            if predicate(self._rows[row]):
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._rows[row]
+                self.endRemoveRows()
+
+    def update_row(self, row, data):
+        """Replace one row in place"""
+        self._rows[row] = data
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.columns) - 1))
+
+    def upsert_rows(self, keys, fresh_rows):
+        """
+        Bring the rows for `keys` up to date: rows in `fresh_rows` are updated
+        in place (or inserted at the top), keys missing from it are removed.
+        """
+        fresh = {data[self.key_field]: data for data in fresh_rows}
+        for key in keys:
+            row = self.find_row(key)
+            data = fresh.get(key)
+            if data is not None and row >= 0:
+                self.update_row(row, data)
+            elif data is not None:
+                self.insert_rows(0, [data])
+            elif row >= 0:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._rows[row]
+                self.endRemoveRows()
+
+    # ==================== QAbstractTableModel ====================
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.columns[section].title
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = self.columns[index.column()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return column.display(row)
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return column.foreground(row)
+        if role == Qt.ItemDataRole.FontRole:
+            return column.font()
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return column.align
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return column.tooltip(row) if column.tooltip else None
+        if role == Qt.ItemDataRole.UserRole:
+            return row
+        return None
+
+
+class Button:
+    """A button painted by ButtonDelegate"""
+
+    def __init__(self, name, text, color, width=80, height=30):
+        self.name = name
+        self.text = text
+        self.color = color
+        self.width = width
+        self.height = height
+
+
+class ButtonDelegate(QStyledItemDelegate):
+    """
+    Paints buttons in a column and reports clicks, instead of a widget per row.
+
+    `buttons` is a list of Button, or a callable(row) returning one; when it
+    returns nothing the cell paints normally (e.g. a status label).
+    """
+
+    clicked = pyqtSignal(str, object)  # button name, row dict
+
+    SPACING = 5
+
+    def __init__(self, buttons, parent=None):
+        super().__init__(parent)
+        self.buttons = buttons
+        self._hover = None  # (row, button name)
+
+    def _buttons_for(self, index):
+        row = index.data(Qt.ItemDataRole.UserRole)
+        return self.buttons(row) if callable(self.buttons) else self.buttons
+
+    def _layout(self, rect, buttons):
+        """Rects for `buttons`, centered in the cell"""
+        total = sum(b.width for b in buttons) + self.SPACING * (len(buttons) - 1)
+        x = rect.x() + (rect.width() - total) // 2
+        rects = []
+        for button in buttons:
+            y = rect.y() + (rect.height() - button.height) // 2
+            rects.append(QRect(x, y, button.width, button.height))
+            x += button.width + self.SPACING
+        return rects
+
+    def paint(self, painter, option, index):
+        buttons = self._buttons_for(index)
+        if not buttons:
+            super().paint(painter, option, index)
+            return
+
+        # Cell background (selection/alternate colors) without any text
+        self.initStyleOption(option, index)
+        option.text = ""
+        style = option.widget.style() if option.widget else None
+        if style:
+            style.drawControl(QStyle.ControlElement.CE_ItemViewItem, option, painter, option.widget)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(cached_font(9, True))
+        for button, rect in zip(buttons, self._layout(option.rect, buttons)):
+            color = cached_color(button.color)
+            if self._hover == (index.row(), button.name):
+                color = color.darker(115)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(color)
+            painter.drawRoundedRect(rect, 5, 5)
+            painter.setPen(cached_color('white'))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, button.text)
+        painter.restore()
+
+    def _button_at(self, index, pos, rect):
+        buttons = self._buttons_for(index)
+        if not buttons:
+            return None
+        for button, button_rect in zip(buttons, self._layout(rect, buttons)):
+            if button_rect.contains(pos):
+                return button
+        return None
+
+    def set_hover(self, view, index, pos):
+        """Track the button under the mouse (called by LazyTableView)"""
+        button = self._button_at(index, pos, view.visualRect(index)) if index.isValid() else None
+        hover = (index.row(), button.name) if button else None
+        if hover != self._hover:
+            self._hover = hover
+            view.viewport().update()
+        return button is not None
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            button = self._button_at(index, event.position().toPoint(), option.rect)
+            if button:
+                self.clicked.emit(button.name, index.data(Qt.ItemDataRole.UserRole))
+                return True
+        return False
+
+
+class LazyTableView(QTableView):
+    """Read-only table view for a LazyTableModel with an empty-state message"""
+
+    def __init__(self, model, empty_text="No records found", parent=None):
+        super().__init__(parent)
+        self.empty_text = empty_text
+        self.setModel(model)
+        model.loading_changed.connect(lambda _: self.viewport().update())
+
+        self.verticalHeader().setVisible(False)
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setMouseTracking(True)
+
+    def selected_row(self):
+        """Row dict of the current selection, or None"""
+        index = self.currentIndex()
+        if not index.isValid() or not self.selectionModel().isRowSelected(index.row(), QModelIndex()):
+            return None
+        return self.model().row_at(index.row())
+
+    def mouseMoveEvent(self, event):
+        super().mouseMoveEvent(event)
+        pos = event.position().toPoint()
+        index = self.indexAt(pos)
+        on_button = False
+        for column in range(self.model().columnCount()):
+            delegate = self.itemDelegateForColumn(column)
+            if isinstance(delegate, ButtonDelegate):
+                target = index if index.column() == column else QModelIndex()
+                on_button = delegate.set_hover(self, target, pos) or on_button
+        self.viewport().setCursor(
+            Qt.CursorShape.PointingHandCursor if on_button else Qt.CursorShape.ArrowCursor
+        )
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        model = self.model()
+        if model.rowCount() == 0:
+            painter = QPainter(self.viewport())
+            painter.setPen(cached_color('#999'))
+            painter.setFont(cached_font(12))
+            text = "Loading..." if model.is_loading else self.empty_text
+            painter.drawText(self.viewport().rect(), Qt.AlignmentFlag.AlignCenter, text)
+            painter.end()
@@ -0,0 +1,51 @@
+"""
+OrderFeedWatcher.py - Polls the order change feed for live views
+Place this file in: Tools/OrderFeedWatcher.py
+
+Emits `orders_changed` with the OrderIDs written since the last poll, so
+pages can refresh just those rows instead of reloading their whole table.
+Polls run on the DataLoader thread pool and never overlap.
+"""
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from Tools.DataLoader import DataLoader
+
+
+class OrderFeedWatcher(QObject):
+    """Periodically reads OrderChanges and announces changed orders"""
+
+    orders_changed = pyqtSignal(list)
+
+    def __init__(self, db_manager, interval_ms=3000, parent=None):
+        super().__init__(parent)
+        self.feed = db_manager.order_feed
+        self.position = None
+        self.loader = DataLoader(self)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.poll)
+
+    def start(self):
+        """Start from the current end of the feed and begin polling"""
+        if self.position is None:
+            self.loader.load(self.feed.latest_change, self._on_position, key='position')
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+        self.loader.cancel_all()
+
+    def poll(self):
+        """Ask for changes since the last poll (skipped while one is in flight)"""
+        if self.position is None or self.loader.is_loading('poll'):
+            return
+        self.loader.load(self.feed.changes_since, self._on_changes, None, self.position, key='poll')
+
+    def _on_position(self, position):
+        self.position = position
+
+    def _on_changes(self, result):
+        self.position, order_ids = result
+        if order_ids:
+            self.orders_changed.emit(order_ids)
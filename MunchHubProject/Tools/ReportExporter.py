@@ -0,0 +1,334 @@
+"""
+ReportExporter.py - Streaming order / line-item export (CSV, XLSX, Parquet, Arrow)
+Place this file in: Tools/ReportExporter.py
+
+The PDF report only shows a summary (top products, latest orders). Finance
+needs every order and every OrderList row for a period. Those tables can
+hold millions of rows, so the exporter never loads a whole result set.
+
+The SELECT runs on an unbuffered cursor, so MySQL streams the result and the
+client reads it CHUNK_SIZE rows at a time with fetchmany(). Each chunk goes
+straight to the output writer and is then dropped, which keeps memory flat
+whatever the row count.
+
+Output goes to "<file>.part" and is renamed into place only when the export
+finishes, so a cancelled or failed export never leaves a half-written file
+under the real name.
+
+XLSX needs openpyxl and Parquet / Arrow IPC need pyarrow. Both are optional;
+available_formats() lists what this install can write. The module has no Qt
+imports, so scripts can use it as well as the Reports view.
+"""
+
+import csv
+import importlib.util
+import os
+from datetime import datetime, timedelta
+
+
+ORDER_COLUMNS = """
+    SELECT o.OrderID, o.OrderDate, o.OrderStatus, o.CustomerID,
+           CONCAT(COALESCE(u.UFirstName, ''), ' ', COALESCE(u.ULastName, '')) as CustomerName,
+           o.StaffID, p.PaymentMethod, o.Address, o.DeliveryFee, {tax}, o.TotalFee
+    FROM Orders o
+    LEFT JOIN Customers c ON o.CustomerID = c.CustomerID
+    LEFT JOIN Users u ON c.UserID = u.UserID
+    LEFT JOIN Payments p ON o.PaymentID = p.PaymentID
+    {condition}
+    ORDER BY o.OrderDate, o.OrderID
+"""
+
+LINE_COLUMNS = """
+    SELECT ol.OrderListID, ol.OrderID, o.OrderDate, o.OrderStatus, ol.MenuID,
+           m.ItemName, ol.Quantity, m.Price as UnitPrice, ol.SubTotal
+    FROM OrderList ol
+    JOIN Orders o ON ol.OrderID = o.OrderID
+    LEFT JOIN MenuItems m ON ol.MenuID = m.MenuID
+    {condition}
+    ORDER BY o.OrderDate, ol.OrderID, ol.OrderListID
+"""
+
+# dataset -> title, row query, count query, (column, type) pairs
+DATASETS = {
+    'orders': {
+        'title': 'Orders',
+        'query': ORDER_COLUMNS,
+        'count': "SELECT COUNT(*) FROM Orders o {condition}",
+        'columns': [
+            ('OrderID', 'string'), ('OrderDate', 'datetime'), ('OrderStatus', 'string'),
+            ('CustomerID', 'string'), ('CustomerName', 'string'), ('StaffID', 'string'),
+            ('PaymentMethod', 'string'), ('Address', 'string'), ('DeliveryFee', 'money'),
+            ('Tax', 'money'), ('TotalFee', 'money')
+        ]
+    },
+    'order_lines': {
+        'title': 'Order Lines',
+        'query': LINE_COLUMNS,
+        'count': "SELECT COUNT(*) FROM OrderList ol JOIN Orders o ON ol.OrderID = o.OrderID {condition}",
+        'columns': [
+            ('OrderListID', 'string'), ('OrderID', 'string'), ('OrderDate', 'datetime'),
+            ('OrderStatus', 'string'), ('MenuID', 'string'), ('ItemName', 'string'),
+            ('Quantity', 'int'), ('UnitPrice', 'money'), ('SubTotal', 'money')
+        ]
+    }
+}
+
+# Same period names as the Reports view
+PERIODS = ["Today", "This Week", "This Month", "This Year", "All Time"]
+
+
+class ExportError(Exception):
+    """Raised when an export cannot be written (e.g. a missing optional package)"""
+
+
+class ExportCancelled(Exception):
+    """Raised inside the export loop when the caller cancels"""
+
+
+def period_start(period, now=None):
+    """First moment of a report period, or None for "All Time" """
+    now = now or datetime.now()
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    if period == "Today":
+        return today
+    if period == "This Week":
+        return today - timedelta(days=today.weekday())
+    if period == "This Month":
+        return today.replace(day=1)
+    if period == "This Year":
+        return today.replace(month=1, day=1)
+    return None
+
+
+# ==================== WRITERS ====================
+
+class CsvWriter:
+    """Plain CSV; UTF-8 with a BOM so Excel detects the encoding"""
+
+    def __init__(self, path, title, columns):
+        self.file = open(path, 'w', newline='', encoding='utf-8-sig')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow([name for name, _ in columns])
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+
+    def close(self):
+        self.file.close()
+
+
+class XlsxWriter:
+    """openpyxl write-only workbook; rows are streamed to disk, not kept in memory"""
+
+    MAX_SHEET_ROWS = 1048576  # Excel's limit, header row included
+
+    def __init__(self, path, title, columns):
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            raise ExportError("XLSX export needs the openpyxl package (pip install openpyxl)")
+        self.path = path
+        self.title = title
+        self.header = [name for name, _ in columns]
+        self.workbook = Workbook(write_only=True)
+        self.sheets = 0
+        self._new_sheet()
+
+    def _new_sheet(self):
+        self.sheets += 1
+        name = self.title if self.sheets == 1 else f"{self.title} ({self.sheets})"
+        self.sheet = self.workbook.create_sheet(name[:31])
+        self.sheet.append(self.header)
+        self.sheet_rows = 1
+
+    def write(self, rows):
+        for row in rows:
+            # Larger exports continue on another sheet instead of failing
+            if self.sheet_rows >= self.MAX_SHEET_ROWS:
+                self._new_sheet()
+            self.sheet.append(row)
+            self.sheet_rows += 1
+
+    def close(self):
+        self.workbook.save(self.path)
+
+
+class ArrowWriter:
+    """Parquet (one row group per chunk) or Arrow IPC file, with a fixed schema"""
+
+    def __init__(self, path, title, columns, file_format='parquet'):
+        try:
+            import pyarrow as pa
+            if file_format == 'parquet':
+                import pyarrow.parquet as pq
+        except ImportError:
+            raise ExportError(f"{file_format.title()} export needs the pyarrow package (pip install pyarrow)")
+        types = {
+            'string': pa.string(),
+            'datetime': pa.timestamp('s'),
+            'money': pa.decimal128(12, 2),
+            'int': pa.int64()
+        }
+        self.pa = pa
+        # Declared up front: a chunk where a column is all NULL must not change the schema
+        self.schema = pa.schema([(name, types[kind]) for name, kind in columns])
+        if file_format == 'parquet':
+            self.writer = pq.ParquetWriter(path, self.schema)
+        else:
+            self.writer = pa.ipc.new_file(path, self.schema)
+
+    def write(self, rows):
+        values = list(zip(*rows))
+        arrays = [self.pa.array(values[i], type=field.type) for i, field in enumerate(self.schema)]
+        self.writer.write_batch(self.pa.record_batch(arrays, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+# format -> label, file extension, writer factory, optional package it needs
+FORMATS = {
+    'csv': ("CSV", '.csv', CsvWriter, None),
+    'xlsx': ("Excel (XLSX)", '.xlsx', XlsxWriter, 'openpyxl'),
+    'parquet': ("Parquet", '.parquet',
+                lambda path, title, columns: ArrowWriter(path, title, columns, 'parquet'), 'pyarrow'),
+    'arrow': ("Arrow IPC", '.arrow',
+              lambda path, title, columns: ArrowWriter(path, title, columns, 'arrow'), 'pyarrow'),
+}
+
+
+def available_formats():
+    """Formats whose optional package is installed, as (format, label, extension)"""
+    return [(name, label, extension)
+            for name, (label, extension, _, package) in FORMATS.items()
+            if package is None or importlib.util.find_spec(package) is not None]
+
+
+# ==================== EXPORTER ====================
+
+class ReportExporter:
+    """Streams an export dataset from MySQL into a file, chunk by chunk"""
+
+    CHUNK_SIZE = 5000
+    # The server waits on the client while a chunk is written (slow for XLSX)
+    NET_WRITE_TIMEOUT = 600
+
+    def __init__(self, db_manager, chunk_size=None):
+        self.db_manager = db_manager
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
+
+    def export(self, dataset, file_format, file_path, period="All Time",
+               progress=None, cancelled=None, window=None):
+        """
+        Write every row of `dataset` in `period` to `file_path`.
+
+        Args:
+            dataset: Key of DATASETS ('orders' or 'order_lines')
+            file_format: Key of FORMATS ('csv', 'xlsx', 'parquet' or 'arrow')
+            progress: Optional callback(rows_written, total_rows), called after each chunk
+            cancelled: Optional callable; the export stops once it returns True
+            window: Optional (start, end) dates; exports [start, end) instead of `period`
+        Returns:
+            (success, rows_written, message)
+        """
+        spec = DATASETS[dataset]
+        _, _, make_writer, _ = FORMATS[file_format]
+        start, end = window if window else (period_start(period), None)
+        conditions = []
+        params = []
+        if start:
+            conditions.append("o.OrderDate >= %s")
+            params.append(start)
+        if end:
+            conditions.append("o.OrderDate < %s")
+            params.append(end)
+        condition = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        params = tuple(params)
+        query = spec['query'].format(
+            condition=condition,
+            tax=self.db_manager.schema.ensure_loaded().order_tax_sql
+        )
+
+        part_path = file_path + '.part'
+        written = 0
+        writer = None
+        try:
+            with self.db_manager.borrow_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(spec['count'].format(condition=condition), params)
+                total = cursor.fetchone()[0]
+                # The connection goes back to the pool, so the old timeout is put back below
+                cursor.execute("SELECT @@SESSION.net_write_timeout")
+                previous_timeout = int(cursor.fetchone()[0])
+                cursor.execute(f"SET SESSION net_write_timeout = {int(self.NET_WRITE_TIMEOUT)}")
+                cursor.close()
+
+                try:
+                    writer = make_writer(part_path, spec['title'], spec['columns'])
+                    if progress:
+                        progress(0, total)
+
+                    # Unbuffered: rows arrive from the server as they are fetched
+                    cursor = conn.cursor(buffered=False)
+                    cursor.execute(query, params)
+                    try:
+                        while True:
+                            if cancelled and cancelled():
+                                raise ExportCancelled()
+                            rows = cursor.fetchmany(self.chunk_size)
+                            if not rows:
+                                break
+                            writer.write(rows)
+                            written += len(rows)
+                            if progress:
+                                progress(written, max(total, written))
+                        cursor.close()
+                    except BaseException:
+                        # Unread rows would poison the connection; drop it instead of draining
+                        _abandon(conn)
+                        raise
+                finally:
+                    _restore_timeout(conn, previous_timeout)
+
+            writer.close()
+            writer = None
+            os.replace(part_path, file_path)
+            return True, written, f"Exported {written:,} {spec['title'].lower()} to {file_path}"
+
+        except ExportCancelled:
+            return False, written, "Export cancelled"
+        except ExportError as e:
+            return False, written, str(e)
+        except Exception as e:
+            print(f"Error exporting {dataset}: {e}")
+            return False, written, f"Export failed: {e}"
+        finally:
+            if writer is not None:
+                try:
+                    writer.close()
+                except Exception:
+                    pass
+            if os.path.exists(part_path):
+                try:
+                    os.remove(part_path)
+                except OSError:
+                    pass
+
+
+def _restore_timeout(conn, timeout):
+    """Put net_write_timeout back before the connection returns to the pool"""
+    try:
+        if conn.is_connected():
+            cursor = conn.cursor()
+            cursor.execute(f"SET SESSION net_write_timeout = {int(timeout)}")
+            cursor.close()
+    except Exception:
+        _abandon(conn)  # could not reset it; the pool discards a closed connection
+
+
+def _abandon(conn):
+    """Close a connection mid-stream; the pool then discards it on release"""
+    try:
+        conn.close()
+    except Exception:
+        pass
@@ -0,0 +1,100 @@
+"""
+ReportSnapshot.py - One read of every figure the business report uses
+Place this file in: Tools/ReportSnapshot.py
+
+The PDF sections used to ask the controller for the same dashboard stats,
+completed-order count and average order value, and some sections asked
+several times. A snapshot runs every query exactly once, in parallel on
+pooled connections. The section builders then read the frozen result, so
+they can run in any order or at the same time.
+
+Period reports (report_cli.py) pass a [start, end) window. The dashboard
+stats are then filtered to that window. The delivered-order count and the
+average order value come from the daily sales rollup instead of Orders.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from types import MappingProxyType
+
+
+def _freeze(value):
+    """Read-only copy of query results (dicts become mappings, lists become tuples)"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _average_order_value(totals):
+    """Delivered revenue per delivered order from rollup totals"""
+    orders = int(totals['order_count'] or 0)
+    return float(totals['revenue']) / orders if orders else 0.0
+
+
+class ReportSnapshot:
+    """Immutable set of report metrics, captured with one pass over the database"""
+
+    # name -> how to read it from the AdminController
+    FETCHERS = {
+        'stats': lambda controller: controller.get_dashboard_stats(),
+        'completed_orders': lambda controller: controller.get_completed_orders(),
+        'avg_order_value': lambda controller: float(controller.get_avg_order_value() or 0),
+        'monthly_sales': lambda controller: controller.get_monthly_sales(),
+        'menu_items': lambda controller: controller.model.get_all_menu_items(),
+        'categories': lambda controller: controller.model.get_all_categories(),
+        'order_status_counts': lambda controller: controller.model.get_order_status_counts(),
+        'recent_orders': lambda controller: controller.model.get_recent_orders(12),
+    }
+
+    # Replacements used when the snapshot covers a report window: name -> fetch(controller, window)
+    WINDOW_FETCHERS = {
+        'stats': lambda controller, window: controller.get_dashboard_stats(date_range=window),
+        'completed_orders': lambda controller, window: int(
+            controller.db.sales_rollup.get_totals(*window)['order_count']),
+        'avg_order_value': lambda controller, window: _average_order_value(
+            controller.db.sales_rollup.get_totals(*window)),
+    }
+
+    # Leave at least one pooled connection free for the rest of the app
+    MAX_WORKERS = 3
+
+    def __init__(self, captured_at=None, **values):
+        missing = set(self.FETCHERS) - set(values)
+        if missing:
+            raise ValueError(f"Report snapshot is missing: {', '.join(sorted(missing))}")
+        for name, value in values.items():
+            object.__setattr__(self, name, _freeze(value))
+        object.__setattr__(self, 'captured_at', captured_at or datetime.now())
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ReportSnapshot is read-only")
+
+    @classmethod
+    def capture(cls, controller, max_workers=None, window=None):
+        """
+        Run every report query once, concurrently, and freeze the results.
+
+        Args:
+            window: Optional (start, end) dates; scopes the headline figures to that period
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or cls.MAX_WORKERS,
+                                thread_name_prefix="ReportSnapshot") as pool:
+            futures = {}
+            for name, fetch in cls.FETCHERS.items():
+                if window and name in cls.WINDOW_FETCHERS:
+                    futures[name] = pool.submit(cls.WINDOW_FETCHERS[name], controller, tuple(window))
+                else:
+                    futures[name] = pool.submit(fetch, controller)
+            return cls(**{name: future.result() for name, future in futures.items()})
+
+    @property
+    def total_orders(self):
+        return int(self.stats.get('total_orders', 0))
+
+    @property
+    def completion_rate(self):
+        """Delivered orders as a percentage of all orders"""
+        total = self.total_orders
+        return (self.completed_orders / total * 100) if total > 0 else 0
@@ -0,0 +1,135 @@
+"""
+StartupBenchmark.py - Import-time budget check for the MunchHub start-up path
+Place this file in: Tools/StartupBenchmark.py
+
+Imports the entry module (main.py by default) in a fresh interpreter with
+`python -X importtime`, parses the per-module timings Python prints to
+stderr, and fails when:
+  - the total import time (median of several runs) is over the budget, or
+  - a module that should only load on demand (matplotlib, reportlab, Qt
+    Charts, the role windows) is already imported at start-up.
+
+Importing main does not start the app (main() only runs under __main__),
+so this measures exactly what the login screen pays for before it shows.
+
+Usage (from the project folder):
+    python -m Tools.StartupBenchmark
+    python -m Tools.StartupBenchmark --budget-ms 800 --runs 5 --top 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+
+STARTUP_BUDGET_MS = 1200
+
+# Modules that must not be imported before a user logs in / opens the view
+DEFERRED_MODULES = (
+    'matplotlib',
+    'reportlab',
+    'PyQt6.QtCharts',
+    'openpyxl',
+    'pyarrow',
+    'Admin.AdminDashboard',
+    'Admin.ReportsView',
+    'Admin.SalesGraphView',
+    'Staff.StaffDashboard',
+    'Customer.CustomerWindow',
+)
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_importtime(output):
+    """
+    Parse `-X importtime` stderr.
+
+    Returns:
+        List of (module, self_us, cumulative_us, depth) in the order Python printed them
+    """
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+            # Nested imports are indented by two spaces per level under the importer
+            depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+            entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+        except ValueError:
+            continue  # other stderr output that happens to start the same way
+    return entries
+
+
+def measure(module='main', python=None):
+    """
+    Import `module` once in a fresh interpreter.
+
+    Returns:
+        (success, entries, error text)
+    """
+    result = subprocess.run(
+        [python or sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PROJECT_DIR, capture_output=True, text=True
+    )
+    entries = parse_importtime(result.stderr)
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith('import time:')]
+        return False, entries, '\n'.join(errors[-10:])
+    return True, entries, ''
+
+
+def total_ms(entries):
+    """Wall time spent importing: the sum of the top-level imports' cumulative time"""
+    return sum(cumulative for _, _, cumulative, depth in entries if depth == 0) / 1000
+
+
+def deferred_violations(entries, deferred=DEFERRED_MODULES):
+    """Deferred modules (or their submodules) that were imported anyway"""
+    names = {name for name, _, _, _ in entries}
+    return sorted(module for module in deferred
+                  if any(name == module or name.startswith(module + '.') for name in names))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check MunchHub start-up import time against a budget")
+    parser.add_argument('--module', default='main', help="Entry module to import (default: main)")
+    parser.add_argument('--budget-ms', type=float, default=STARTUP_BUDGET_MS)
+    parser.add_argument('--runs', type=int, default=3, help="Runs to take the median of")
+    parser.add_argument('--top', type=int, default=15, help="Slowest modules to list")
+    args = parser.parse_args(argv)
+
+    totals = []
+    entries = []
+    for _ in range(max(args.runs, 1)):
+        success, entries, error = measure(args.module)
+        if not success:
+            print(f"Importing {args.module} failed:\n{error}")
+            return 2
+        totals.append(total_ms(entries))
+    median = statistics.median(totals)
+
+    print(f"Start-up imports for '{args.module}': {median:.0f} ms median of {len(totals)} run(s) "
+          f"(budget {args.budget_ms:.0f} ms)")
+    print(f"\nSlowest {args.top} modules (self time, last run):")
+    for name, self_us, cumulative_us, _ in sorted(entries, key=lambda e: e[1], reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  (cumulative {cumulative_us / 1000:8.1f} ms)  {name}")
+
+    failed = False
+    violations = deferred_violations(entries)
+    if violations:
+        print(f"\n✗ Loaded at start-up but should load on demand: {', '.join(violations)}")
+        failed = True
+    if median > args.budget_ms:
+        print(f"\n✗ Over budget by {median - args.budget_ms:.0f} ms")
+        failed = True
+    if not failed:
+        print("\n✓ Within the start-up budget")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
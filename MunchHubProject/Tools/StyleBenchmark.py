@@ -0,0 +1,107 @@
+"""
+StyleBenchmark.py - Construction time of the repeated customer widgets
+Place this file in: Tools/StyleBenchmark.py
+
+Builds N menu cards (MenuItemWidget) and N cart rows (CartItemWidget) two
+ways and shows them:
+  - shared:       the list container holds MENU_ITEM_STYLE / CART_ITEM_STYLE
+                  once, as CustomerWindow does now
+  - per-instance: every widget gets the same rules with its own
+                  setStyleSheet() call, the way the widgets used to style
+                  themselves
+
+Both ways end with the same look, so the difference is what parsing the
+stylesheet once per widget cost. Runs headless (offscreen Qt platform)
+and needs no database.
+
+Usage (from the project folder):
+    python -m Tools.StyleBenchmark
+    python -m Tools.StyleBenchmark --count 500 --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtWidgets import QApplication, QVBoxLayout, QWidget
+
+from Customer.MenuWidgets import CartItemWidget, MenuItemWidget
+from Tools.Theme import CART_ITEM_STYLE, MENU_ITEM_STYLE, apply_theme
+
+
+def _menu_item(index):
+    return {'MenuID': f'M{index:04d}', 'ItemName': f'Item {index}',
+            'Price': 100 + index % 50, 'isAvailable': index % 7 != 0}
+
+
+def _cart_item(index):
+    price = 100.0 + index % 50
+    return {'menu_id': f'M{index:04d}', 'name': f'Item {index}', 'price': price,
+            'quantity': 2, 'subtotal': price * 2}
+
+
+# widget name -> (widget class, sample data, stylesheet)
+WIDGETS = {
+    'menu': (MenuItemWidget, _menu_item, MENU_ITEM_STYLE),
+    'cart': (CartItemWidget, _cart_item, CART_ITEM_STYLE),
+}
+
+
+def build(app, name, count, shared):
+    """
+    Create, lay out and show `count` widgets of one kind.
+
+    Returns:
+        Elapsed milliseconds
+    """
+    widget_class, sample, style = WIDGETS[name]
+    container = QWidget()
+    layout = QVBoxLayout(container)
+
+    start = time.perf_counter()
+    if shared:
+        container.setStyleSheet(style)
+    for index in range(count):
+        widget = widget_class(sample(index))
+        if not shared:
+            widget.setStyleSheet(style)
+        layout.addWidget(widget)
+    container.show()
+    app.processEvents()
+    elapsed = (time.perf_counter() - start) * 1000
+
+    container.deleteLater()
+    app.processEvents()
+    return elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time building MunchHub's repeated widgets")
+    parser.add_argument('--count', type=int, default=200, help="Widgets per list (default: 200)")
+    parser.add_argument('--runs', type=int, default=3, help="Runs to take the median of")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    app.setStyle('Fusion')
+    apply_theme(app)
+
+    # Warm-up: first use of fonts, the style and the widget classes
+    for name in WIDGETS:
+        build(app, name, 5, True)
+
+    print(f"Building {args.count} widgets per list, median of {args.runs} run(s):")
+    for name in WIDGETS:
+        per_instance = statistics.median(build(app, name, args.count, False) for _ in range(max(args.runs, 1)))
+        shared = statistics.median(build(app, name, args.count, True) for _ in range(max(args.runs, 1)))
+        saved = (1 - shared / per_instance) * 100 if per_instance else 0
+        print(f"  {name:5} per-instance {per_instance:8.1f} ms   shared {shared:8.1f} ms   "
+              f"({saved:.0f}% less)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,257 @@
+"""
+Theme.py - Shared stylesheets, fonts and colors for MunchHub
+Place this file in: Tools/Theme.py
+
+Widgets that are created many times (menu cards, cart rows, delivery cards,
+nav buttons) used to call setStyleSheet() with their own CSS on every
+instance, so Qt parsed and polished the same rules again for each one. And
+every message box replaced the application stylesheet first, which
+re-polished every open widget.
+
+Now each repeated widget only gets an object name (setObjectName('menuItem'))
+and its rules live here. The message box rules are installed on the
+QApplication once at start-up with apply_theme(). The rules for a list of
+widgets are set once on the container that holds the list (for example
+MENU_ITEM_STYLE on the menu container). They cannot go on the QApplication:
+the windows set plain "background-color: ..." sheets, and an ancestor's
+sheet wins over the application sheet whatever the selector.
+
+State changes such as active / added / available are dynamic properties
+switched with set_style_state(), so no CSS is parsed after a list is built.
+
+Fonts and colors for table cells and labels come from cached_font() and
+cached_color(), which hand out one shared QFont / QColor per value.
+"""
+
+from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtWidgets import QApplication
+
+
+# Installed on the QApplication by apply_theme()
+MESSAGE_BOX_STYLE = """
+QMessageBox {
+    background-color: white;
+}
+QMessageBox QLabel {
+    color: black;
+    font-size: 11px;
+}
+QMessageBox QPushButton {
+    color: black;
+    background-color: #e0e0e0;
+    border: 1px solid #ccc;
+    padding: 5px 15px;
+    border-radius: 4px;
+    min-width: 60px;
+}
+QMessageBox QPushButton:hover {
+    background-color: #d0d0d0;
+}
+"""
+
+# Set on the menu container (CustomerWindow)
+MENU_ITEM_STYLE = """
+/* Labels must not pick up the window's background */
+#menuItemName, #menuItemPrice, #menuItemTaxNote, #menuItemStatus {
+    background-color: transparent;
+    border: none;
+}
+#menuItemName {
+    color: #003274;
+}
+#menuItemPrice {
+    color: #ff9800;
+}
+#menuItemTaxNote {
+    color: #999;
+    font-style: italic;
+}
+#menuItemStatus {
+    color: #4CAF50;
+    font-size: 11px;
+}
+#menuItemStatus[available="false"] {
+    color: #F44336;
+}
+#addToCartButton {
+    background-color: #003274;
+    color: white;
+    border: none;
+    border-radius: 8px;
+}
+#addToCartButton:hover {
+    background-color: #004a9e;
+}
+#addToCartButton:pressed {
+    background-color: #002052;
+}
+#addToCartButton:disabled {
+    background-color: #cccccc;
+    color: #666666;
+}
+#addToCartButton[added="true"] {
+    background-color: #4CAF50;
+    color: white;
+}
+"""
+
+# Set on the cart container (CustomerWindow)
+CART_ITEM_STYLE = """
+#cartItemBody {
+    background-color: white;
+    border-radius: 10px;
+}
+/* The cart panel is blue; keep it from showing through the white row */
+#cartItemName, #cartItemQuantity, #cartItemPrice, #cartItemSubtotal, #cartQuantityControls {
+    background-color: transparent;
+    border: none;
+}
+#cartItemName, #cartItemQuantity {
+    color: #003274;
+}
+#cartItemPrice {
+    color: #666;
+}
+#cartItemSubtotal {
+    color: #ffbd59;
+}
+#cartRemoveButton {
+    background-color: #F44336;
+    color: white;
+    border: none;
+    border-radius: 12px;
+    font-size: 14px;
+    font-weight: bold;
+}
+#cartRemoveButton:hover {
+    background-color: #D32F2F;
+}
+#cartMinusButton, #cartPlusButton {
+    border: none;
+    border-radius: 5px;
+    font-size: 16px;
+    font-weight: bold;
+}
+#cartMinusButton {
+    background-color: #e0e0e0;
+    color: #333;
+}
+#cartMinusButton:hover {
+    background-color: #d0d0d0;
+}
+#cartPlusButton {
+    background-color: #003274;
+    color: white;
+}
+#cartPlusButton:hover {
+    background-color: #004a9e;
+}
+"""
+
+# Set on the orders container (DeliveryConfirmationPage)
+DELIVERY_CARD_STYLE = """
+/* The card rule also reaches the QFrames inside it (labels, separator), as it always has */
+#deliveryCard, #deliveryCard QFrame {
+    background-color: white;
+    border: 2px solid #FF9800;
+    border-radius: 12px;
+    padding: 20px;
+}
+QLabel#deliveryCardTitle {
+    color: #003274;
+}
+QLabel#deliveryCardBadge {
+    color: white;
+    background-color: #FF9800;
+    padding: 8px 15px;
+    border-radius: 6px;
+}
+QFrame#deliveryCardSeparator {
+    background-color: #e0e0e0;
+}
+QLabel#deliveryCardDetail {
+    color: #333;
+}
+QLabel#deliveryCardTotal {
+    color: #4CAF50;
+}
+QLabel#deliveryCardUpdate {
+    color: #666;
+}
+#deliveryConfirmButton {
+    background-color: #4CAF50;
+    color: white;
+    border: none;
+    border-radius: 8px;
+}
+#deliveryConfirmButton:hover {
+    background-color: #45a049;
+}
+"""
+
+# Set on the sidebar's nav widget (StaffDashboard)
+STAFF_NAV_STYLE = """
+#staffNavButton {
+    background-color: transparent;
+    color: white;
+    border: 2px solid rgba(255,255,255,0.2);
+    border-radius: 8px;
+    text-align: left;
+    padding-left: 20px;
+}
+#staffNavButton:hover {
+    background-color: rgba(255,255,255,0.1);
+    border: 2px solid rgba(255,255,255,0.4);
+}
+#staffNavButton[active="true"] {
+    background-color: rgba(255, 189, 89, 0.9);
+    color: #003274;
+    border: none;
+}
+#staffNavButton[active="true"]:hover {
+    background-color: rgba(255, 189, 89, 1);
+}
+"""
+
+_colors = {}
+_fonts = {}
+
+
+def apply_theme(app=None):
+    """
+    Install the application stylesheet. Cheap to call again: the sheet is
+    only set (and every widget re-polished) when it is not installed yet.
+    """
+    app = app or QApplication.instance()
+    if app is not None and app.styleSheet() != MESSAGE_BOX_STYLE:
+        app.setStyleSheet(MESSAGE_BOX_STYLE)
+
+
+def set_style_state(widget, name, value):
+    """Set a dynamic property used by the stylesheet and re-polish only this widget"""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+def cached_color(name):
+    """Shared QColor per color string"""
+    color = _colors.get(name)
+    if color is None:
+        color = _colors[name] = QColor(name)
+    return color
+
+
+def cached_font(size=None, bold=False, family='Arial'):
+    """Shared QFont per (family, size, bold)"""
+    key = (family, size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        font = QFont(family, size) if size else QFont(family)
+        if bold:
+            font.setWeight(QFont.Weight.Bold)
+        _fonts[key] = font
+    return font
@@ -7,8 +7,10 @@ from reportlab.platypus import Image as RLImage
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.graphics.shapes import Drawing
 from reportlab.graphics.charts.barcharts import VerticalBarChart
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import os
+from Tools.ReportSnapshot import ReportSnapshot
 
 
 class ReportGenerator:
@@ -70,9 +72,20 @@ class ReportGenerator:
             spaceAfter=0
         )
 
-    def generate_pdf(self, file_path, period, sales_data):
-        """Generate the complete comprehensive PDF report"""
+    def generate_pdf(self, file_path, period, sales_data=None, snapshot=None):
+        """
+        Generate the complete comprehensive PDF report.
+
+        Args:
+            sales_data: Monthly sales for the chart; defaults to the snapshot's
+            snapshot: ReportSnapshot to build from; captured here when not given
+        """
         try:
+            if snapshot is None:
+                snapshot = ReportSnapshot.capture(self.controller)
+            if sales_data is None:
+                sales_data = dict(snapshot.monthly_sales)
+
             doc = SimpleDocTemplate(
                 file_path,
                 pagesize=A4,
@@ -83,66 +96,8 @@ class ReportGenerator:
             )
 
             elements = []
-
-            # Header
-            elements.extend(self.create_header(period))
-            elements.append(Spacer(1, 0.15 * inch))
-
-            # Metadata table
-            elements.extend(self.create_metadata_table(period))
-            elements.append(Spacer(1, 0.15 * inch))
-
-            # Executive Summary table
-            elements.extend(self.create_executive_summary_table())
-            elements.append(Spacer(1, 0.15 * inch))
-
-            # KPIs table
-            elements.extend(self.create_kpi_table())
-            elements.append(Spacer(1, 0.15 * inch))
-
-            # Sales chart
-            if sales_data and len(sales_data) > 0:
-                elements.extend(self.create_sales_chart_section(sales_data))
-                elements.append(Spacer(1, 0.15 * inch))
-
-            # Quarterly sales table
-            elements.extend(self.create_sales_summary_table())
-            elements.append(Spacer(1, 0.15 * inch))
-
-            # Sales analysis table
-            elements.extend(self.create_sales_analysis_table(sales_data))
-
-            # Page break
-            elements.append(PageBreak())
-
-            # Product performance table
-            elements.extend(self.create_product_table())
-            elements.append(Spacer(1, 0.15 * inch))
-
-            # Customer analytics table
-            elements.extend(self.create_customer_table())
-            elements.append(Spacer(1, 0.15 * inch))
-
-            # Order analytics table
-            elements.extend(self.create_order_table())
-
-            # Page break
-            elements.append(PageBreak())
-
-            # Business insights table
-            elements.extend(self.create_insights_table())
-            elements.append(Spacer(1, 0.15 * inch))
-
-            # Operational metrics table
-            elements.extend(self.create_operational_table())
-            elements.append(Spacer(1, 0.15 * inch))
-
-            # Recommendations table
-            elements.extend(self.create_recommendations_table())
-
-            # Footer
-            elements.append(Spacer(1, 0.2 * inch))
-            elements.extend(self.create_footer())
+            for section in self.build_sections(period, sales_data, snapshot):
+                elements.extend(section)
 
             doc.build(elements)
             print(f"PDF generated successfully: {file_path}")
@@ -154,6 +109,49 @@ class ReportGenerator:
             traceback.print_exc()
             return False
 
+    def build_sections(self, period, sales_data, snapshot, max_workers=4):
+        """
+        Build every report section from the snapshot, in parallel.
+
+        Returns:
+            One list of flowables per section, in page order (with the spacers
+            and page breaks that follow each section)
+        """
+        # (builder, args, what follows the section)
+        sections = [
+            (self.create_header, (period,), 'space'),
+            (self.create_metadata_table, (period,), 'space'),
+            (self.create_executive_summary_table, (snapshot,), 'space'),
+            (self.create_kpi_table, (snapshot,), 'space'),
+        ]
+        if sales_data and len(sales_data) > 0:
+            sections.append((self.create_sales_chart_section, (sales_data,), 'space'))
+        sections += [
+            (self.create_sales_summary_table, (snapshot,), 'space'),
+            (self.create_sales_analysis_table, (sales_data,), 'page'),
+            (self.create_product_table, (snapshot,), 'space'),
+            (self.create_customer_table, (snapshot,), 'space'),
+            (self.create_order_table, (snapshot,), 'page'),
+            (self.create_insights_table, (snapshot,), 'space'),
+            (self.create_operational_table, (snapshot,), 'space'),
+            (self.create_recommendations_table, (snapshot,), 'footer'),
+            (self.create_footer, (), None),
+        ]
+
+        # Builders only read the frozen snapshot, so they can run side by side
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ReportSection") as pool:
+            futures = [pool.submit(builder, *args) for builder, args, _ in sections]
+            built = [future.result() for future in futures]
+
+        for elements, (_, _, after) in zip(built, sections):
+            if after == 'space':
+                elements.append(Spacer(1, 0.15 * inch))
+            elif after == 'page':
+                elements.append(PageBreak())
+            elif after == 'footer':
+                elements.append(Spacer(1, 0.2 * inch))
+        return built
+
     def create_header(self, period):
         """Create compact report header"""
         elements = []
@@ -204,7 +202,7 @@ class ReportGenerator:
         elements.append(table)
         return elements
 
-    def create_executive_summary_table(self):
+    def create_executive_summary_table(self, snapshot):
         """Create executive summary as table"""
         elements = []
 
@@ -219,9 +217,9 @@ class ReportGenerator:
         elements.append(header_table)
 
         try:
-            stats = self.controller.get_dashboard_stats()
-            completed_orders = self.controller.get_completed_orders()
-            avg_order = self.controller.get_avg_order_value()
+            stats = snapshot.stats
+            completed_orders = snapshot.completed_orders
+            avg_order = snapshot.avg_order_value
 
             total_revenue = float(stats.get('total_revenue', 0))
             total_orders = int(stats.get('total_orders', 0))
@@ -262,7 +260,7 @@ class ReportGenerator:
 
         return elements
 
-    def create_kpi_table(self):
+    def create_kpi_table(self, snapshot):
         """Create KPI table"""
         elements = []
 
@@ -277,9 +275,9 @@ class ReportGenerator:
         elements.append(header_table)
 
         try:
-            stats = self.controller.get_dashboard_stats()
-            completed_orders = self.controller.get_completed_orders()
-            avg_order = self.controller.get_avg_order_value()
+            stats = snapshot.stats
+            completed_orders = snapshot.completed_orders
+            avg_order = snapshot.avg_order_value
 
             total_revenue = float(stats.get('total_revenue', 0))
             total_orders = int(stats.get('total_orders', 0))
@@ -394,7 +392,7 @@ class ReportGenerator:
         drawing.add(chart)
         return drawing
 
-    def create_sales_summary_table(self):
+    def create_sales_summary_table(self, snapshot):
         """Create quarterly sales summary table"""
         elements = []
 
@@ -408,7 +406,7 @@ class ReportGenerator:
         ]))
         elements.append(header_table)
 
-        monthly_sales = self.controller.get_monthly_sales()
+        monthly_sales = snapshot.monthly_sales
 
         data = [['Quarter', 'Months', 'Total Sales', 'Avg/Month']]
 
@@ -510,7 +508,7 @@ class ReportGenerator:
 
         return elements
 
-    def create_product_table(self):
+    def create_product_table(self, snapshot):
         """Create product performance table"""
         elements = []
 
@@ -525,8 +523,8 @@ class ReportGenerator:
         elements.append(header_table)
 
         try:
-            menu_items = self.controller.model.get_all_menu_items()
-            categories = self.controller.model.get_all_categories()
+            menu_items = snapshot.menu_items
+            categories = snapshot.categories
 
             total_items = len(menu_items)
             available = sum(1 for item in menu_items if item.get('isAvailable', 0) == 1)
@@ -592,7 +590,7 @@ class ReportGenerator:
 
         return elements
 
-    def create_customer_table(self):
+    def create_customer_table(self, snapshot):
         """Create customer analytics table"""
         elements = []
 
@@ -607,11 +605,11 @@ class ReportGenerator:
         elements.append(header_table)
 
         try:
-            stats = self.controller.get_dashboard_stats()
+            stats = snapshot.stats
             total_users = int(stats.get('total_users', 0))
             total_orders = int(stats.get('total_orders', 0))
-            completed_orders = self.controller.get_completed_orders()
-            avg_order = float(self.controller.get_avg_order_value())
+            completed_orders = snapshot.completed_orders
+            avg_order = snapshot.avg_order_value
 
             avg_orders_per_customer = (total_orders / total_users) if total_users > 0 else 0
             customer_ltv = avg_orders_per_customer * avg_order
@@ -650,7 +648,7 @@ class ReportGenerator:
 
         return elements
 
-    def create_order_table(self):
+    def create_order_table(self, snapshot):
         """Create order analytics table"""
         elements = []
 
@@ -665,15 +663,12 @@ class ReportGenerator:
         elements.append(header_table)
 
         try:
-            orders = self.controller.model.get_all_orders()
+            order_statuses = snapshot.order_status_counts
+            orders = snapshot.recent_orders
 
-            if orders:
+            if order_statuses:
                 # Order statistics
-                total_orders = len(orders)
-                order_statuses = {}
-                for order in orders:
-                    status = order['OrderStatus']
-                    order_statuses[status] = order_statuses.get(status, 0) + 1
+                total_orders = sum(order_statuses.values())
 
                 # Status summary table
                 status_data = [['Order Status', 'Count', 'Percentage']]
@@ -740,7 +735,7 @@ class ReportGenerator:
 
         return elements
 
-    def create_insights_table(self):
+    def create_insights_table(self, snapshot):
         """Create business insights table"""
         elements = []
 
@@ -755,9 +750,9 @@ class ReportGenerator:
         elements.append(header_table)
 
         try:
-            stats = self.controller.get_dashboard_stats()
-            completed_orders = self.controller.get_completed_orders()
-            avg_order = self.controller.get_avg_order_value()
+            stats = snapshot.stats
+            completed_orders = snapshot.completed_orders
+            avg_order = snapshot.avg_order_value
 
             total_orders = int(stats.get('total_orders', 0))
             total_revenue = float(stats.get('total_revenue', 0))
@@ -804,7 +799,7 @@ class ReportGenerator:
 
         return elements
 
-    def create_operational_table(self):
+    def create_operational_table(self, snapshot):
         """Create operational metrics table"""
         elements = []
 
@@ -819,8 +814,8 @@ class ReportGenerator:
         elements.append(header_table)
 
         try:
-            stats = self.controller.get_dashboard_stats()
-            completed_orders = self.controller.get_completed_orders()
+            stats = snapshot.stats
+            completed_orders = snapshot.completed_orders
             total_orders = int(stats.get('total_orders', 0))
 
             efficiency_rate = (completed_orders / total_orders * 100) if total_orders > 0 else 0
@@ -858,7 +853,7 @@ class ReportGenerator:
 
         return elements
 
-    def create_recommendations_table(self):
+    def create_recommendations_table(self, snapshot):
         """Create strategic recommendations table"""
         elements = []
 
@@ -873,8 +868,8 @@ class ReportGenerator:
         elements.append(header_table)
 
         try:
-            stats = self.controller.get_dashboard_stats()
-            avg_order = float(self.controller.get_avg_order_value())
+            stats = snapshot.stats
+            avg_order = snapshot.avg_order_value
             total_users = int(stats.get('total_users', 0))
             menu_items = int(stats.get('total_menu_items', 0))
 
@@ -1,6 +1,7 @@
 import sys
-from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QIcon
+from Tools.Theme import apply_theme
 from Database.DatabaseManager import DatabaseManager
 from Main.LoginWindow import LoginWindow
 
@@ -13,35 +14,27 @@ def main():
     app.setApplicationName("MunchHub")
     app.setOrganizationName("MunchHub")
 
-    # Set application style
+    # Set application style; the shared stylesheet is parsed once here
     app.setStyle('Fusion')
+    apply_theme(app)
 
     # Initialize database manager with new database name
     db_manager = DatabaseManager(
         host='localhost',
         database='munchhubdb',  # Updated database name
         user='root',
-        password=''  # Update with your MySQL password if needed
+        password='',  # Update with your MySQL password if needed
+        pool_size=5  # Connections shared by all windows/worker threads
     )
 
-    # Try to connect to database
-    if not db_manager.connect():
-        QMessageBox.critical(
-            None,
-            'Database Connection Error',
-            'Failed to connect to the database.\n\n'
-            'Please ensure:\n'
-            '1. MySQL server is running\n'
-            '2. Database "munchhubdb" exists\n'
-            '3. Connection credentials are correct\n'
-            '4. All required tables are created'
-        )
-        sys.exit(1)
-
     # Create and show login window
     login_window = LoginWindow(db_manager)
     login_window.show()
 
+    # Connect (pool warm-up, schema read, spool replay) on a worker thread once
+    # the event loop runs; the role windows are imported only after login
+    login_window.start_connecting()
+
     # Start the event loop
     exit_code = app.exec()
 
@@ -0,0 +1,171 @@
+"""
+report_cli.py - Headless daily / weekly / monthly report generation
+Place this file in: report_cli.py (next to main.py)
+
+Builds the business report for one period without starting the Qt admin
+app. No PyQt6 import happens anywhere on this path, so the script runs on a
+server with no display and can be scheduled for off-peak hours.
+
+The report's headline figures are scoped to the period. Delivered order
+count, average order value and the CSV summary are read from the daily
+sales rollup (DailySalesRollup), not from Orders and OrderList. Pass
+--rebuild-rollup to rebuild the period's rollup rows first.
+
+Examples:
+    python report_cli.py daily                      # yesterday, PDF
+    python report_cli.py weekly --format pdf csv    # last Monday-Sunday
+    python report_cli.py monthly --date 2026-09-01 --include orders order_lines
+
+Cron (every night at 02:30, reports land in /srv/munchhub/reports):
+    30 2 * * * cd /opt/munchhub && python report_cli.py daily --output-dir /srv/munchhub/reports
+
+The database password is read from the MUNCHHUB_DB_PASSWORD environment
+variable so it does not show up in the process list.
+"""
+
+import argparse
+import csv
+import os
+import sys
+from datetime import date, datetime, timedelta
+
+from Database.DatabaseManager import DatabaseManager
+from Admin.AdminController import AdminController
+from Tools.ReportExporter import DATASETS, ReportExporter
+from Tools.ReportSnapshot import ReportSnapshot
+
+
+KINDS = ('daily', 'weekly', 'monthly')
+
+SUMMARY_COLUMNS = ['SalesDate', 'OrderStatus', 'Revenue', 'GrossTotal', 'OrderCount', 'ItemCount']
+
+
+def report_window(kind, anchor=None):
+    """
+    Half-open [start, end) dates of the report period containing `anchor`.
+    Without an anchor, the last complete period before today.
+    """
+    today = date.today()
+    if kind == 'daily':
+        start = anchor or today - timedelta(days=1)
+        return start, start + timedelta(days=1)
+    if kind == 'weekly':
+        day = anchor or today - timedelta(days=7)
+        start = day - timedelta(days=day.weekday())
+        return start, start + timedelta(days=7)
+    day = anchor or (today.replace(day=1) - timedelta(days=1))
+    start = day.replace(day=1)
+    end = date(start.year + 1, 1, 1) if start.month == 12 else date(start.year, start.month + 1, 1)
+    return start, end
+
+
+def report_label(kind, start, end):
+    """Period text shown on the report, e.g. 'Weekly: 2026-10-05 to 2026-10-11'"""
+    if kind == 'daily':
+        return f"Daily: {start.strftime('%B %d, %Y')}"
+    if kind == 'weekly':
+        return f"Weekly: {start.isoformat()} to {(end - timedelta(days=1)).isoformat()}"
+    return f"Monthly: {start.strftime('%B %Y')}"
+
+
+def report_basename(kind, start):
+    stamp = start.strftime('%Y-%m') if kind == 'monthly' else start.isoformat()
+    return f"MunchHub_{kind}_{stamp}"
+
+
+def write_summary_csv(db_manager, file_path, start, end):
+    """Per-day, per-status sales for the window, straight from the rollup"""
+    rows = db_manager.sales_rollup.get_range(start, end)
+    with open(file_path, 'w', newline='', encoding='utf-8-sig') as output:
+        writer = csv.writer(output)
+        writer.writerow(SUMMARY_COLUMNS)
+        for row in rows:
+            writer.writerow([row[column] for column in SUMMARY_COLUMNS])
+    return len(rows)
+
+
+def write_pdf(controller, file_path, label, window):
+    """Same PDF as the Reports view, with the headline figures scoped to the window"""
+    # ReportLab is only needed for PDFs; CSV-only runs work without it
+    from Tools.Utility import ReportGenerator
+
+    snapshot = ReportSnapshot.capture(controller, window=window)
+    return ReportGenerator(controller).generate_pdf(file_path, label, snapshot=snapshot)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate MunchHub reports without the GUI")
+    parser.add_argument('kind', choices=KINDS, help="Report period")
+    parser.add_argument('--date', type=lambda text: datetime.strptime(text, '%Y-%m-%d').date(),
+                        help="Any day in the period (YYYY-MM-DD); default: the last complete period")
+    parser.add_argument('--format', nargs='+', choices=('pdf', 'csv'), default=['pdf'],
+                        help="Report formats to write (default: pdf)")
+    parser.add_argument('--include', nargs='+', choices=list(DATASETS), default=[],
+                        help="Also write full CSV dumps of these datasets for the period")
+    parser.add_argument('--output-dir', default='reports', help="Where to write the files")
+    parser.add_argument('--rebuild-rollup', action='store_true',
+                        help="Rebuild the period's sales rollup rows before reporting")
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--database', default='munchhubdb')
+    parser.add_argument('--user', default='root')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Entry point; returns the process exit code (0 ok, 1 no database, 2 a report failed)"""
+    args = parse_args(argv)
+    start, end = report_window(args.kind, args.date)
+    label = report_label(args.kind, start, end)
+    basename = os.path.join(args.output_dir, report_basename(args.kind, start))
+
+    db_manager = DatabaseManager(
+        host=args.host,
+        database=args.database,
+        user=args.user,
+        password=os.environ.get('MUNCHHUB_DB_PASSWORD', ''),
+        pool_size=4  # snapshot workers plus one spare
+    )
+    if not db_manager.connect():
+        print("Failed to connect to database")
+        return 1
+
+    failed = []
+    try:
+        os.makedirs(args.output_dir, exist_ok=True)
+        controller = AdminController(db_manager)
+        print(f"Generating {label} ({start} to {end}, end exclusive)")
+
+        if args.rebuild_rollup:
+            db_manager.sales_rollup.ensure_ready(backfill_if_empty=False)
+            db_manager.sales_rollup.backfill(start, end)
+
+        if 'pdf' in args.format:
+            if not write_pdf(controller, basename + '.pdf', label, (start, end)):
+                failed.append('pdf')
+
+        if 'csv' in args.format:
+            try:
+                rows = write_summary_csv(db_manager, basename + '.csv', start, end)
+                print(f"Sales summary written: {basename}.csv ({rows} rows)")
+            except Exception as e:
+                print(f"Error writing sales summary: {e}")
+                failed.append('csv')
+
+        exporter = ReportExporter(db_manager)
+        for dataset in args.include:
+            success, _, message = exporter.export(dataset, 'csv', f"{basename}_{dataset}.csv",
+                                                  window=(start, end))
+            print(message)
+            if not success:
+                failed.append(dataset)
+    finally:
+        db_manager.disconnect()
+
+    if failed:
+        print(f"Report generation failed for: {', '.join(failed)}")
+        return 2
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
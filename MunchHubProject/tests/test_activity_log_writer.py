@@ -0,0 +1,77 @@
+"""
+test_activity_log_writer.py - Replaying activity spools left by other runs
+Place this file in: tests/test_activity_log_writer.py
+
+Run from the project folder:
+    python -m pytest tests
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from Database.ActivityLogWriter import ActivityLogWriter, _acquire_lock
+
+
+def event(log_id):
+    return {'LogID': log_id, 'StaffID': 'S001', 'OrderID': 'O001', 'CustomerID': 'C001',
+            'Action': 'Accepted Order', 'Status': 'Preparing', 'ActivityDate': '2026-10-01 12:00:00'}
+
+
+class FakeDb:
+    """Records every LogID written"""
+
+    def __init__(self):
+        self.written = []
+
+    @contextmanager
+    def borrow_connection(self):
+        cursor = SimpleNamespace(
+            executemany=lambda sql, rows: self.written.extend(row[0] for row in rows),
+            close=lambda: None)
+        yield SimpleNamespace(cursor=lambda: cursor, commit=lambda: None)
+
+
+class ReplaySpoolsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.db = FakeDb()
+        self.writer = ActivityLogWriter(self.db, spool_dir=self.dir)
+
+    def spool(self, name, *log_ids):
+        path = os.path.join(self.dir, name)
+        with open(path, 'w', encoding='utf-8') as spool:
+            spool.writelines(json.dumps(event(log_id)) + '\n' for log_id in log_ids)
+        return path
+
+    def test_dead_instance_spool_and_unfinished_replay_are_replayed(self):
+        self.spool('activity-999991.jsonl', 'L001')
+        # An instance that died while replaying someone else's spool
+        self.spool('activity-999992.jsonl.replay-999993', 'L002')
+
+        self.writer._replay_spools()
+
+        self.assertEqual(sorted(self.db.written), ['L001', 'L002'])
+        self.assertEqual(os.listdir(self.dir), [])
+
+    def test_rejected_file_and_live_instance_are_left_alone(self):
+        rejected = self.spool('activity-rejected.jsonl', 'L003')
+        live = self.spool('activity-999994.jsonl', 'L004')
+        lock = _acquire_lock(os.path.join(self.dir, 'activity-999994.lock'))
+        self.addCleanup(lock.close)
+
+        self.writer._replay_spools()
+
+        self.assertEqual(self.db.written, [])
+        self.assertTrue(os.path.exists(rejected))
+        self.assertTrue(os.path.exists(live))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+test_auth_service.py - Login through AuthService against a fake database
+Place this file in: tests/test_auth_service.py
+
+Run from the project folder:
+    python -m pytest tests
+"""
+
+import re
+import unittest
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from Database.AuthService import AuthService
+from Database.PasswordHasher import PasswordHasher
+
+
+def _result_columns(query):
+    """Column names MySQL gives a result: the first SELECT's names, aliases included"""
+    select_list = re.search(r'SELECT(.*?)\bFROM\b', query, re.S | re.I).group(1)
+    names = []
+    for column in select_list.split(','):
+        column = column.strip()
+        alias = re.search(r'\bas\s+(\w+)$', column, re.I)
+        names.append(alias.group(1) if alias else column.split('.')[-1])
+    return names
+
+
+class FakeCursor:
+    def __init__(self, database):
+        self.database = database
+        self.rows = []
+
+    def execute(self, query, params=()):
+        self.database.queries.append(query)
+        columns = _result_columns(query)
+        rows = self.database.user_rows[:]
+        if 'FROM Admins' in query:
+            rows = self.database.admin_rows + rows
+        self.rows = [dict(zip(columns, row)) for row in rows]
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+class FakeDatabase:
+    """Just enough of DatabaseManager for AuthService"""
+
+    def __init__(self, admin_rows=(), user_rows=()):
+        self.passwords = PasswordHasher(log_n=4)  # fast for tests
+        self.schema = SimpleNamespace(ensure_loaded=lambda: SimpleNamespace(has_admins_table=True))
+        self.admin_rows = list(admin_rows)
+        self.user_rows = list(user_rows)
+        self.queries = []
+
+    @contextmanager
+    def borrow_connection(self):
+        yield SimpleNamespace(cursor=lambda dictionary=False: FakeCursor(self), commit=lambda: None)
+
+    def hash_password(self, password, table):
+        return self.passwords.hash(password)
+
+
+class AuthServiceTest(unittest.TestCase):
+
+    def setUp(self):
+        hasher = PasswordHasher(log_n=4)
+        # Row tuples in SELECT order: UserID, Username, Password, First/Middle/Last name,
+        # PhoneNum, StaffID, CustomerID, Address, AdminID
+        self.admin = (None, 'boss', hasher.hash('admin-pass'), 'Ada', None, 'Admin', '0917',
+                      None, None, None, 'A001')
+        self.staff = ('U001', 'boss', hasher.hash('staff-pass'), 'Sam', None, 'Staff', '0918',
+                      'S001', None, None, None)
+        self.customer = ('U002', 'carla', hasher.hash('customer-pass'), 'Carla', None, 'Cruz', '0919',
+                         None, 'C001', '12 Main St', None)
+        self.database = FakeDatabase(admin_rows=[self.admin], user_rows=[self.staff, self.customer])
+        self.auth = AuthService(self.database)
+
+    def test_admin_login(self):
+        success, account, _ = self.auth.authenticate('boss', 'admin-pass')
+        self.assertTrue(success)
+        self.assertEqual(account['role'], 'admin')
+        self.assertEqual(account['admin_id'], 'A001')
+
+    def test_staff_and_customer_login_when_admins_table_exists(self):
+        success, account, _ = self.auth.authenticate('boss', 'staff-pass')
+        self.assertTrue(success)
+        self.assertEqual((account['role'], account['staff_id']), ('staff', 'S001'))
+
+        success, account, _ = self.auth.authenticate('carla', 'customer-pass')
+        self.assertTrue(success)
+        self.assertEqual((account['role'], account['customer_id']), ('customer', 'C001'))
+        self.assertEqual(account['address'], '12 Main St')
+
+    def test_wrong_password_is_not_cached(self):
+        self.assertFalse(self.auth.authenticate('boss', 'wrong')[0])
+        self.assertTrue(self.auth.authenticate('boss', 'admin-pass')[0])
+
+    def test_unknown_username_is_answered_from_memory(self):
+        self.database.admin_rows = []
+        self.database.user_rows = []
+        for password in ('one', 'two', 'three'):
+            self.assertFalse(self.auth.authenticate('ghost', password)[0])
+        self.assertEqual(len(self.database.queries), 1)
+
+        # Registering the username makes it reach the database again
+        self.auth.forget('Ghost')
+        self.auth.authenticate('ghost', 'four')
+        self.assertEqual(len(self.database.queries), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+test_data_loader.py - Replacing and cancelling DataLoader requests
+Place this file in: tests/test_data_loader.py
+
+Run from the project folder:
+    python -m pytest tests
+"""
+
+import os
+import unittest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtCore import QCoreApplication
+
+from Tools.DataLoader import DataLoader, _live_tasks, get_thread_pool
+
+
+class DataLoaderTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.loader = DataLoader()
+        self.results = []
+
+    def finish(self):
+        """Let the workers finish, then deliver their queued signals"""
+        get_thread_pool().waitForDone()
+        self.app.processEvents()
+
+    def test_load_twice_after_first_task_ran(self):
+        self.loader.load(lambda: 'first', self.results.append, key='orders')
+        # First task has run; its result is still queued for the GUI thread
+        get_thread_pool().waitForDone()
+
+        self.loader.load(lambda: 'second', self.results.append, key='orders')
+        self.finish()
+
+        self.assertEqual(self.results, ['second'])
+        self.assertFalse(self.loader.is_loading('orders'))
+        self.assertEqual(_live_tasks, {})
+
+    def test_cancel_drops_result(self):
+        self.loader.load(lambda: 'data', self.results.append, key='menu')
+        self.loader.cancel('menu')
+        self.finish()
+
+        self.assertEqual(self.results, [])
+        self.assertEqual(_live_tasks, {})
+
+    def test_error_goes_to_on_error(self):
+        errors = []
+
+        def fail():
+            raise ValueError("no connection")
+
+        self.loader.load(fail, self.results.append, errors.append, key='stats')
+        self.finish()
+
+        self.assertEqual(errors, ["no connection"])
+        self.assertEqual(self.results, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
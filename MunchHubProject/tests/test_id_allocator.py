@@ -0,0 +1,83 @@
+"""
+test_id_allocator.py - IdSequences allocation
+Place this file in: tests/test_id_allocator.py
+
+Run from the project folder:
+    python -m pytest tests
+"""
+
+import unittest
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from Database.IdAllocator import IdAllocator
+
+
+class FakeCursor:
+    """Plays the IdSequences counter: LAST_INSERT_ID(NextValue + n) comes back as lastrowid"""
+
+    def __init__(self, counters):
+        self.counters = counters
+        self.statements = []
+        self.lastrowid = None
+
+    def execute(self, query, params=()):
+        sql = ' '.join(query.split())
+        self.statements.append(sql)
+        if sql.startswith('UPDATE IdSequences'):
+            count, name = params
+            self.counters[name] += count
+            self.lastrowid = self.counters[name]
+
+    def close(self):
+        pass
+
+
+class FakeDb:
+    """Counts pooled connections borrowed and commits made on them"""
+
+    def __init__(self):
+        self.counters = {'order': 7, 'track': 20, 'log': 1}
+        self.borrowed = 0
+        self.commits = 0
+
+    @contextmanager
+    def borrow_connection(self):
+        self.borrowed += 1
+        yield SimpleNamespace(cursor=lambda: FakeCursor(self.counters), commit=self.commit)
+
+    def commit(self):
+        self.commits += 1
+
+
+class IdAllocatorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.db = FakeDb()
+        self.ids = IdAllocator(self.db)
+        self.ids._table_ready = True
+        self.ids._synced.update(['order', 'track', 'log'])
+
+    def test_gapless_ids_use_the_callers_transaction(self):
+        cursor = FakeCursor(self.db.counters)
+        self.assertEqual(self.ids.next_id('order', cursor), 'O007')
+        self.assertEqual(self.ids.next_id('track', cursor), 'T020')
+        self.assertEqual(self.ids.next_id('order', cursor), 'O008')
+
+        # One UPDATE per ID on the caller's cursor; no extra connection, SELECT or commit
+        self.assertEqual(len(cursor.statements), 3)
+        self.assertTrue(all(sql.startswith('UPDATE') for sql in cursor.statements))
+        self.assertEqual((self.db.borrowed, self.db.commits), (0, 0))
+
+    def test_log_ids_come_from_a_cached_block(self):
+        ids = [self.ids.next_id('log') for _ in range(10)]
+        self.assertEqual(ids[0], 'L001')
+        self.assertEqual(ids[-1], 'L010')
+        self.assertEqual((self.db.borrowed, self.db.commits), (1, 1))
+
+        self.assertEqual(self.ids.next_id('log', FakeCursor(self.db.counters)), 'L011')
+        self.assertEqual(self.db.borrowed, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
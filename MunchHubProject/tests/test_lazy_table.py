@@ -0,0 +1,66 @@
+"""
+test_lazy_table.py - Paged LazyTableModel loads
+Place this file in: tests/test_lazy_table.py
+
+Run from the project folder:
+    python -m pytest tests
+"""
+
+import os
+import unittest
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtCore import QCoreApplication
+
+from Database.ActivityLog import ActivityLog
+from Tools.DataLoader import get_thread_pool
+from Tools.LazyTable import Column, LazyTableModel
+
+
+class LazyTableModelTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.model = LazyTableModel([Column("Log", 'LogID')], key_field='LogID', page_size=2)
+        self.errors = []
+        self.model.load_failed.connect(self.errors.append)
+
+    def finish(self):
+        get_thread_pool().waitForDone()
+        self.app.processEvents()
+
+    def test_database_error_is_reported_not_shown_as_empty(self):
+        @contextmanager
+        def borrow_connection():
+            raise ConnectionError("MySQL server has gone away")
+            yield
+
+        db = SimpleNamespace(borrow_connection=borrow_connection,
+                             activity_writer=SimpleNamespace(flush=lambda: True),
+                             search_indexes=SimpleNamespace(ensure_ready=lambda: None))
+        self.model.load(ActivityLog(db).page)
+        self.finish()
+
+        self.assertEqual(self.errors, ["MySQL server has gone away"])
+        self.assertEqual(self.model.rowCount(), 0)
+
+    def test_short_page_ends_the_table(self):
+        pages = iter([[{'LogID': 'L002'}, {'LogID': 'L001'}], [{'LogID': 'L000'}]])
+        self.model.load(lambda after_row, limit: next(pages))
+        self.finish()
+        self.model.fetchMore()
+        self.finish()
+
+        self.assertEqual(self.model.rowCount(), 3)
+        self.assertFalse(self.model.canFetchMore())
+        self.assertEqual(self.errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
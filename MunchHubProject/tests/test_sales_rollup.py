@@ -0,0 +1,96 @@
+"""
+test_sales_rollup.py - Incremental DailySalesRollup updates
+Place this file in: tests/test_sales_rollup.py
+
+Run from the project folder:
+    python -m pytest tests
+"""
+
+import unittest
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+from Database.SalesRollup import SalesRollup
+
+
+class FakeCursor:
+    """Answers the order totals query and records every statement"""
+
+    def __init__(self, order_row):
+        self.order_row = order_row
+        self.statements = []
+        self.row = None
+
+    def execute(self, query, params=()):
+        self.statements.append((' '.join(query.split()), params))
+        self.row = self.order_row if 'FROM Orders o' in query else None
+
+    def fetchone(self):
+        return self.row
+
+    def close(self):
+        pass
+
+
+class SalesRollupTest(unittest.TestCase):
+
+    def setUp(self):
+        self.rollup = SalesRollup(db_manager=None)
+        self.rollup._ready = True
+        self.day = date(2026, 10, 1)
+
+    def order(self, status):
+        return {'SalesDate': self.day, 'OrderStatus': status, 'Revenue': Decimal('240.00'),
+                'GrossTotal': Decimal('318.80'), 'ItemCount': Decimal('3')}
+
+    def writes(self, cursor):
+        return [(sql.split()[0], params) for sql, params in cursor.statements[1:]]
+
+    def test_new_order_is_added(self):
+        cursor = FakeCursor(self.order('Pending'))
+        self.rollup.refresh_for_order(cursor, 'O7')
+
+        writes = self.writes(cursor)
+        self.assertEqual(len(writes), 1)
+        self.assertEqual(writes[0][0], 'INSERT')
+        self.assertEqual(writes[0][1][:2], (self.day, 'Pending'))
+        self.assertNotIn('DELETE', ' '.join(sql for sql, _ in cursor.statements))
+
+    def test_status_change_moves_the_order(self):
+        cursor = FakeCursor(self.order('Delivered'))
+        self.rollup.refresh_for_order(cursor, 'O7', old_status='Out for delivery')
+
+        writes = self.writes(cursor)
+        # Rollup rows are always touched in status-name order
+        self.assertEqual([kind for kind, _ in writes], ['INSERT', 'UPDATE'])
+        self.assertEqual(writes[0][1][:2], (self.day, 'Delivered'))
+        self.assertEqual(writes[1][1][-2:], (self.day, 'Out for delivery'))
+        self.assertEqual(writes[1][1][:2], (Decimal('240.00'), Decimal('318.80')))
+
+    def test_write_path_never_backfills(self):
+        # Empty, not yet prepared rollup table: only the caller's cursor may touch orders
+        table_cursor = FakeCursor(None)
+        table_cursor.fetchone = lambda: (0,)
+
+        @contextmanager
+        def borrow_connection():
+            yield SimpleNamespace(cursor=lambda: table_cursor)
+
+        rollup = SalesRollup(SimpleNamespace(borrow_connection=borrow_connection))
+        rollup.backfill = lambda *args: self.fail("backfill ran inside an order transaction")
+        cursor = FakeCursor(self.order('Pending'))
+        rollup.refresh_for_order(cursor, 'O7')
+
+        self.assertEqual(self.writes(cursor)[0][0], 'INSERT')
+        self.assertNotIn('Orders', ' '.join(sql for sql, _ in table_cursor.statements))
+
+    def test_unchanged_status_writes_nothing(self):
+        cursor = FakeCursor(self.order('Preparing'))
+        self.rollup.refresh_for_order(cursor, 'O7', old_status='Preparing')
+        self.assertEqual(self.writes(cursor), [])
+
+
+if __name__ == '__main__':
+    unittest.main()